@@ -6,26 +6,90 @@ import voluptuous as vol
 from datetime import time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 import homeassistant.helpers.config_validation as cv
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    ATTR_JOB_ID,
     ATTR_LEVEL,
     ATTR_MESSAGE,
+    CONF_BASE_LOAD_KW,
+    CONF_CO2_ENTITY,
+    CONF_CO2_WEIGHT,
+    CONF_DEFAULT_DURATION_MINUTES,
+    CONF_DELAYED_START,
+    CONF_DELAYED_START_ENTITY,
+    CONF_DELAYED_START_SERVICE,
+    CONF_FIXED_FEE,
+    CONF_PLANNING_MODE,
+    CONF_POWER_SWITCH,
+    CONF_PRICE_FORECAST,
+    CONF_PROGRAM_POWER_KW,
+    CONF_PV_FORECAST_ENTITY,
+    CONF_READY_SUBSTRING,
+    CONF_REPLAN_MIN_SAVINGS,
+    CONF_REPLAN_MIN_SAVINGS_PERCENT,
+    CONF_TARIFFS,
+    CONF_WINDOW_END,
+    CONF_WINDOW_START,
+    DATA_DISPATCHER,
+    DATA_PRICE_HISTORY,
     DOMAIN,
     INTEGRATION_VERSION,
     LOG_LEVELS,
+    MODE_CHEAPEST_24H,
+    MODE_START_NOW,
     PLATFORMS,
+    SERVICE_ADD_JOB,
+    SERVICE_CLEAR_JOBS,
+    SERVICE_GET_DECISIONS,
+    SERVICE_PREVIEW_PLAN,
+    SERVICE_SET_OPTIONS,
+    SERVICE_SET_TARIFFS,
     SERVICE_SET_WINDOW,
+    SERVICE_SET_WINDOW_SCHEDULE,
     SERVICE_LOG_MESSAGE,
     SERVICE_SCHEDULE_FROM_PRICES,
 )
 from .coordinator import DishwasherSchedulerCoordinator
+from .tariffs import TariffSchedule
+from .http_api import async_register_http_views
+from .websocket_api import async_register_websocket_commands
+from .windows import WEEKDAYS, parse_hhmm, parse_interval
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _coordinators(hass: HomeAssistant) -> list[DishwasherSchedulerCoordinator]:
+    return [
+        value
+        for value in hass.data.get(DOMAIN, {}).values()
+        if isinstance(value, DishwasherSchedulerCoordinator)
+    ]
+
+
+def _first_coordinator(hass: HomeAssistant) -> DishwasherSchedulerCoordinator | None:
+    coordinators = _coordinators(hass)
+    return coordinators[0] if coordinators else None
+
+
+def _coerce_time(value: time | str, label: str) -> time:
+    if isinstance(value, time):
+        return value
+
+    parsed = dt_util.parse_time(str(value))
+    if parsed:
+        return parsed
+
+    raise vol.Invalid(f"Invalid time specified for {label}: {value!r}")
+
+
 def _log_with_level(level: str, message: str) -> None:
     log_method = getattr(_LOGGER, level, _LOGGER.info)
     log_method(message)
@@ -53,14 +117,11 @@ async def _async_register_services(hass: HomeAssistant) -> None:
     )
 
     async def _handle_schedule_service(call: ServiceCall) -> None:
-        if not hass.data.get(DOMAIN):
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
             _LOGGER.warning("No Dishwasher Scheduler entries available for scheduling")
             return
 
-        coordinator: DishwasherSchedulerCoordinator = hass.data[DOMAIN][
-            next(iter(hass.data[DOMAIN]))
-        ]
-
         price_entity = call.data["price_entity"]
         duration_half_hours = call.data.get("duration_half_hours", 2)
         program_durations = call.data.get("program_durations")
@@ -71,6 +132,9 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             duration_half_hours,
             program_durations,
             arm,
+            call.data.get(CONF_CO2_ENTITY),
+            call.data.get(CONF_CO2_WEIGHT),
+            call.data.get(CONF_PV_FORECAST_ENTITY),
         )
 
     hass.services.async_register(
@@ -83,29 +147,19 @@ async def _async_register_services(hass: HomeAssistant) -> None:
                 vol.Optional("duration_half_hours", default=2): vol.Coerce(int),
                 vol.Optional("program_durations"): {str: vol.Coerce(int)},
                 vol.Optional("arm", default=True): bool,
+                vol.Optional(CONF_CO2_ENTITY): str,
+                vol.Optional(CONF_CO2_WEIGHT): vol.Coerce(float),
+                vol.Optional(CONF_PV_FORECAST_ENTITY): str,
             }
         ),
     )
 
     async def _handle_window_service(call: ServiceCall) -> None:
-        if not hass.data.get(DOMAIN):
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
             _LOGGER.warning("No Dishwasher Scheduler entries available for window update")
             return
 
-        coordinator: DishwasherSchedulerCoordinator = hass.data[DOMAIN][
-            next(iter(hass.data[DOMAIN]))
-        ]
-
-        def _coerce_time(value: time | str, label: str) -> time:
-            if isinstance(value, time):
-                return value
-
-            parsed = dt_util.parse_time(str(value))
-            if parsed:
-                return parsed
-
-            raise vol.Invalid(f"Invalid time specified for {label}: {value!r}")
-
         try:
             start_time: time = _coerce_time(call.data["window_start"], "window_start")
             end_time: time = _coerce_time(call.data["window_end"], "window_end")
@@ -113,20 +167,30 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             _LOGGER.error("Window update failed: %s", err)
             return
 
-        options = {**coordinator.entry.options}
-        options["window_start"] = start_time.strftime("%H:%M")
-        options["window_end"] = end_time.strftime("%H:%M")
-
-        await hass.config_entries.async_update_entry(
-            coordinator.entry, options=options
-        )
+        weekdays = call.data.get("weekdays")
+        if weekdays:
+            interval = (parse_hhmm(start_time), parse_hhmm(end_time))
+            await coordinator.async_update_window_schedule(
+                {day: (interval,) for day in weekdays}
+            )
+            await coordinator.async_flush_options()
+            _LOGGER.info(
+                "Updated Dishwasher Scheduler window for %s to %s-%s via service",
+                ", ".join(weekdays),
+                start_time.strftime("%H:%M"),
+                end_time.strftime("%H:%M"),
+            )
+            return
 
-        coordinator._recompute_planned_start()
-        coordinator._notify_listeners()
+        options = {
+            CONF_WINDOW_START: start_time.strftime("%H:%M"),
+            CONF_WINDOW_END: end_time.strftime("%H:%M"),
+        }
+        await coordinator.async_set_options(options)
         _LOGGER.info(
             "Updated Dishwasher Scheduler window to %s-%s via service",
-            options["window_start"],
-            options["window_end"],
+            options[CONF_WINDOW_START],
+            options[CONF_WINDOW_END],
         )
 
     hass.services.async_register(
@@ -137,8 +201,252 @@ async def _async_register_services(hass: HomeAssistant) -> None:
             {
                 vol.Required("window_start"): vol.Any(cv.time, cv.string),
                 vol.Required("window_end"): vol.Any(cv.time, cv.string),
+                vol.Optional("weekdays"): vol.All(
+                    cv.ensure_list, [vol.In(WEEKDAYS)]
+                ),
+            }
+        ),
+    )
+
+    async def _handle_window_schedule_service(call: ServiceCall) -> None:
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
+            _LOGGER.warning("No Dishwasher Scheduler entries available for window update")
+            return
+
+        try:
+            updates = {
+                day: None
+                if intervals is None
+                else [parse_interval(item) for item in intervals]
+                for day, intervals in call.data.get("schedule", {}).items()
             }
+        except ValueError as err:
+            _LOGGER.error("Window schedule update failed: %s", err)
+            return
+
+        await coordinator.async_update_window_schedule(
+            updates, reset=call.data.get("reset", False)
+        )
+        await coordinator.async_flush_options()
+        _LOGGER.info(
+            "Updated Dishwasher Scheduler window schedule for %s via service",
+            ", ".join(updates) or "no weekdays",
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_WINDOW_SCHEDULE,
+        _handle_window_schedule_service,
+        schema=vol.Schema(
+            {
+                vol.Optional("schedule", default={}): {
+                    vol.In(WEEKDAYS): vol.Any(None, vol.All(cv.ensure_list, [str]))
+                },
+                vol.Optional("reset", default=False): bool,
+            }
+        ),
+    )
+
+    async def _handle_tariffs_service(call: ServiceCall) -> None:
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
+            _LOGGER.warning("No Dishwasher Scheduler entries available for tariff update")
+            return
+
+        # Only the given keys change; the other keeps its current value.
+        updates = {
+            key: call.data[key]
+            for key in (CONF_TARIFFS, CONF_FIXED_FEE)
+            if key in call.data
+        }
+        if not updates:
+            return
+        try:
+            TariffSchedule.from_options(
+                updates.get(CONF_TARIFFS), updates.get(CONF_FIXED_FEE, 0.0)
+            )
+        except (TypeError, ValueError) as err:
+            _LOGGER.error("Tariff update failed: %s", err)
+            return
+
+        await coordinator.async_set_options(updates)
+        _LOGGER.info("Updated Dishwasher Scheduler tariff options %s", sorted(updates))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_TARIFFS,
+        _handle_tariffs_service,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_TARIFFS): vol.All(cv.ensure_list, [dict]),
+                vol.Optional(CONF_FIXED_FEE): vol.Coerce(float),
+            }
+        ),
+    )
+
+    async def _handle_options_service(call: ServiceCall) -> None:
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
+            _LOGGER.warning("No Dishwasher Scheduler entries available for option update")
+            return
+
+        options = dict(call.data)
+        try:
+            for key in (CONF_WINDOW_START, CONF_WINDOW_END):
+                if key in options:
+                    options[key] = _coerce_time(options[key], key).strftime("%H:%M")
+        except vol.Invalid as err:
+            _LOGGER.error("Option update failed: %s", err)
+            return
+        if not options:
+            return
+
+        await coordinator.async_set_options(options)
+        _LOGGER.info(
+            "Updated Dishwasher Scheduler options %s via service", ", ".join(options)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_OPTIONS,
+        _handle_options_service,
+        schema=vol.Schema(
+            {
+                vol.Optional(CONF_WINDOW_START): vol.Any(cv.time, cv.string),
+                vol.Optional(CONF_WINDOW_END): vol.Any(cv.time, cv.string),
+                vol.Optional(CONF_PLANNING_MODE): vol.In(
+                    [MODE_CHEAPEST_24H, MODE_START_NOW]
+                ),
+                vol.Optional(CONF_DEFAULT_DURATION_MINUTES): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_READY_SUBSTRING): cv.string,
+                vol.Optional(CONF_POWER_SWITCH): cv.entity_id,
+                vol.Optional(CONF_PROGRAM_POWER_KW): vol.Coerce(float),
+                vol.Optional(CONF_CO2_ENTITY): cv.entity_id,
+                vol.Optional(CONF_CO2_WEIGHT): vol.Coerce(float),
+                vol.Optional(CONF_PV_FORECAST_ENTITY): cv.entity_id,
+                vol.Optional(CONF_BASE_LOAD_KW): vol.Coerce(float),
+                vol.Optional(CONF_PRICE_FORECAST): cv.boolean,
+                vol.Optional(CONF_REPLAN_MIN_SAVINGS): vol.Coerce(float),
+                vol.Optional(CONF_REPLAN_MIN_SAVINGS_PERCENT): vol.Coerce(float),
+                vol.Optional(CONF_DELAYED_START): cv.boolean,
+                vol.Optional(CONF_DELAYED_START_ENTITY): vol.Any(
+                    None, cv.entity_domain(["number", "select"])
+                ),
+                vol.Optional(CONF_DELAYED_START_SERVICE): vol.Any(None, cv.service),
+            }
+        ),
+    )
+
+    async def _handle_add_job_service(call: ServiceCall) -> None:
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
+            _LOGGER.warning("No Dishwasher Scheduler entries available for job queue")
+            return
+
+        deadline = call.data.get("deadline")
+        if deadline is not None and deadline.tzinfo is None:
+            deadline = deadline.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        job = await coordinator.async_add_job(
+            call.data["price_entity"],
+            call.data.get("program"),
+            call.data.get("duration_minutes"),
+            deadline,
+            call.data.get("arm", True),
+        )
+        _LOGGER.info(
+            "Queued job %s (%s jobs queued)", job.job_id, len(coordinator.jobs)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_ADD_JOB,
+        _handle_add_job_service,
+        schema=vol.Schema(
+            {
+                vol.Required("price_entity"): cv.entity_id,
+                vol.Optional("program"): cv.string,
+                vol.Optional("duration_minutes"): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional("deadline"): cv.datetime,
+                vol.Optional("arm", default=True): bool,
+            }
+        ),
+    )
+
+    async def _handle_clear_jobs_service(call: ServiceCall) -> None:
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
+            _LOGGER.warning("No Dishwasher Scheduler entries available for job queue")
+            return
+
+        await coordinator.async_remove_jobs(call.data.get(ATTR_JOB_ID))
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CLEAR_JOBS,
+        _handle_clear_jobs_service,
+        schema=vol.Schema({vol.Optional(ATTR_JOB_ID): cv.string}),
+    )
+
+    async def _handle_preview_service(call: ServiceCall) -> ServiceResponse:
+        coordinator = _first_coordinator(hass)
+        if coordinator is None:
+            _LOGGER.warning("No Dishwasher Scheduler entries available for preview")
+            return {}
+
+        return coordinator.preview_plan(
+            call.data["price_entity"],
+            call.data.get("program"),
+            call.data.get("duration_minutes"),
+            call.data.get(CONF_CO2_ENTITY),
+            call.data.get(CONF_CO2_WEIGHT),
+            call.data.get(CONF_PV_FORECAST_ENTITY),
+            call.data["alternatives"],
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PREVIEW_PLAN,
+        _handle_preview_service,
+        schema=vol.Schema(
+            {
+                vol.Required("price_entity"): cv.entity_id,
+                vol.Optional("program"): cv.string,
+                vol.Optional("duration_minutes"): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_CO2_ENTITY): cv.entity_id,
+                vol.Optional(CONF_CO2_WEIGHT): vol.Coerce(float),
+                vol.Optional(CONF_PV_FORECAST_ENTITY): cv.entity_id,
+                vol.Optional("alternatives", default=3): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=10)
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _handle_get_decisions_service(call: ServiceCall) -> ServiceResponse:
+        limit = call.data.get("limit")
+        return {
+            "entries": {
+                coordinator.entry.entry_id: coordinator.decisions.as_list(limit)
+                for coordinator in _coordinators(hass)
+            }
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DECISIONS,
+        _handle_get_decisions_service,
+        schema=vol.Schema(
+            {vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1))}
         ),
+        supports_response=SupportsResponse.ONLY,
     )
 
 
@@ -151,6 +459,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     await _async_register_services(hass)
+    async_register_websocket_commands(hass)
+    async_register_http_views(hass)
 
     coordinator = DishwasherSchedulerCoordinator(hass, entry)
     await coordinator.async_start()
@@ -166,10 +476,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_stop()
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    if not hass.data[DOMAIN]:
+    if not _coordinators(hass):
+        dispatcher = hass.data[DOMAIN].pop(DATA_DISPATCHER, None)
+        if dispatcher is not None:
+            dispatcher.async_shutdown()
+        price_history = hass.data[DOMAIN].pop(DATA_PRICE_HISTORY, None)
+        if price_history is not None:
+            await price_history.async_shutdown()
         hass.services.async_remove(DOMAIN, SERVICE_LOG_MESSAGE)
         hass.services.async_remove(DOMAIN, SERVICE_SCHEDULE_FROM_PRICES)
         hass.services.async_remove(DOMAIN, SERVICE_SET_WINDOW)
+        hass.services.async_remove(DOMAIN, SERVICE_SET_WINDOW_SCHEDULE)
+        hass.services.async_remove(DOMAIN, SERVICE_SET_TARIFFS)
+        hass.services.async_remove(DOMAIN, SERVICE_SET_OPTIONS)
+        hass.services.async_remove(DOMAIN, SERVICE_ADD_JOB)
+        hass.services.async_remove(DOMAIN, SERVICE_CLEAR_JOBS)
+        hass.services.async_remove(DOMAIN, SERVICE_PREVIEW_PLAN)
+        hass.services.async_remove(DOMAIN, SERVICE_GET_DECISIONS)
         _LOGGER.info("Removed Dishwasher Scheduler services (no entries left)")
 
     return unloaded
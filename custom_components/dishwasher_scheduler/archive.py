@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import math
+import sqlite3
+import threading
+from array import array
+from typing import Iterable, Optional
+
+from .price_sources import PriceSeries
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prices (
+    source TEXT NOT NULL,
+    start INTEGER NOT NULL,
+    value REAL NOT NULL,
+    PRIMARY KEY (source, start)
+) WITHOUT ROWID
+"""
+
+
+class PriceArchive:
+    """Append-only SQLite archive of price slots, one row per slot start.
+
+    Methods block and are meant to run in an executor. A lock serialises
+    access because executor jobs may land on different threads.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def insert(self, source: str, slots: Iterable[tuple[int, float]]) -> int:
+        """Insert ``(start, value)`` rows in one transaction; returns rows added.
+
+        Slots that are already archived are skipped by the primary key.
+        """
+
+        rows = [(source, int(start), value) for start, value in slots]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connection()
+            before = conn.total_changes
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO prices (source, start, value) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+            return conn.total_changes - before
+
+    def read_range(
+        self, source: str, start: float, end: float, step: int = 900
+    ) -> PriceSeries:
+        """Return archived prices in ``[start, end)`` on a fixed slot grid.
+
+        ``start`` is floored to the grid; slots missing from the archive are
+        NaN.
+        """
+
+        first = int(start // step * step)
+        count = max(0, math.ceil((end - first) / step))
+        values = array("d", [math.nan]) * count
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT start, value FROM prices "
+                "WHERE source = ? AND start >= ? AND start < ? ORDER BY start",
+                (source, first, first + count * step),
+            ).fetchall()
+        for slot_start, value in rows:
+            values[(slot_start - first) // step] = value
+        return PriceSeries(start=first, values=values, step=step, source=source)
+
+    def bounds(self, source: str) -> Optional[tuple[int, int]]:
+        """Return the first and last archived slot start for ``source``."""
+
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT MIN(start), MAX(start) FROM prices WHERE source = ?",
+                (source,),
+            ).fetchone()
+        return None if row is None or row[0] is None else (row[0], row[1])
+
+    def sources(self) -> list[str]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT DISTINCT source FROM prices ORDER BY source"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence
+from zoneinfo import ZoneInfo
+
+from .const import DEFAULT_WINDOW_END, DEFAULT_WINDOW_START
+from .planner import plan_from_attributes
+from .tariffs import TariffSchedule
+from .windows import WindowSchedule
+
+# Below this many files the process pool costs more than it saves.
+POOL_THRESHOLD = 8
+
+
+def _load_attributes(path: Path) -> dict[str, Any]:
+    """Read price attributes from a JSON file.
+
+    Accepts either the attribute mapping itself or a state dump as returned by
+    the REST API (``{"entity_id": ..., "attributes": {...}}``).
+    """
+
+    with path.open(encoding="utf-8") as handle:
+        data = json.load(handle)
+    if isinstance(data, dict) and isinstance(data.get("attributes"), dict):
+        return data["attributes"]
+    if not isinstance(data, dict):
+        raise ValueError("expected a JSON object")
+    return data
+
+
+def plan_file(path: str, settings: dict[str, Any]) -> dict[str, Any]:
+    """Plan one price file; returns a JSON-serialisable result row."""
+
+    result: dict[str, Any] = {"file": path}
+    try:
+        tz = ZoneInfo(settings["tz"])
+        schedule = WindowSchedule.from_options(
+            settings["window_start"], settings["window_end"], settings["schedule"]
+        )
+        choice = plan_from_attributes(
+            _load_attributes(Path(path)),
+            tz,
+            settings["duration"],
+            schedule,
+            now_ts=settings["now"],
+            power_kw=settings["power_kw"],
+            tariffs=TariffSchedule.from_options(
+                settings["tariffs"], settings["fixed_fee"]
+            ),
+        )
+    except (OSError, ValueError, KeyError) as err:
+        result["error"] = str(err)
+        return result
+
+    if choice is None:
+        result["start"] = None
+        return result
+
+    result.update(
+        start=choice.start.astimezone(tz).isoformat(),
+        total_cost=round(choice.total_cost, 6),
+        energy_kwh=round(choice.grid_kwh, 6),
+    )
+    return result
+
+
+def plan_files(
+    paths: Sequence[str], settings: dict[str, Any], jobs: int = 1
+) -> Iterable[dict[str, Any]]:
+    """Plan ``paths`` in order, fanning out to a process pool when worthwhile."""
+
+    if jobs <= 1 or len(paths) < POOL_THRESHOLD:
+        for path in paths:
+            yield plan_file(path, settings)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        chunksize = max(1, len(paths) // (jobs * 4))
+        yield from pool.map(
+            plan_file, paths, [settings] * len(paths), chunksize=chunksize
+        )
+
+
+def _parse_now(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Find the cheapest dishwasher start for each price file."
+    )
+    parser.add_argument("files", nargs="+", help="JSON price attribute files")
+    parser.add_argument(
+        "--duration", type=int, default=120, help="program duration in minutes"
+    )
+    parser.add_argument("--window-start", default=DEFAULT_WINDOW_START)
+    parser.add_argument("--window-end", default=DEFAULT_WINDOW_END)
+    parser.add_argument(
+        "--schedule",
+        help='JSON weekday overrides, e.g. \'{"sat": ["08:00-22:00"]}\'',
+    )
+    parser.add_argument(
+        "--tariffs", help="JSON list of tariff periods (see set_tariffs)"
+    )
+    parser.add_argument("--fixed-fee", type=float, default=0.0)
+    parser.add_argument("--tz", default="UTC", help="IANA time zone of the window")
+    parser.add_argument("--power-kw", type=float, default=1.0)
+    parser.add_argument(
+        "--now",
+        help="ISO timestamp; only consider starts from here (default: first slot)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="worker processes for large batches"
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        settings = {
+            "duration": args.duration,
+            "window_start": args.window_start,
+            "window_end": args.window_end,
+            "schedule": json.loads(args.schedule) if args.schedule else None,
+            "tariffs": json.loads(args.tariffs) if args.tariffs else None,
+            "fixed_fee": args.fixed_fee,
+            "tz": args.tz,
+            "power_kw": args.power_kw,
+            "now": _parse_now(args.now),
+        }
+        # Validate once up front instead of failing in every worker.
+        ZoneInfo(args.tz)
+        WindowSchedule.from_options(
+            args.window_start, args.window_end, settings["schedule"]
+        )
+        TariffSchedule.from_options(settings["tariffs"], args.fixed_fee)
+    except (ValueError, KeyError) as err:
+        print(f"error: {err}", file=sys.stderr)
+        return 2
+
+    failed = False
+    for row in plan_files(args.files, settings, args.jobs):
+        failed |= "error" in row
+        print(json.dumps(row))
+    return 1 if failed else 0
@@ -9,18 +9,37 @@ from homeassistant.helpers import selector
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    CONF_BASE_LOAD_KW,
     CONF_CHEAPEST_HOUR_ENTITY,
+    CONF_CO2_ENTITY,
+    CONF_CO2_WEIGHT,
+    CONF_PROGRAM_POWER_KW,
+    CONF_PV_FORECAST_ENTITY,
     CONF_READY_SUBSTRING,
     CONF_PLANNING_MODE,
+    CONF_PRICE_FORECAST,
+    CONF_REPLAN_MIN_SAVINGS,
+    CONF_REPLAN_MIN_SAVINGS_PERCENT,
     CONF_PROGRAM_SELECT_ENTITY,
     CONF_START_BUTTON_ENTITY,
     CONF_STATUS_ENTITY,
     CONF_DOOR_SENSOR,
+    CONF_POWER_SENSOR,
     CONF_POWER_SWITCH,
     CONF_DEFAULT_DURATION_MINUTES,
+    CONF_DELAYED_START,
+    CONF_DELAYED_START_ENTITY,
+    CONF_DELAYED_START_SERVICE,
     CONF_WINDOW_END,
     CONF_WINDOW_START,
+    DEFAULT_BASE_LOAD_KW,
+    DEFAULT_CO2_WEIGHT,
+    DEFAULT_DELAYED_START,
     DEFAULT_PLANNING_MODE,
+    DEFAULT_PRICE_FORECAST,
+    DEFAULT_REPLAN_MIN_SAVINGS,
+    DEFAULT_REPLAN_MIN_SAVINGS_PERCENT,
+    DEFAULT_PROGRAM_POWER_KW,
     DEFAULT_READY_SUBSTRING,
     DEFAULT_DURATION_MINUTES,
     DEFAULT_WINDOW_END,
@@ -83,6 +102,9 @@ DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_POWER_SWITCH): selector.EntitySelector(
             selector.EntitySelectorConfig(domain="switch")
         ),
+        vol.Optional(CONF_POWER_SENSOR): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor", device_class="power")
+        ),
         vol.Required(
             CONF_PLANNING_MODE,
             default=DEFAULT_PLANNING_MODE,
@@ -141,6 +163,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     def __init__(self, entry):
         self.entry = entry
+        self._form_keys: set[str] = set()
 
     async def async_step_init(self, user_input=None):
         if user_input is None:
@@ -223,6 +246,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     ): selector.EntitySelector(
                         selector.EntitySelectorConfig(domain="switch")
                     ),
+                    vol.Optional(
+                        CONF_POWER_SENSOR,
+                        default=self.entry.options.get(
+                            CONF_POWER_SENSOR,
+                            self.entry.data.get(CONF_POWER_SENSOR),
+                        ),
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(
+                            domain="sensor", device_class="power"
+                        )
+                    ),
                     vol.Optional(
                         CONF_DEFAULT_DURATION_MINUTES,
                         default=self.entry.options.get(
@@ -233,8 +267,103 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             ),
                         ),
                     ): vol.Coerce(int),
+                    vol.Optional(
+                        CONF_PROGRAM_POWER_KW,
+                        default=self.entry.options.get(
+                            CONF_PROGRAM_POWER_KW,
+                            self.entry.data.get(
+                                CONF_PROGRAM_POWER_KW, DEFAULT_PROGRAM_POWER_KW
+                            ),
+                        ),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_CO2_ENTITY,
+                        default=self.entry.options.get(
+                            CONF_CO2_ENTITY,
+                            self.entry.data.get(CONF_CO2_ENTITY),
+                        ),
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="sensor")
+                    ),
+                    vol.Optional(
+                        CONF_CO2_WEIGHT,
+                        default=self.entry.options.get(
+                            CONF_CO2_WEIGHT,
+                            self.entry.data.get(CONF_CO2_WEIGHT, DEFAULT_CO2_WEIGHT),
+                        ),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_PV_FORECAST_ENTITY,
+                        default=self.entry.options.get(
+                            CONF_PV_FORECAST_ENTITY,
+                            self.entry.data.get(CONF_PV_FORECAST_ENTITY),
+                        ),
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="sensor")
+                    ),
+                    vol.Optional(
+                        CONF_BASE_LOAD_KW,
+                        default=self.entry.options.get(
+                            CONF_BASE_LOAD_KW,
+                            self.entry.data.get(CONF_BASE_LOAD_KW, DEFAULT_BASE_LOAD_KW),
+                        ),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_PRICE_FORECAST,
+                        default=self.entry.options.get(
+                            CONF_PRICE_FORECAST,
+                            self.entry.data.get(
+                                CONF_PRICE_FORECAST, DEFAULT_PRICE_FORECAST
+                            ),
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_REPLAN_MIN_SAVINGS,
+                        default=self.entry.options.get(
+                            CONF_REPLAN_MIN_SAVINGS,
+                            self.entry.data.get(
+                                CONF_REPLAN_MIN_SAVINGS, DEFAULT_REPLAN_MIN_SAVINGS
+                            ),
+                        ),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_REPLAN_MIN_SAVINGS_PERCENT,
+                        default=self.entry.options.get(
+                            CONF_REPLAN_MIN_SAVINGS_PERCENT,
+                            self.entry.data.get(
+                                CONF_REPLAN_MIN_SAVINGS_PERCENT,
+                                DEFAULT_REPLAN_MIN_SAVINGS_PERCENT,
+                            ),
+                        ),
+                    ): vol.Coerce(float),
+                    vol.Optional(
+                        CONF_DELAYED_START,
+                        default=self.entry.options.get(
+                            CONF_DELAYED_START,
+                            self.entry.data.get(
+                                CONF_DELAYED_START, DEFAULT_DELAYED_START
+                            ),
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_DELAYED_START_ENTITY,
+                        default=self.entry.options.get(
+                            CONF_DELAYED_START_ENTITY,
+                            self.entry.data.get(CONF_DELAYED_START_ENTITY),
+                        ),
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain=["number", "select"])
+                    ),
+                    vol.Optional(
+                        CONF_DELAYED_START_SERVICE,
+                        default=self.entry.options.get(
+                            CONF_DELAYED_START_SERVICE,
+                            self.entry.data.get(CONF_DELAYED_START_SERVICE, ""),
+                        ),
+                    ): str,
                 }
             )
+            self._form_keys = {str(key) for key in schema.schema}
             return self.async_show_form(step_id="init", data_schema=schema)
 
         processed_input = dict(user_input)
@@ -244,4 +373,12 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         processed_input[CONF_WINDOW_END] = _time_to_str(
             user_input.get(CONF_WINDOW_END, DEFAULT_WINDOW_END)
         )
-        return self.async_create_entry(title="", data=processed_input)
+        # Keep options the form does not show, such as the weekday schedule,
+        # tariffs and anything set through the services; fields left empty
+        # in the form are still cleared.
+        kept = {
+            key: value
+            for key, value in self.entry.options.items()
+            if key not in self._form_keys
+        }
+        return self.async_create_entry(title="", data={**kept, **processed_input})
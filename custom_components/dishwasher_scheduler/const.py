@@ -7,8 +7,22 @@ CONF_START_BUTTON_ENTITY = "start_button_entity"
 CONF_READY_SUBSTRING = "ready_substring"
 CONF_WINDOW_START = "window_start"
 CONF_WINDOW_END = "window_end"
+CONF_WINDOW_SCHEDULE = "window_schedule"
+CONF_TARIFFS = "tariffs"
+CONF_FIXED_FEE = "fixed_fee"
+CONF_CO2_ENTITY = "co2_entity"
+CONF_CO2_WEIGHT = "co2_weight"
+CONF_PROGRAM_POWER_KW = "program_power_kw"
+CONF_PV_FORECAST_ENTITY = "pv_forecast_entity"
+CONF_BASE_LOAD_KW = "base_load_kw"
+CONF_PRICE_FORECAST = "price_forecast"
+CONF_REPLAN_MIN_SAVINGS = "replan_min_savings"
+CONF_REPLAN_MIN_SAVINGS_PERCENT = "replan_min_savings_percent"
 CONF_PLANNING_MODE = "planning_mode"
 CONF_PROGRAM_SELECT_ENTITY = "program_select_entity"
+CONF_DELAYED_START = "delayed_start"
+CONF_DELAYED_START_ENTITY = "delayed_start_entity"
+CONF_DELAYED_START_SERVICE = "delayed_start_service"
 
 MODE_CHEAPEST_24H = "cheapest_24h"
 MODE_START_NOW = "start_now"
@@ -18,6 +32,28 @@ DEFAULT_WINDOW_START = "00:00"
 DEFAULT_WINDOW_END = "00:00"
 DEFAULT_PLANNING_MODE = MODE_CHEAPEST_24H
 DEFAULT_DURATION_MINUTES = 120
+DEFAULT_CO2_WEIGHT = 0.0
+DEFAULT_PROGRAM_POWER_KW = 0.5
+DEFAULT_BASE_LOAD_KW = 0.3
+DEFAULT_PRICE_FORECAST = True
+DEFAULT_REPLAN_MIN_SAVINGS = 0.0
+DEFAULT_REPLAN_MIN_SAVINGS_PERCENT = 0.0
+DEFAULT_DELAYED_START = False
+# Delayed starts are only sent this far ahead; closer starts use the tick.
+DELAYED_START_MIN_LEAD_SECONDS = 300
+# The appliance must leave its ready state this soon after a delayed start.
+DELAYED_START_CONFIRM_SECONDS = 120
+# Largest gap between the planned start and the closest delay a select offers.
+DELAYED_START_MAX_ERROR_SECONDS = 900
+WINDOW_INDEX_DAYS = 3
+OPTION_UPDATE_DEBOUNCE_SECONDS = 1.0
+# Planning decisions kept in memory per entry for diagnostics.
+DECISION_TRACE_SIZE = 200
+
+DATA_DISPATCHER = "dispatcher"
+DATA_PRICE_HISTORY = "price_history"
+DATA_METRICS_VIEW = "metrics_view"
+PRICE_ARCHIVE_FILENAME = f"{DOMAIN}_prices.db"
 
 PLATFORMS: list[str] = ["sensor", "switch", "time", "select", "number"]
 
@@ -27,6 +63,23 @@ ATTR_MESSAGE = "message"
 SERVICE_LOG_MESSAGE = "log_message"
 SERVICE_SCHEDULE_FROM_PRICES = "schedule_from_prices"
 SERVICE_SET_WINDOW = "set_window"
+SERVICE_SET_WINDOW_SCHEDULE = "set_window_schedule"
+SERVICE_SET_TARIFFS = "set_tariffs"
+SERVICE_SET_OPTIONS = "set_options"
+SERVICE_ADD_JOB = "add_job"
+SERVICE_CLEAR_JOBS = "clear_jobs"
+SERVICE_PREVIEW_PLAN = "preview_plan"
+SERVICE_GET_DECISIONS = "get_decisions"
+
+EVENT_PLAN_CHANGED = f"{DOMAIN}_plan_changed"
+EVENT_START_ATTEMPTED = f"{DOMAIN}_start_attempted"
+EVENT_STARTED = f"{DOMAIN}_started"
+EVENT_RUN_COMPLETED = f"{DOMAIN}_run_completed"
+
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+
+WS_TYPE_COST_CURVE = f"{DOMAIN}/cost_curve"
+WS_TYPE_SUBSCRIBE_COST_CURVE = f"{DOMAIN}/cost_curve/subscribe"
 
 LOG_LEVELS = {
     "debug": "debug",
@@ -40,9 +93,28 @@ SENSOR_PLANNED_START = "planned_start"
 SENSOR_PLANNED_END = "planned_end"
 SENSOR_LAST_ATTEMPT = "last_attempt"
 SENSOR_LAST_RESULT = "last_result"
+SENSOR_REALIZED_COST = "realized_cost"
+SENSOR_NAIVE_COST = "naive_cost"
+SENSOR_SAVINGS = "savings"
+
+ATTR_TOTAL_COST = "total_cost"
+ATTR_TOTAL_CO2 = "total_co2_g"
+ATTR_GRID_ENERGY = "grid_energy_kwh"
+ATTR_PRICE_FORECAST = "price_forecast"
+ATTR_SUPPRESSED_REPLANS = "suppressed_replans"
+ATTR_JOBS = "jobs"
+ATTR_JOB_ID = "job_id"
+ATTR_RUNS = "runs"
+ATTR_SAVINGS_VS_WORST = "savings_vs_worst"
+
+STORAGE_VERSION = 1
 
 SWITCH_ARMED = "armed"
 
+TIME_WEEKEND_WINDOW_START = "weekend_window_start"
+TIME_WEEKEND_WINDOW_END = "weekend_window_end"
+
 CONF_DOOR_SENSOR = "door_sensor_entity"
 CONF_POWER_SWITCH = "power_switch_entity"
+CONF_POWER_SENSOR = "power_sensor_entity"
 CONF_DEFAULT_DURATION_MINUTES = "default_duration_minutes"
@@ -1,46 +1,134 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+import math
+import re
+import uuid
+from array import array
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, time, timedelta
-from typing import Any, Callable, Mapping, Optional
+from time import perf_counter
+from typing import Any, Callable, Iterable, Mapping, Optional
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import (
+    async_call_later,
     async_track_state_change_event,
-    async_track_time_change,
 )
+from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    CONF_BASE_LOAD_KW,
     CONF_CHEAPEST_HOUR_ENTITY,
+    CONF_CO2_ENTITY,
+    CONF_CO2_WEIGHT,
     CONF_READY_SUBSTRING,
     CONF_PLANNING_MODE,
+    CONF_PRICE_FORECAST,
+    CONF_REPLAN_MIN_SAVINGS,
+    CONF_REPLAN_MIN_SAVINGS_PERCENT,
     CONF_DOOR_SENSOR,
+    CONF_POWER_SENSOR,
     CONF_POWER_SWITCH,
     CONF_DEFAULT_DURATION_MINUTES,
+    CONF_DELAYED_START,
+    CONF_DELAYED_START_ENTITY,
+    CONF_DELAYED_START_SERVICE,
+    CONF_FIXED_FEE,
+    CONF_PROGRAM_POWER_KW,
     CONF_PROGRAM_SELECT_ENTITY,
+    CONF_PV_FORECAST_ENTITY,
     CONF_START_BUTTON_ENTITY,
     CONF_STATUS_ENTITY,
+    CONF_TARIFFS,
     CONF_WINDOW_END,
+    CONF_WINDOW_SCHEDULE,
     CONF_WINDOW_START,
+    DEFAULT_BASE_LOAD_KW,
+    DEFAULT_CO2_WEIGHT,
+    DEFAULT_DELAYED_START,
     DEFAULT_PLANNING_MODE,
+    DEFAULT_PRICE_FORECAST,
+    DEFAULT_REPLAN_MIN_SAVINGS,
+    DEFAULT_REPLAN_MIN_SAVINGS_PERCENT,
+    DEFAULT_PROGRAM_POWER_KW,
     DEFAULT_READY_SUBSTRING,
     DEFAULT_DURATION_MINUTES,
     DEFAULT_WINDOW_END,
     DEFAULT_WINDOW_START,
+    DECISION_TRACE_SIZE,
+    DELAYED_START_CONFIRM_SECONDS,
+    DELAYED_START_MAX_ERROR_SECONDS,
+    DELAYED_START_MIN_LEAD_SECONDS,
     INTEGRATION_VERSION,
     MODE_CHEAPEST_24H,
+    DOMAIN,
+    EVENT_PLAN_CHANGED,
+    EVENT_RUN_COMPLETED,
+    EVENT_START_ATTEMPTED,
+    EVENT_STARTED,
     MODE_START_NOW,
+    OPTION_UPDATE_DEBOUNCE_SECONDS,
     SERVICE_SCHEDULE_FROM_PRICES,
+    STORAGE_VERSION,
+    WINDOW_INDEX_DAYS,
 )
+from .decisions import Decision, DecisionTrace
+from .dispatcher import async_get_dispatcher
+from .learning import EnergyIntegrator, ProgramLearner
+from .metrics import SchedulerMetrics
+from .planner import (
+    CostCurve,
+    JobSearch,
+    JobSpec,
+    WindowChoice,
+    WindowSearch,
+    fill_gaps_with_mean,
+    grid_import_profile,
+    ranked_starts,
+    slots_needed,
+)
+from .price_history import PriceHistory, async_get_price_history
+from .price_sources import PriceSeries, PriceSeriesCache
+from .tariffs import TariffOverlay, TariffSchedule
+from .windows import WEEKEND, Interval, WindowIndex, WindowSchedule, parse_weekday
 
 CallbackType = Callable[[], None]
 
+# Options that change where or when a run may be planned.
+REPLAN_OPTIONS = frozenset(
+    {
+        CONF_WINDOW_START,
+        CONF_WINDOW_END,
+        CONF_WINDOW_SCHEDULE,
+        CONF_PLANNING_MODE,
+        CONF_DEFAULT_DURATION_MINUTES,
+        CONF_TARIFFS,
+        CONF_FIXED_FEE,
+        CONF_PRICE_FORECAST,
+        CONF_PROGRAM_POWER_KW,
+        CONF_BASE_LOAD_KW,
+    }
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class RunStatistics:
+    """Accumulated cost statistics of completed runs."""
+
+    runs: int = 0
+    realized_cost: float = 0.0
+    naive_cost: float = 0.0
+    savings: float = 0.0
+    savings_vs_worst: float = 0.0
+    unit: Optional[str] = None
+
+
 @dataclass
 class RuntimeState:
     """Runtime data for the scheduler."""
@@ -52,6 +140,129 @@ class RuntimeState:
     last_attempt: Optional[datetime] = None
     last_result: str = "never"
     started_at: Optional[datetime] = None
+    # When the status reported the started run finished, until it is reset.
+    finished_at: Optional[datetime] = None
+    planned_cost: Optional[float] = None
+    planned_co2: Optional[float] = None
+    planned_grid_kwh: Optional[float] = None
+    plan_costs: Optional[CostCurve] = None
+    run_costs: Optional[CostCurve] = None
+    planned_from_forecast: bool = False
+    suppressed_replans: int = 0
+    # Start the appliance was told to delay to, until it confirms.
+    delayed_start_for: Optional[datetime] = None
+    delayed_start_sent_at: Optional[datetime] = None
+    # Planned starts of the queued jobs, head first.
+    job_plan: list[tuple["Job", WindowChoice]] = field(default_factory=list)
+
+
+@dataclass
+class PriceRequest:
+    """Last price-based plan request, replayed when prices or options change."""
+
+    price_entity: str
+    duration_minutes: int
+    co2_entity: Optional[str] = None
+    co2_weight: float = 0.0
+    pv_entity: Optional[str] = None
+    # End of the published prices the current plan was based on.
+    prices_end: float = field(default=math.nan, compare=False)
+
+
+@dataclass
+class RunObservation:
+    """A run being timed (and metered) to learn program estimates."""
+
+    program: Optional[str]
+    started_at: datetime
+    left_ready: bool = False
+    energy: Optional[EnergyIntegrator] = None
+
+
+@dataclass
+class Job:
+    """A queued run: the program to select and when it must be done by."""
+
+    job_id: str
+    price_entity: str
+    program: Optional[str] = None
+    duration_minutes: Optional[int] = None
+    deadline: Optional[datetime] = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "price_entity": self.price_entity,
+            "program": self.program,
+            "duration_minutes": self.duration_minutes,
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> "Job":
+        deadline = raw.get("deadline")
+        return cls(
+            job_id=str(raw["job_id"]),
+            price_entity=str(raw["price_entity"]),
+            program=raw.get("program"),
+            duration_minutes=raw.get("duration_minutes"),
+            deadline=dt_util.parse_datetime(deadline) if deadline else None,
+        )
+
+
+# Runs outside this range (minutes) are treated as measurement errors.
+MIN_LEARNED_RUN_MINUTES = 5
+MAX_LEARNED_RUN_MINUTES = 6 * 60
+
+
+# A price request plus whether it arms the scheduler.
+PlanKey = tuple[PriceRequest, bool]
+
+# Searches estimated above this many slot additions run in the executor.
+PLAN_EXECUTOR_THRESHOLD = 50_000
+
+
+_DELAY_OPTION = re.compile(
+    r"(\d+(?:[.,]\d+)?)\s*"
+    r"(s|secs?|seconds?|m|mins?|minutes?|h|hrs?|hours?)?(?![a-z])",
+    re.IGNORECASE,
+)
+_DELAY_UNITS = {"s": 1, "m": 60, "h": 3600}
+
+
+def _delay_option_seconds(option: str) -> Optional[float]:
+    """Parse a delayed-start select option such as ``3h`` or ``90 min``.
+
+    Options without a unit are taken as hours, as offered by most appliances.
+
+    >>> [_delay_option_seconds(o) for o in ("3", "3h", "2 hours", "1.5 hrs")]
+    [10800.0, 10800.0, 7200.0, 5400.0]
+    >>> [_delay_option_seconds(o) for o in ("90 minutes", "5 mins", "30 min")]
+    [5400.0, 300.0, 1800.0]
+    >>> [_delay_option_seconds(o) for o in ("30 seconds", "45 secs", "10s")]
+    [30.0, 45.0, 10.0]
+    >>> _delay_option_seconds("off") is None
+    True
+    """
+
+    match = _DELAY_OPTION.search(option)
+    if match is None:
+        return None
+    value = float(match.group(1).replace(",", "."))
+    unit = (match.group(2) or "h").lower()
+    return value * _DELAY_UNITS[unit[0]]
+
+
+def _chain_future(source: asyncio.Future, target: asyncio.Future) -> None:
+    """Resolve ``target`` like ``source`` once ``source`` is done."""
+
+    def _copy(done: asyncio.Future) -> None:
+        if (err := done.exception()) is not None:
+            target.set_exception(err)
+        else:
+            target.set_result(None)
+
+    source.add_done_callback(_copy)
 
 
 class DishwasherSchedulerCoordinator:
@@ -61,9 +272,57 @@ class DishwasherSchedulerCoordinator:
         self.hass = hass
         self.entry = entry
         self.unsub_timer: Optional[Callable[[], None]] = None
+        self._schedule_due: Optional[Callable[[Optional[datetime]], None]] = None
         self.unsub_door: Optional[Callable[[], None]] = None
         self.state = RuntimeState()
         self._listeners: list[CallbackType] = []
+        # Last plan announced on the event bus and why the next one changes.
+        self._announced_plan: tuple[Optional[datetime], Optional[datetime]] = (
+            None,
+            None,
+        )
+        self._plan_reason = "recompute"
+        self._window_index: Optional[WindowIndex] = None
+        self._window_source: tuple[Any, ...] = ()
+        self._price_cache = PriceSeriesCache()
+        self._price_history: Optional[PriceHistory] = None
+        self._price_request: Optional[PriceRequest] = None
+        self.unsub_prices: Optional[Callable[[], None]] = None
+        # Price entities whose published slots are archived as they appear.
+        self._archived_prices: dict[str, Callable[[], None]] = {}
+        # Serialises plan and start transitions across awaits.
+        self._plan_lock = asyncio.Lock()
+        self._plan_running: Optional[tuple[PlanKey, asyncio.Future]] = None
+        self._plan_queued: Optional[tuple[PlanKey, asyncio.Future]] = None
+        self.coalesced_requests = 0
+        self.offloaded_plans = 0
+        self.superseded_plans = 0
+        self.state_writes = 0
+        self.decisions = DecisionTrace(DECISION_TRACE_SIZE)
+        self.metrics = SchedulerMetrics()
+        self._inputs_version = 0
+        self._trace_inputs: tuple[Any, ...] = ()
+        # Wall time (ms) and executor use of the last planner search.
+        self._last_search: tuple[Optional[float], bool] = (None, False)
+        # Option updates not yet written to the config entry.
+        self._pending_options: dict[str, Any] = {}
+        self._unsub_option_flush: Optional[Callable[[], None]] = None
+        self._tariff_overlay: Optional[TariffOverlay] = None
+        self._tariff_source: tuple[Any, ...] = ()
+        self._import_cache: tuple[Any, ...] = ()
+        self.statistics = RunStatistics()
+        self.learner = ProgramLearner()
+        self.jobs: list[Job] = []
+        self._run: Optional[RunObservation] = None
+        self._unsub_run: list[Callable[[], None]] = []
+        self._unsub_delayed: Optional[Callable[[], None]] = None
+        # Planned start for which a delayed start failed; the tick takes over.
+        self._delayed_start_skip: Optional[datetime] = None
+        # Job taken off the queue by a confirmed delayed start, until it runs.
+        self._delayed_job: Optional[Job] = None
+        self._store: Store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}"
+        )
         _LOGGER.debug("Coordinator created for entry %s", entry.entry_id)
 
     @property
@@ -82,6 +341,24 @@ class DishwasherSchedulerCoordinator:
     def program_select_entity(self) -> Optional[str]:
         return self.entry.data.get(CONF_PROGRAM_SELECT_ENTITY)
 
+    @property
+    def power_sensor(self) -> Optional[str]:
+        return self._opt(CONF_POWER_SENSOR, None)
+
+    @property
+    def delayed_start_entity(self) -> Optional[str]:
+        return self._opt(CONF_DELAYED_START_ENTITY, None)
+
+    @property
+    def delayed_start_service(self) -> Optional[str]:
+        return self._opt(CONF_DELAYED_START_SERVICE, None)
+
+    @property
+    def delayed_start_enabled(self) -> bool:
+        return bool(self._opt(CONF_DELAYED_START, DEFAULT_DELAYED_START)) and bool(
+            self.delayed_start_entity or self.delayed_start_service
+        )
+
     @property
     def door_sensor(self) -> Optional[str]:
         return self._opt(CONF_DOOR_SENSOR, None)
@@ -97,7 +374,60 @@ class DishwasherSchedulerCoordinator:
         except (TypeError, ValueError):
             return DEFAULT_DURATION_MINUTES
 
+    @property
+    def co2_entity(self) -> Optional[str]:
+        return self._opt(CONF_CO2_ENTITY, None)
+
+    @property
+    def co2_weight(self) -> float:
+        try:
+            return float(self._opt(CONF_CO2_WEIGHT, DEFAULT_CO2_WEIGHT))
+        except (TypeError, ValueError):
+            return DEFAULT_CO2_WEIGHT
+
+    @property
+    def program_power_kw(self) -> float:
+        try:
+            return float(self._opt(CONF_PROGRAM_POWER_KW, DEFAULT_PROGRAM_POWER_KW))
+        except (TypeError, ValueError):
+            return DEFAULT_PROGRAM_POWER_KW
+
+    @property
+    def pv_forecast_entity(self) -> Optional[str]:
+        return self._opt(CONF_PV_FORECAST_ENTITY, None)
+
+    @property
+    def base_load_kw(self) -> float:
+        try:
+            return float(self._opt(CONF_BASE_LOAD_KW, DEFAULT_BASE_LOAD_KW))
+        except (TypeError, ValueError):
+            return DEFAULT_BASE_LOAD_KW
+
+    @property
+    def price_forecast_enabled(self) -> bool:
+        return bool(self._opt(CONF_PRICE_FORECAST, DEFAULT_PRICE_FORECAST))
+
+    @property
+    def replan_min_savings(self) -> float:
+        try:
+            return float(self._opt(CONF_REPLAN_MIN_SAVINGS, DEFAULT_REPLAN_MIN_SAVINGS))
+        except (TypeError, ValueError):
+            return DEFAULT_REPLAN_MIN_SAVINGS
+
+    @property
+    def replan_min_savings_percent(self) -> float:
+        try:
+            return float(
+                self._opt(
+                    CONF_REPLAN_MIN_SAVINGS_PERCENT, DEFAULT_REPLAN_MIN_SAVINGS_PERCENT
+                )
+            )
+        except (TypeError, ValueError):
+            return DEFAULT_REPLAN_MIN_SAVINGS_PERCENT
+
     def _opt(self, key: str, default):
+        if key in self._pending_options:
+            return self._pending_options[key]
         return self.entry.options.get(key, self.entry.data.get(key, default))
 
     def _parse_time(self, key: str, default_value: str) -> time:
@@ -122,22 +452,53 @@ class DishwasherSchedulerCoordinator:
         return parsed_time.hour * 60 + parsed_time.minute
 
     async def async_update_option(self, key: str, value: Any) -> None:
-        """Persist an option update and refresh planning."""
+        """Buffer an option update; it is saved after a short debounce."""
+
+        self.async_queue_options({key: value})
+
+    @callback
+    def async_queue_options(self, updates: Mapping[str, Any]) -> None:
+        """Buffer option updates and (re)start the debounce timer.
 
-        options = {**self.entry.options, key: value}
-        await self.hass.config_entries.async_update_entry(
-            self.entry, options=options
+        Options read through ``_opt`` see buffered values immediately; the
+        entry write, replan and listener fan-out happen once on flush.
+        """
+
+        self._pending_options = {**self._pending_options, **updates}
+        if self._unsub_option_flush:
+            self._unsub_option_flush()
+        self._unsub_option_flush = async_call_later(
+            self.hass, OPTION_UPDATE_DEBOUNCE_SECONDS, self._async_flush_options_later
         )
 
-        if key in {
-            CONF_WINDOW_START,
-            CONF_WINDOW_END,
-            CONF_PLANNING_MODE,
-            CONF_DEFAULT_DURATION_MINUTES,
-        }:
-            self._recompute_planned_start()
+    async def async_set_options(self, updates: Mapping[str, Any]) -> None:
+        """Apply several options at once with one entry write and one replan."""
 
-        self._notify_listeners()
+        self._pending_options = {**self._pending_options, **updates}
+        await self.async_flush_options()
+
+    async def _async_flush_options_later(self, _now: datetime) -> None:
+        self._unsub_option_flush = None
+        await self.async_flush_options()
+
+    async def async_flush_options(self) -> None:
+        """Write buffered options to the config entry and refresh planning."""
+
+        if self._unsub_option_flush:
+            self._unsub_option_flush()
+            self._unsub_option_flush = None
+        async with self._plan_lock:
+            pending = self._pending_options
+            if not pending:
+                return
+            self.hass.config_entries.async_update_entry(
+                self.entry, options={**self.entry.options, **pending}
+            )
+            self._pending_options = {}
+            if not REPLAN_OPTIONS.isdisjoint(pending):
+                self._plan_reason = "options"
+                await self._async_recompute_planned_start()
+            self._notify_listeners()
 
     @property
     def ready_substring(self) -> str:
@@ -155,12 +516,130 @@ class DishwasherSchedulerCoordinator:
     def planning_mode(self) -> str:
         return self._opt(CONF_PLANNING_MODE, DEFAULT_PLANNING_MODE)
 
+    @property
+    def window_schedule(self) -> WindowSchedule:
+        try:
+            return WindowSchedule.from_options(
+                self.window_start,
+                self.window_end,
+                self._opt(CONF_WINDOW_SCHEDULE, None),
+            )
+        except (TypeError, ValueError) as err:
+            _LOGGER.error("Ignoring invalid window schedule: %s", err)
+            return WindowSchedule.from_options(self.window_start, self.window_end)
+
+    @property
+    def weekend_window(self) -> Optional[Interval]:
+        intervals = self.window_schedule.intervals_for(parse_weekday(WEEKEND[0]))
+        return intervals[0] if intervals else None
+
+    async def async_update_window_schedule(
+        self,
+        updates: Mapping[str, Optional[Iterable[Interval]]],
+        reset: bool = False,
+    ) -> None:
+        """Replace the intervals of some weekdays (None restores the default)."""
+
+        schedule = self.window_schedule
+        overrides = [None] * 7 if reset else list(schedule.overrides)
+        for day, intervals in updates.items():
+            overrides[parse_weekday(day)] = (
+                None if intervals is None else tuple(intervals)
+            )
+
+        updated = WindowSchedule(schedule.default, tuple(overrides))
+        await self.async_update_option(CONF_WINDOW_SCHEDULE, updated.as_options())
+
+    @property
+    def price_cache(self) -> PriceSeriesCache:
+        return self._price_cache
+
+    def _options_source(self) -> tuple[Any, ...]:
+        """Identity token for everything derived from options and time zone."""
+
+        return (
+            self.entry.options,
+            self._pending_options,
+            self.entry.data,
+            dt_util.DEFAULT_TIME_ZONE,
+        )
+
+    @staticmethod
+    def _same_source(current: tuple[Any, ...], cached: tuple[Any, ...]) -> bool:
+        return len(current) == len(cached) and all(
+            a is b for a, b in zip(current, cached)
+        )
+
+    @property
+    def tariff_schedule(self) -> TariffSchedule:
+        try:
+            return TariffSchedule.from_options(
+                self._opt(CONF_TARIFFS, None), self._opt(CONF_FIXED_FEE, 0.0)
+            )
+        except (TypeError, ValueError) as err:
+            _LOGGER.error("Ignoring invalid tariff configuration: %s", err)
+            return TariffSchedule()
+
+    def _get_tariff_overlay(self) -> TariffOverlay:
+        source = self._options_source()
+        if self._tariff_overlay is None or not self._same_source(
+            source, self._tariff_source
+        ):
+            self._tariff_overlay = TariffOverlay(
+                self.tariff_schedule, dt_util.DEFAULT_TIME_ZONE
+            )
+            self._tariff_source = source
+        return self._tariff_overlay
+
+    def _window_index_for(self, start_ts: float, end_ts: float) -> WindowIndex:
+        """Return a compiled window index covering the given UTC span."""
+
+        source = self._options_source()
+        index = self._window_index
+        if (
+            index is not None
+            and self._same_source(source, self._window_source)
+            and index.covers(start_ts, end_ts)
+        ):
+            return index
+
+        first_day = dt_util.as_local(dt_util.utc_from_timestamp(start_ts)).date()
+        days = max(WINDOW_INDEX_DAYS, int((end_ts - start_ts) // 86400) + 2)
+        index = WindowIndex.build(
+            self.window_schedule, dt_util.DEFAULT_TIME_ZONE, first_day, days
+        )
+        self._window_index = index
+        self._window_source = source
+        _LOGGER.debug(
+            "Compiled %s allowed-window intervals from %s for %s days",
+            len(index.opens),
+            first_day,
+            days,
+        )
+        return index
+
     async def async_start(self) -> None:
         """Begin listening for ticks and compute initial plan."""
+        stored = await self._store.async_load() or {}
+        if statistics := stored.get("statistics"):
+            self.statistics = RunStatistics(**statistics)
+        if programs := stored.get("programs"):
+            self.learner = ProgramLearner.from_dict(programs)
+        try:
+            self.jobs = [Job.from_dict(job) for job in stored.get("jobs", [])]
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.error("Discarding stored job queue: %s", err)
+        self._price_history = async_get_price_history(self.hass)
+        for price_entity in stored.get("price_entities", []):
+            self._archive_prices_of(price_entity)
+        if self.jobs:
+            self._set_price_request(self._queue_request())
         self._recompute_planned_start()
-        self.unsub_timer = async_track_time_change(
-            self.hass, self._handle_minute_tick, second=0
+        dispatcher = async_get_dispatcher(self.hass)
+        self.unsub_timer = dispatcher.register(
+            self.entry.entry_id, self._handle_minute_tick
         )
+        self._schedule_due = lambda due: dispatcher.schedule(self.entry.entry_id, due)
         if self.door_sensor:
             self.unsub_door = async_track_state_change_event(
                 self.hass, [self.door_sensor], self._handle_door_event
@@ -174,6 +653,8 @@ class DishwasherSchedulerCoordinator:
 
     async def async_stop(self) -> None:
         """Stop scheduler callbacks."""
+        await self.async_flush_options()
+        self._schedule_due = None
         if self.unsub_timer:
             self.unsub_timer()
             self.unsub_timer = None
@@ -182,20 +663,82 @@ class DishwasherSchedulerCoordinator:
             self.unsub_door()
             self.unsub_door = None
             _LOGGER.debug("Stopped door listener for %s", self.entry.entry_id)
-
-    def set_armed(self, value: bool) -> None:
-        """Arm or disarm the scheduler."""
-        self.state.armed = value
-        _LOGGER.info("Scheduler %s set to armed=%s", self.entry.entry_id, value)
-        if value:
-            self._recompute_planned_start()
-        self._notify_listeners()
+        self._set_price_request(None)
+        for unsub in self._archived_prices.values():
+            unsub()
+        self._archived_prices.clear()
+        self._stop_run_observation()
+        self._clear_delayed_start()
+
+    async def async_set_armed(self, value: bool) -> None:
+        """Arm or disarm, waiting for any plan or start in progress."""
+
+        async with self._plan_lock:
+            self.state.armed = value
+            self._plan_reason = "armed"
+            _LOGGER.debug("Scheduler %s set to armed=%s", self.entry.entry_id, value)
+            if value:
+                await self._async_recompute_planned_start()
+            else:
+                await self._async_cancel_delayed_start()
+            self._notify_listeners()
 
     def set_planned_start(self, planned: Optional[datetime]) -> None:
         """Set a planned start time and notify listeners."""
         self.state.planned_start = planned
+        self._clear_plan_details()
+        self._set_price_request(None)
+        self._plan_reason = "manual"
         self._notify_listeners()
 
+    def _clear_plan_details(self) -> None:
+        self.state.planned_cost = None
+        self.state.planned_co2 = None
+        self.state.planned_grid_kwh = None
+        self.state.plan_costs = None
+        self.state.planned_from_forecast = False
+        self.state.job_plan = []
+
+    def _stored_data(self) -> dict[str, Any]:
+        return {
+            "statistics": asdict(self.statistics),
+            "programs": self.learner.as_dict(),
+            "jobs": [job.as_dict() for job in self.jobs],
+            "price_entities": list(self._archived_prices),
+        }
+
+    def _record_completed_run(self) -> Optional[float]:
+        """Add a completed run to the cost statistics; returns its cost."""
+
+        costs = self.state.run_costs
+        started = self.state.started_at
+        self.state.run_costs = None
+        if costs is None or started is None:
+            return None
+
+        realized = costs.cost_at(started)
+        naive = costs.first_cost()
+        worst = costs.worst_cost()
+        if realized is None or naive is None or worst is None:
+            _LOGGER.debug("Run started outside the planned price curve; not counted")
+            return None
+
+        stats = self.statistics
+        stats.runs += 1
+        stats.realized_cost += realized
+        stats.naive_cost += naive
+        stats.savings += naive - realized
+        stats.savings_vs_worst += worst - realized
+        stats.unit = costs.unit or stats.unit
+        self._store.async_delay_save(self._stored_data, 5)
+        _LOGGER.info(
+            "Run completed: cost %.3f, starting immediately %.3f, saved %.3f",
+            realized,
+            naive,
+            naive - realized,
+        )
+        return realized
+
     def async_add_listener(self, listener: CallbackType) -> CallbackType:
         """Register a state listener and return unsubscribe callback."""
         self._listeners.append(listener)
@@ -207,9 +750,64 @@ class DishwasherSchedulerCoordinator:
         return _remove
 
     def _notify_listeners(self) -> None:
+        plan = (self.state.planned_start, self.state.planned_end)
+        if plan != self._announced_plan:
+            self._announced_plan = plan
+            self._fire_event(
+                EVENT_PLAN_CHANGED,
+                start=plan[0],
+                end=plan[1],
+                cost=self.state.planned_cost,
+                reason=self._plan_reason,
+            )
+        self._plan_reason = "recompute"
+        if self._schedule_due is not None:
+            self._schedule_due(self._next_due())
         for listener in list(self._listeners):
             listener()
 
+    def _fire_event(self, event_type: str, **data: Any) -> None:
+        """Fire a compact lifecycle event for automations."""
+
+        payload: dict[str, Any] = {"entry_id": self.entry.entry_id}
+        for key, value in data.items():
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, float):
+                value = round(value, 4)
+            payload[key] = value
+        self.hass.bus.async_fire(event_type, payload)
+
+    def _next_due(self) -> Optional[datetime]:
+        """Return when the shared dispatcher should next call the tick."""
+
+        if not self.state.armed:
+            return None
+
+        current_minute = dt_util.utcnow().replace(second=0, microsecond=0)
+        planned = self.state.planned_start
+        if planned is None:
+            # Keep retrying the cheapest-hour plan every minute while armed.
+            return current_minute + timedelta(minutes=1)
+
+        if self.state.delayed_start_for is not None:
+            # Only wake up to fall back if the appliance never confirms.
+            return self.state.delayed_start_sent_at + timedelta(
+                seconds=DELAYED_START_CONFIRM_SECONDS
+            )
+        if (send_at := self._delayed_start_send_at(planned)) is not None:
+            return max(send_at, dt_util.utcnow())
+
+        planned_minute = dt_util.as_utc(planned).replace(second=0, microsecond=0)
+        if planned_minute < current_minute:
+            return None
+        attempt = self.state.last_attempt
+        if attempt is not None and dt_util.as_utc(attempt).replace(
+            second=0, microsecond=0
+        ) == planned_minute:
+            return None
+        return planned_minute
+
     def _get_cheapest_hour(self) -> Optional[int]:
         st = self.hass.states.get(self.cheapest_hour_entity)
         if st is None:
@@ -239,110 +837,109 @@ class DishwasherSchedulerCoordinator:
         return None
 
     def _within_window(self, target) -> bool:
-        start = self._window_minutes(CONF_WINDOW_START, DEFAULT_WINDOW_START)
-        end = self._window_minutes(CONF_WINDOW_END, DEFAULT_WINDOW_END)
-
         if isinstance(target, datetime):
-            local_dt = dt_util.as_local(target)
-            target_minutes = local_dt.hour * 60 + local_dt.minute
-        elif isinstance(target, time):
-            target_minutes = target.hour * 60 + target.minute
+            target_dt = target
         else:
-            try:
-                target_minutes = int(float(target)) * 60
-            except (TypeError, ValueError):
-                return False
+            if isinstance(target, time):
+                target_time = target
+            else:
+                try:
+                    target_time = time(int(float(target)) % 24, 0)
+                except (TypeError, ValueError):
+                    return False
+            target_dt = datetime.combine(
+                dt_util.now().date(), target_time, tzinfo=dt_util.DEFAULT_TIME_ZONE
+            )
 
-        if start == end:
-            return True
-        if start < end:
-            return start <= target_minutes < end
-        return (target_minutes >= start) or (target_minutes < end)
+        ts = target_dt.timestamp()
+        return self._window_index_for(ts, ts).contains(ts)
 
     def _within_window_span(self, start_dt: datetime, duration_minutes: int) -> bool:
-        """Check whether a start/end span fits within the configured window."""
+        """Check whether a start/end span fits within the allowed window schedule."""
 
         if duration_minutes <= 0:
             return False
 
-        start_minutes = self._window_minutes(CONF_WINDOW_START, DEFAULT_WINDOW_START)
-        end_minutes = self._window_minutes(CONF_WINDOW_END, DEFAULT_WINDOW_END)
-
-        local_start = dt_util.as_local(start_dt)
-        local_end = local_start + timedelta(minutes=duration_minutes)
+        start_ts = start_dt.timestamp()
+        return self._span_fits(start_ts, start_ts + duration_minutes * 60)
 
-        start_minute_of_day = local_start.hour * 60 + local_start.minute
-        end_minute_of_day = local_end.hour * 60 + local_end.minute
+    def _span_fits(self, start_ts: float, end_ts: float) -> bool:
+        return self._window_index_for(start_ts, end_ts).fits(start_ts, end_ts)
 
-        if start_minutes == end_minutes:
-            return True
-
-        if start_minutes < end_minutes:
-            if local_end.date() != local_start.date():
-                return False
-            return (
-                start_minute_of_day >= start_minutes
-                and end_minute_of_day <= end_minutes
-            )
+    async def _async_recompute_planned_start(self) -> None:
+        """Like ``_recompute_planned_start``, offloading large price searches."""
 
-        # Window wraps over midnight
-        if start_minute_of_day >= start_minutes:
-            # Starting late evening; must finish before window end next day
-            return (
-                local_end.date() > local_start.date()
-                and end_minute_of_day <= end_minutes
-            )
-
-        # Starting after midnight; ensure finish before end_minutes same day
-        return end_minute_of_day <= end_minutes
+        if self.state.delayed_start_for is not None:
+            return
+        request = self._price_request
+        if self.planning_mode != MODE_START_NOW and request is not None:
+            await self._async_apply_price_plan(request, keep_current=True)
+            return
+        self._recompute_planned_start()
 
     def _recompute_planned_start(self) -> None:
+        if self.state.delayed_start_for is not None:
+            # The appliance holds the plan; only cancelling it may move it.
+            return
         mode = self.planning_mode
         now = dt_util.now()
 
+        if mode != MODE_START_NOW and self._price_request is not None:
+            # Keep following the requested price plan instead of falling back
+            # to the cheapest-hour sensor.
+            self._apply_price_plan(self._price_request, keep_current=True)
+            return
+
+        self._clear_plan_details()
+        duration_minutes = self._get_program_minutes(self.default_duration_minutes)
+
         if mode == MODE_START_NOW:
             candidate = (now + timedelta(minutes=1)).replace(
                 second=0, microsecond=0
             )
             self.state.planned_start = candidate
-            self.state.planned_duration_minutes = self.default_duration_minutes
+            self.state.planned_duration_minutes = duration_minutes
             self.state.planned_end = candidate + timedelta(
                 minutes=self.state.planned_duration_minutes
             )
-            _LOGGER.info("Planning mode is start now; planned start %s", candidate)
+            _LOGGER.debug("Planning mode is start now; planned start %s", candidate)
+            self._trace("planned", None, start=candidate, reason=MODE_START_NOW)
             return
 
         cheapest = self._get_cheapest_hour()
         if cheapest is None:
             self.state.planned_start = None
-            _LOGGER.info("No valid cheapest hour available; clearing planned start")
+            _LOGGER.debug("No valid cheapest hour available; clearing planned start")
+            self._trace("cleared", None, reason="no_cheapest_hour")
             return
 
         candidate = now.replace(minute=0, second=0, microsecond=0, hour=cheapest)
         if candidate <= now:
             candidate = candidate + timedelta(days=1)
 
-        if not self._within_window_span(candidate, self.default_duration_minutes):
+        if not self._within_window_span(candidate, duration_minutes):
             self.state.planned_start = None
             self.state.planned_end = None
-            _LOGGER.info(
+            _LOGGER.debug(
                 "Cheapest hour %s outside allowed window %s-%s",
                 cheapest,
                 self.window_start,
                 self.window_end,
             )
+            self._trace("cleared", cheapest, start=candidate, reason="outside_window")
             return
 
         self.state.planned_start = candidate
-        self.state.planned_duration_minutes = self.default_duration_minutes
+        self.state.planned_duration_minutes = duration_minutes
         self.state.planned_end = candidate + timedelta(
             minutes=self.state.planned_duration_minutes
         )
-        _LOGGER.info(
+        _LOGGER.debug(
             "Planned start recalculated: %s (duration %s minutes)",
             candidate,
             self.state.planned_duration_minutes,
         )
+        self._trace("planned", cheapest, start=candidate, reason="cheapest_hour")
 
     def _status_is_ready(self) -> bool:
         st = self.hass.states.get(self.status_entity)
@@ -356,10 +953,244 @@ class DishwasherSchedulerCoordinator:
         return self.ready_substring.lower() in state.lower()
 
     async def _press_start_button(self) -> None:
+        began = perf_counter()
+        try:
+            await self.hass.services.async_call(
+                "button",
+                "press",
+                {"entity_id": self.start_button_entity},
+                blocking=True,
+            )
+        finally:
+            self.metrics.start_press_latency.observe(perf_counter() - began)
+
+    async def _select_program(self, program: str) -> None:
+        if not self.program_select_entity:
+            _LOGGER.warning("No program select entity; starting %s as selected", program)
+            return
         await self.hass.services.async_call(
-            "button", "press", {"entity_id": self.start_button_entity}, blocking=True
+            "select",
+            "select_option",
+            {"entity_id": self.program_select_entity, "option": program},
+            blocking=True,
         )
 
+    def _delayed_start_send_at(self, planned: datetime) -> Optional[datetime]:
+        """When to send the delayed start for ``planned`` (None: use the tick)."""
+
+        if (
+            not self.delayed_start_enabled
+            or self.state.delayed_start_for is not None
+            or planned == self._delayed_start_skip
+        ):
+            return None
+        now = dt_util.utcnow()
+        if (planned - now).total_seconds() < DELAYED_START_MIN_LEAD_SECONDS:
+            return None
+        max_delay = self._max_start_delay()
+        if max_delay is not None:
+            return max(now, planned - timedelta(seconds=max_delay))
+        return now
+
+    def _max_start_delay(self) -> Optional[float]:
+        """Longest delay (seconds) the delayed-start number entity accepts."""
+
+        entity = self.delayed_start_entity
+        if not entity or not entity.startswith("number."):
+            return None
+        state = self.hass.states.get(entity)
+        if state is None:
+            return None
+        try:
+            maximum = float(state.attributes["max"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return maximum * self._number_unit_seconds(state)
+
+    @staticmethod
+    def _number_unit_seconds(state) -> int:
+        unit = state.attributes.get("unit_of_measurement")
+        return {"min": 60, "h": 3600}.get(unit, 1)
+
+    async def _async_send_delayed_start(self, planned: datetime, now: datetime) -> None:
+        """Hand the planned start to the appliance's own delayed start."""
+
+        delay = (planned - now).total_seconds()
+        job = self.jobs[0] if self.jobs else None
+        delay_set = False
+        try:
+            if not self._status_is_ready():
+                raise ValueError("dishwasher is not ready")
+            await self._ensure_power_on()
+            if job is not None and job.program:
+                await self._select_program(job.program)
+            if service := self.delayed_start_service:
+                domain, _, name = service.partition(".")
+                await self.hass.services.async_call(
+                    domain,
+                    name,
+                    {
+                        "delay_seconds": round(delay),
+                        "delay_minutes": round(delay / 60),
+                        "start": dt_util.as_local(planned).isoformat(),
+                    },
+                    blocking=True,
+                )
+            else:
+                await self._set_start_delay(delay)
+                delay_set = True
+                await self._press_start_button()
+        except Exception as err:  # noqa: BLE001 - any failure falls back to the tick
+            _LOGGER.warning("Delayed start failed, starting at %s instead: %s", planned, err)
+            if delay_set:
+                # The tick's start press would otherwise start with this delay.
+                await self._async_reset_start_delay(planned)
+            self.state.last_result = "delayed_start_failed"
+            self._delayed_start_skip = planned
+            self._fire_start_attempted(planned)
+            return
+
+        self.state.delayed_start_for = planned
+        self.state.delayed_start_sent_at = now
+        self.state.last_result = "delayed_start_sent"
+        self._fire_start_attempted(planned)
+        self._unsub_delayed = async_track_state_change_event(
+            self.hass, [self.status_entity], self._handle_delayed_start_status
+        )
+        _LOGGER.info("Delayed start sent for %s (in %.0f minutes)", planned, delay / 60)
+
+    async def _set_start_delay(self, delay: float) -> None:
+        entity = self.delayed_start_entity
+        state = self.hass.states.get(entity)
+        if state is None:
+            raise ValueError(f"delayed start entity {entity} not found")
+
+        if entity.startswith("select."):
+            options = [
+                (seconds, option)
+                for option in state.attributes.get("options", [])
+                if (seconds := _delay_option_seconds(str(option))) is not None
+            ]
+            if not options:
+                raise ValueError(f"no delay options on {entity}")
+            seconds, option = min(options, key=lambda item: abs(item[0] - delay))
+            if abs(seconds - delay) > DELAYED_START_MAX_ERROR_SECONDS:
+                raise ValueError(f"no option of {entity} close to {delay:.0f} s")
+            await self.hass.services.async_call(
+                "select",
+                "select_option",
+                {"entity_id": entity, "option": option},
+                blocking=True,
+            )
+            return
+
+        value = delay / self._number_unit_seconds(state)
+        try:
+            step = float(state.attributes.get("step", 1))
+        except (TypeError, ValueError):
+            step = 1.0
+        if step > 0:
+            value = round(value / step) * step
+        await self.hass.services.async_call(
+            "number", "set_value", {"entity_id": entity, "value": value}, blocking=True
+        )
+
+    async def _handle_delayed_start_status(self, event) -> None:
+        async with self._plan_lock:
+            if self.state.delayed_start_for is None or self._status_is_ready():
+                return
+            self._confirm_delayed_start()
+
+    def _confirm_delayed_start(self) -> None:
+        """The appliance took the delayed start; treat the run as started."""
+
+        planned = self.state.delayed_start_for
+        self._clear_delayed_start()
+        self.state.last_result = "delayed_start_confirmed"
+        self.state.armed = False
+        self.state.started_at = planned
+        self.state.finished_at = None
+        self.state.run_costs = self.state.plan_costs
+        job = self.jobs[0] if self.jobs else None
+        if job is not None:
+            self.jobs.remove(job)
+            self._store.async_delay_save(self._stored_data, 5)
+        self._delayed_job = job
+        if not self.jobs:
+            self._set_price_request(None)
+        self._start_run_observation(planned, job.program if job else None)
+        _LOGGER.info("Appliance confirmed the delayed start at %s", planned)
+        self._fire_started(planned, job)
+        self._notify_listeners()
+
+    def _run_in_progress(self) -> bool:
+        """Whether a run started (or is delayed on the appliance) and is not done."""
+
+        return self.state.started_at is not None and self.state.finished_at is None
+
+    def _delayed_start_pending(self) -> bool:
+        """Whether the appliance holds a delayed start that has not begun."""
+
+        started_at = self.state.started_at
+        return self.state.delayed_start_for is not None or (
+            started_at is not None and started_at > dt_util.utcnow()
+        )
+
+    async def _async_cancel_delayed_start(self) -> None:
+        """Withdraw a delayed start the appliance holds but has not begun.
+
+        The appliance gets a delay of zero; the local plan is dropped even if
+        that fails, and a confirmed run that never began is undone.
+        """
+
+        if not self._delayed_start_pending():
+            return
+        state = self.state
+        planned = state.delayed_start_for or state.started_at
+        await self._async_reset_start_delay(planned)
+
+        if state.delayed_start_for is None:
+            self._stop_run_observation()
+            state.started_at = None
+            state.finished_at = None
+            state.run_costs = None
+            if self._delayed_job is not None:
+                self.jobs.insert(0, self._delayed_job)
+                self._store.async_delay_save(self._stored_data, 5)
+                self._set_price_request(self._queue_request())
+        self._delayed_job = None
+        self._clear_delayed_start()
+        state.last_result = "delayed_start_cancelled"
+        _LOGGER.info("Cancelled the delayed start for %s", planned)
+
+    async def _async_reset_start_delay(self, planned: datetime) -> None:
+        """Set the appliance's start delay back to zero, logging any failure."""
+
+        try:
+            if service := self.delayed_start_service:
+                domain, _, name = service.partition(".")
+                await self.hass.services.async_call(
+                    domain,
+                    name,
+                    {"delay_seconds": 0, "delay_minutes": 0, "start": None},
+                    blocking=True,
+                )
+            else:
+                await self._set_start_delay(0)
+        except Exception as err:  # noqa: BLE001 - logged, the caller goes ahead
+            _LOGGER.warning(
+                "Could not reset the start delay for %s on the appliance: %s",
+                planned,
+                err,
+            )
+
+    def _clear_delayed_start(self) -> None:
+        if self._unsub_delayed:
+            self._unsub_delayed()
+            self._unsub_delayed = None
+        self.state.delayed_start_for = None
+        self.state.delayed_start_sent_at = None
+
     async def _ensure_power_on(self) -> None:
         if not self.power_switch:
             return
@@ -372,6 +1203,12 @@ class DishwasherSchedulerCoordinator:
         )
 
     async def _handle_minute_tick(self, now: datetime) -> None:
+        async with self._plan_lock:
+            lag = (dt_util.utcnow() - now).total_seconds()
+            self.metrics.tick_lag.observe(max(lag, 0.0))
+            await self._async_minute_tick(now)
+
+    async def _async_minute_tick(self, now: datetime) -> None:
         if self.state.planned_start is None and self.state.armed:
             self._recompute_planned_start()
 
@@ -380,7 +1217,27 @@ class DishwasherSchedulerCoordinator:
             self._notify_listeners()
             return
 
-        if now.strftime("%Y-%m-%d %H:%M") != planned.strftime("%Y-%m-%d %H:%M"):
+        if self.state.delayed_start_for is not None:
+            sent_at = self.state.delayed_start_sent_at
+            if (now - sent_at).total_seconds() < DELAYED_START_CONFIRM_SECONDS:
+                self._notify_listeners()
+                return
+            _LOGGER.warning(
+                "Appliance did not confirm the delayed start; starting at %s instead",
+                planned,
+            )
+            self.state.last_result = "delayed_start_unconfirmed"
+            self._delayed_start_skip = planned
+            self._clear_delayed_start()
+            await self._async_reset_start_delay(planned)
+
+        send_at = self._delayed_start_send_at(planned)
+        if send_at is not None and send_at <= now:
+            await self._async_send_delayed_start(planned, now)
+            self._notify_listeners()
+            return
+
+        if int(now.timestamp() // 60) != int(planned.timestamp() // 60):
             self._notify_listeners()
             return
 
@@ -393,137 +1250,559 @@ class DishwasherSchedulerCoordinator:
             self.state.last_result = "outside_window"
             self.state.armed = False
             _LOGGER.warning("Planned start no longer within allowed window; cancelling")
+            self._fire_start_attempted(planned)
             self._notify_listeners()
             return
 
         if not self._status_is_ready():
             self.state.last_result = "not_ready"
             _LOGGER.warning("Dishwasher not ready at planned start time")
+            self._fire_start_attempted(planned)
             self._notify_listeners()
             return
 
+        job = self.jobs[0] if self.jobs else None
         try:
             await self._ensure_power_on()
+            if job is not None and job.program:
+                await self._select_program(job.program)
             await self._press_start_button()
             self.state.last_result = "started"
             self.state.armed = False
             self.state.started_at = now
+            self.state.finished_at = None
+            self.state.run_costs = self.state.plan_costs
+            if job is not None:
+                self.jobs.remove(job)
+                self._store.async_delay_save(self._stored_data, 5)
+            if not self.jobs:
+                self._set_price_request(None)
+            self._start_run_observation(now, job.program if job else None)
             _LOGGER.info("Dishwasher start command sent successfully")
         except Exception:  # noqa: BLE001
             self.state.last_result = "start_failed"
             _LOGGER.exception("Failed to start dishwasher")
         finally:
+            self._fire_start_attempted(planned)
+            if self.state.last_result == "started":
+                self._fire_started(now, job)
             self._notify_listeners()
 
-    def _get_program_half_hours(
-        self,
-        default_half_hours: int,
-        program_durations: Optional[Mapping[str, int]] = None,
-    ) -> int:
-        """Return duration in half hours based on the current program selection."""
+    def _fire_start_attempted(self, planned: datetime) -> None:
+        self.metrics.count_start_attempt(self.state.last_result)
+        self._fire_event(
+            EVENT_START_ATTEMPTED,
+            start=planned,
+            result=self.state.last_result,
+        )
 
-        if not program_durations or not self.program_select_entity:
-            return default_half_hours
+    def _fire_started(self, started_at: datetime, job: Optional[Job]) -> None:
+        self._fire_event(
+            EVENT_STARTED,
+            start=started_at,
+            end=started_at + timedelta(minutes=self.state.planned_duration_minutes),
+            cost=self.state.planned_cost,
+            program=job.program if job and job.program else self._current_program(),
+            job_id=job.job_id if job else None,
+            reason=self.state.last_result,
+        )
 
+    def _current_program(self) -> Optional[str]:
+        if not self.program_select_entity:
+            return None
         state = self.hass.states.get(self.program_select_entity)
         if state is None:
             _LOGGER.warning(
                 "Program select entity %s not found", self.program_select_entity
             )
-            return default_half_hours
+            return None
+        if state.state in ("unknown", "unavailable"):
+            return None
+        return state.state
+
+    def _get_program_minutes(
+        self,
+        default_minutes: int,
+        program_durations: Optional[Mapping[str, int]] = None,
+    ) -> int:
+        """Return the run duration in minutes for the current program.
+
+        A runtime learned from observed runs wins over the half-hour mapping
+        passed by the caller, which wins over ``default_minutes``.
+        """
+
+        program = self._current_program()
+        learned = self.learner.estimate(program)
+        if learned is not None:
+            return learned.planning_minutes
+
+        if not program_durations or program is None:
+            return default_minutes
 
-        program = state.state
         if program in program_durations and program_durations[program] > 0:
-            return int(program_durations[program])
+            return int(program_durations[program]) * 30
 
-        _LOGGER.info(
-            "No program duration mapping found for %s; using default %s half-hours",
+        _LOGGER.debug(
+            "No program duration mapping found for %s; using default %s minutes",
             program,
-            default_half_hours,
+            default_minutes,
         )
-        return default_half_hours
+        return default_minutes
 
-    def _get_price_slots(self, price_entity: str):
+    def _get_program_power_kw(self) -> float:
+        """Average draw of the current program, learned or configured."""
+
+        learned = self.learner.estimate(self._current_program())
+        if learned is not None and learned.power_kw is not None:
+            return learned.power_kw
+        return self.program_power_kw
+
+    def _start_run_observation(
+        self, started_at: datetime, program: Optional[str] = None
+    ) -> None:
+        """Start timing a run until the status is ready again or the door opens."""
+
+        self._stop_run_observation()
+        run = RunObservation(
+            program=program or self._current_program(),
+            started_at=started_at,
+            # The status may already have changed while the start was sent.
+            left_ready=not self._status_is_ready(),
+        )
+        self._run = run
+        self._unsub_run.append(
+            async_track_state_change_event(
+                self.hass, [self.status_entity], self._handle_run_status
+            )
+        )
+        if power_sensor := self.power_sensor:
+            run.energy = EnergyIntegrator()
+            self._record_power(run, self.hass.states.get(power_sensor))
+            self._unsub_run.append(
+                async_track_state_change_event(
+                    self.hass, [power_sensor], self._handle_run_power
+                )
+            )
+
+    def _stop_run_observation(self) -> None:
+        for unsub in self._unsub_run:
+            unsub()
+        self._unsub_run = []
+        self._run = None
+
+    def _record_power(self, run: RunObservation, state) -> None:
+        if run.energy is None or state is None:
+            return
+        try:
+            value = float(state.state)
+        except (TypeError, ValueError):
+            return
+        unit = state.attributes.get("unit_of_measurement")
+        power_kw = value / 1000 if unit == "W" else value
+        # A reading from before the run holds only from the run's start on.
+        at = max(state.last_updated, run.started_at)
+        run.energy.add(at.timestamp(), max(0.0, power_kw))
+
+    async def _handle_run_power(self, event) -> None:
+        if self._run is not None:
+            self._record_power(self._run, event.data.get("new_state"))
+
+    async def _handle_run_status(self, event) -> None:
+        run = self._run
+        if run is None:
+            return
+        if not self._status_is_ready():
+            run.left_ready = True
+        elif run.left_ready:
+            new_state = event.data.get("new_state")
+            async with self._plan_lock:
+                self._finish_run_observation(
+                    new_state.last_updated if new_state else dt_util.utcnow()
+                )
+                # Queued jobs cannot wait for someone to open the door, and
+                # without a door sensor no one can.
+                if self.state.started_at is not None and (
+                    self.jobs or not self.door_sensor
+                ):
+                    self._complete_run("completed")
+
+    def _finish_run_observation(
+        self, finished_at: datetime, reason: str = "completed"
+    ) -> None:
+        """Count and announce the run, and learn from its runtime."""
+
+        run = self._run
+        self._stop_run_observation()
+        self._end_run(finished_at, reason)
+        if run is None:
+            return
+
+        minutes = (finished_at - run.started_at).total_seconds() / 60
+        if not MIN_LEARNED_RUN_MINUTES <= minutes <= MAX_LEARNED_RUN_MINUTES:
+            _LOGGER.debug("Ignoring run of %.1f minutes for learning", minutes)
+            return
+
+        energy = run.energy.finish(finished_at.timestamp()) if run.energy else None
+        estimate = self.learner.observe(run.program, minutes, energy)
+        self._store.async_delay_save(self._stored_data, 5)
+        _LOGGER.info(
+            "Observed %s run of %.0f minutes%s; now planning %s minutes",
+            run.program or "default",
+            minutes,
+            f" using {energy:.2f} kWh" if energy is not None else "",
+            estimate.planning_minutes,
+        )
+
+    def _end_run(self, finished_at: datetime, reason: str) -> None:
+        """Record and announce the started run once, when it finishes."""
+
+        started_at = self.state.started_at
+        if started_at is None or self.state.finished_at is not None:
+            return
+        self.state.finished_at = finished_at
+        cost = self._record_completed_run()
+        self._fire_event(
+            EVENT_RUN_COMPLETED,
+            start=started_at,
+            end=finished_at,
+            cost=cost,
+            reason=reason,
+        )
+
+    def _get_price_series(self, price_entity: str) -> Optional[PriceSeries]:
         st = self.hass.states.get(price_entity)
         if st is None:
             _LOGGER.warning("Price entity %s not found", price_entity)
-            return []
-
-        slots = []
-        for key in ("raw_today", "raw_tomorrow"):
-            raw = st.attributes.get(key)
-            if not isinstance(raw, list):
-                continue
-
-            for item in raw:
-                start_str = item.get("start") or item.get("hour")
-                value = item.get("value")
-                if value is None:
-                    value = item.get("price")
-                if start_str is None or value is None:
-                    continue
+            return None
 
-                start = dt_util.parse_datetime(start_str)
-                if start is None:
-                    continue
+        series = self._price_cache.get(
+            price_entity, st.last_updated, st.attributes, dt_util.DEFAULT_TIME_ZONE
+        )
+        if series is None:
+            _LOGGER.warning("Unrecognised price data format on %s", price_entity)
+        return series
 
-                try:
-                    price_value = float(value)
-                except (TypeError, ValueError):
-                    continue
+    def _get_cost_series(
+        self, price_entity: str, forecast_until: Optional[float] = None
+    ) -> Optional[PriceSeries]:
+        """Return spot prices with grid tariffs and fixed fees added.
 
-                slots.append((dt_util.as_utc(start), price_value))
+        With ``forecast_until`` missing slots up to that time are filled from
+        the price forecaster when forecasts are enabled.
+        """
 
-        slots.sort(key=lambda slot: slot[0])
-        now = dt_util.utcnow()
-        return [slot for slot in slots if slot[0] >= now]
+        series = self._get_price_series(price_entity)
+        if series is None:
+            return None
+        if self._price_history is not None:
+            self._price_history.add(price_entity, series)
+            if forecast_until is not None and self.price_forecast_enabled:
+                series = self._price_history.extend(
+                    price_entity, series, forecast_until
+                )
+        return self._get_tariff_overlay().apply(series)
+
+    def _get_co2_values(
+        self, co2_entity: str, reference: PriceSeries
+    ) -> Optional[array]:
+        """Return CO2 intensity (g/kWh) aligned with ``reference``.
+
+        Slots without a forecast use the mean of the known slots so they are
+        neither favoured nor penalised.
+        """
+
+        series = self._get_price_series(co2_entity)
+        if series is None:
+            return None
+
+        aligned = fill_gaps_with_mean(series.aligned_to(reference))
+        if aligned is None:
+            _LOGGER.warning("CO2 series from %s does not overlap prices", co2_entity)
+        return aligned
+
+    def _get_grid_import(
+        self, pv_entity: str, reference: PriceSeries, power_kw: float
+    ) -> Optional[array]:
+        """Return the extra grid import (kW) per slot caused by running the program."""
+
+        pv = self._get_price_series(pv_entity)
+        if pv is None:
+            return None
+
+        base_kw = self.base_load_kw
+        cached = self._import_cache
+        if (
+            cached
+            and cached[0] is reference
+            and cached[1] is pv
+            and cached[2:4] == (power_kw, base_kw)
+        ):
+            return cached[4]
+
+        grid_import = grid_import_profile(pv.aligned_to(reference), power_kw, base_kw)
+        self._import_cache = (reference, pv, power_kw, base_kw, grid_import)
+        return grid_import
+
+    def _price_unit(self, price_entity: str) -> Optional[str]:
+        st = self.hass.states.get(price_entity)
+        unit = st.attributes.get("unit_of_measurement") if st else None
+        return unit.split("/")[0].strip() if isinstance(unit, str) else None
 
     def _find_cheapest_window(
-        self, price_entity: str, duration_half_hours: int
-    ) -> Optional[datetime]:
-        slots = self._get_price_slots(price_entity)
-        if not slots:
+        self,
+        price_entity: str,
+        duration_minutes: int,
+        co2_entity: Optional[str] = None,
+        co2_weight: float = 0.0,
+        pv_entity: Optional[str] = None,
+        power_kw: Optional[float] = None,
+    ) -> Optional[WindowChoice]:
+        """What-if search for previews; not counted in the plan metrics.
+
+        It runs the search directly rather than through ``_run_search`` so the
+        next recorded decision is not stamped with the preview's timing.
+        """
+
+        search = self._window_search(
+            price_entity, duration_minutes, co2_entity, co2_weight, pv_entity, power_kw
+        )
+        if search is None:
+            return None
+        return self._log_window_choice(search, search.run())
+
+    def _window_search(
+        self,
+        price_entity: str,
+        duration_minutes: int,
+        co2_entity: Optional[str] = None,
+        co2_weight: float = 0.0,
+        pv_entity: Optional[str] = None,
+        power_kw: Optional[float] = None,
+    ) -> Optional[WindowSearch]:
+        """Collect the inputs of a cheapest-window search (None if impossible)."""
+
+        now_ts = dt_util.utcnow().timestamp()
+        # Look a full day ahead; forecasts fill what is not yet published.
+        horizon = now_ts + 86400 + duration_minutes * 60
+        series = self._get_cost_series(
+            price_entity, math.ceil(horizon / 900) * 900
+        )
+        available = len(series) - series.first_index_from(now_ts) if series else 0
+        if series is None or available <= 0:
             _LOGGER.warning("No price slots available from %s", price_entity)
             return None
 
-        needed_slots = duration_half_hours * 2
-        if len(slots) < needed_slots:
+        if available < slots_needed(series, duration_minutes):
             _LOGGER.warning(
-                "Not enough price slots (%s available) for %s half-hours",
-                len(slots),
-                duration_half_hours,
+                "Not enough price slots (%s available) for %s minutes",
+                available,
+                duration_minutes,
             )
             return None
 
-        best_total = None
-        best_start = None
-        duration_minutes = duration_half_hours * 30
+        if power_kw is None:
+            power_kw = self._get_program_power_kw()
+        return WindowSearch(
+            prices=series,
+            duration_minutes=duration_minutes,
+            fits=self._fits_snapshot(now_ts, series.end + duration_minutes * 60),
+            now_ts=now_ts,
+            power_kw=power_kw,
+            emissions=(
+                self._get_co2_values(co2_entity, series) if co2_entity else None
+            ),
+            co2_weight=co2_weight,
+            grid_import=(
+                self._get_grid_import(pv_entity, series, power_kw)
+                if pv_entity
+                else None
+            ),
+            unit=self._price_unit(price_entity),
+        )
+
+    def _fits_snapshot(
+        self, start_ts: float, end_ts: float
+    ) -> Callable[[float, float], bool]:
+        """Window check bound to an index covering the span, safe off the loop."""
 
-        for idx in range(len(slots) - needed_slots + 1):
-            window = slots[idx : idx + needed_slots]
-            start_dt = window[0][0]
-            if not self._within_window_span(start_dt, duration_minutes):
-                continue
+        return self._window_index_for(start_ts, end_ts).fits
 
-            total_price = sum(value for _, value in window)
-            if best_total is None or total_price < best_total:
-                best_total = total_price
-                best_start = start_dt
+    def _run_search(self, search: WindowSearch | JobSearch) -> Any:
+        began = perf_counter()
+        result = search.run()
+        self._count_search(perf_counter() - began, False)
+        return result
 
-        if best_start:
-            _LOGGER.info(
-                "Cheapest %s half-hour window starts at %s with total %.3f",
-                duration_half_hours,
-                best_start,
-                best_total,
+    async def _async_run_search(self, search: WindowSearch | JobSearch) -> Any:
+        """Run a planner search inline when small, otherwise in the executor."""
+
+        if search.work < PLAN_EXECUTOR_THRESHOLD:
+            return self._run_search(search)
+        self.offloaded_plans += 1
+        began = perf_counter()
+        result = await self.hass.async_add_executor_job(search.run)
+        self._count_search(perf_counter() - began, True)
+        return result
+
+    def _count_search(self, elapsed: float, offloaded: bool) -> None:
+        self.metrics.plan_computations += 1
+        self.metrics.plan_latency.observe(elapsed)
+        self._last_search = (elapsed * 1000, offloaded)
+
+    def _trace(
+        self,
+        outcome: str,
+        inputs: Any,
+        start: Optional[datetime] = None,
+        cost: Optional[float] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        """Record a planning decision made from ``inputs`` and the options."""
+
+        current = (*self._options_source(), inputs)
+        if len(current) != len(self._trace_inputs) or any(
+            new is not old for new, old in zip(current, self._trace_inputs)
+        ):
+            self._trace_inputs = current
+            self._inputs_version += 1
+        search_ms, offloaded = self._last_search
+        self._last_search = (None, False)
+        self.decisions.record(
+            Decision(
+                at=dt_util.utcnow().timestamp(),
+                trigger=self._plan_reason,
+                inputs_version=self._inputs_version,
+                outcome=outcome,
+                start=start,
+                cost=cost,
+                reason=reason,
+                search_ms=search_ms,
+                offloaded=offloaded,
             )
-        else:
-            _LOGGER.info(
+        )
+
+    def _plan_superseded(self) -> bool:
+        """Whether a newer plan request arrived while one was computing."""
+
+        if self._plan_queued is None:
+            return False
+        self.superseded_plans += 1
+        _LOGGER.debug("Dropping plan result superseded by a newer request")
+        self._trace("superseded", None)
+        return True
+
+    def _log_window_choice(
+        self, search: WindowSearch, choice: Optional[WindowChoice]
+    ) -> Optional[WindowChoice]:
+        if choice is None:
+            _LOGGER.debug(
                 "No valid window found inside the allowed hours (%s-%s)",
                 self.window_start,
                 self.window_end,
             )
-        return best_start
+            return None
+
+        _LOGGER.debug(
+            "Cheapest %s-minute window starts at %s with total %.3f (%s%s)",
+            search.duration_minutes,
+            choice.start,
+            choice.total_cost,
+            search.prices.source,
+            ", using forecast prices" if choice.forecast else "",
+        )
+        return choice
+
+    def preview_plan(
+        self,
+        price_entity: str,
+        program: Optional[str] = None,
+        duration_minutes: Optional[int] = None,
+        co2_entity: Optional[str] = None,
+        co2_weight: Optional[float] = None,
+        pv_entity: Optional[str] = None,
+        alternatives: int = 3,
+    ) -> dict[str, Any]:
+        """Plan a hypothetical run without touching the state or arming.
+
+        Without ``duration_minutes`` the learned runtime of ``program`` (or
+        the selected program) is used, then the default runtime.
+        """
+
+        learned = self.learner.estimate(program or self._current_program())
+        if duration_minutes is None:
+            duration_minutes = (
+                learned.planning_minutes
+                if learned is not None
+                else self.default_duration_minutes
+            )
+        power_kw = (
+            learned.power_kw
+            if learned is not None and learned.power_kw is not None
+            else self.program_power_kw
+        )
+        choice = self._find_cheapest_window(
+            price_entity,
+            duration_minutes,
+            co2_entity or self.co2_entity,
+            self.co2_weight if co2_weight is None else co2_weight,
+            pv_entity or self.pv_forecast_entity,
+            power_kw,
+        )
+
+        duration = timedelta(minutes=duration_minutes)
+        result: dict[str, Any] = {
+            "duration_minutes": duration_minutes,
+            "start": None,
+            "end": None,
+            "alternatives": [],
+        }
+        if choice is None:
+            return result
+
+        # The curve starts at the first price slot at or after now, which is
+        # the earliest start the planner considers.
+        curve = choice.costs
+        next_cost = curve.costs[0] if curve is not None and len(curve.costs) else None
+        if next_cost is not None and next_cost != next_cost:
+            next_cost = None
+        result.update(
+            start=dt_util.as_local(choice.start).isoformat(),
+            end=dt_util.as_local(choice.start + duration).isoformat(),
+            total_cost=round(choice.total_cost, 4),
+            next_slot_start=(
+                dt_util.as_local(dt_util.utc_from_timestamp(curve.start)).isoformat()
+                if curve is not None
+                else None
+            ),
+            cost_next_slot=round(next_cost, 4) if next_cost is not None else None,
+            savings=(
+                round(next_cost - choice.total_cost, 4)
+                if next_cost is not None
+                else None
+            ),
+            unit=curve.unit if curve is not None else None,
+            price_forecast=choice.forecast,
+            grid_energy_kwh=round(choice.grid_kwh, 3),
+        )
+        if choice.total_co2 is not None:
+            result["total_co2_g"] = round(choice.total_co2, 1)
+        if curve is not None and alternatives > 0:
+            # The best start comes first; CO2 weighting only affects it.
+            for start_ts, cost in ranked_starts(
+                curve, duration_minutes, self._span_fits, alternatives + 1
+            ):
+                start = dt_util.utc_from_timestamp(start_ts)
+                if start == choice.start:
+                    continue
+                result["alternatives"].append(
+                    {
+                        "start": dt_util.as_local(start).isoformat(),
+                        "end": dt_util.as_local(start + duration).isoformat(),
+                        "total_cost": round(cost, 4),
+                    }
+                )
+            del result["alternatives"][alternatives:]
+        return result
 
     async def async_schedule_from_prices(
         self,
@@ -531,28 +1810,502 @@ class DishwasherSchedulerCoordinator:
         duration_half_hours: int,
         program_durations: Optional[Mapping[str, int]] = None,
         arm: bool = True,
+        co2_entity: Optional[str] = None,
+        co2_weight: Optional[float] = None,
+        pv_entity: Optional[str] = None,
     ) -> None:
+        """Plan from prices; concurrent calls are deduplicated and coalesced.
+
+        A call identical to the one being computed shares its result. While
+        one is computing, later differing calls are coalesced: only the most
+        recent runs next and every superseded caller waits for it.
+        """
+
         duration = max(1, duration_half_hours)
-        resolved_duration = self._get_program_half_hours(duration, program_durations)
-        best_start = self._find_cheapest_window(price_entity, resolved_duration)
+        request = PriceRequest(
+            price_entity=price_entity,
+            duration_minutes=self._get_program_minutes(
+                duration * 30, program_durations
+            ),
+            co2_entity=co2_entity or self.co2_entity,
+            co2_weight=self.co2_weight if co2_weight is None else co2_weight,
+            pv_entity=pv_entity or self.pv_forecast_entity,
+        )
+        key: PlanKey = (request, arm)
+
+        if self._plan_running is not None and self._plan_running[0] == key:
+            self.coalesced_requests += 1
+            await asyncio.shield(self._plan_running[1])
+            return
+
+        if self._plan_queued is not None:
+            self.coalesced_requests += 1
+            future = self._plan_queued[1]
+            self._plan_queued = (key, future)
+            await asyncio.shield(future)
+            return
+
+        future = self.hass.loop.create_future()
+        if self._plan_running is not None:
+            self._plan_queued = (key, future)
+        else:
+            self._plan_running = (key, future)
+            self.hass.async_create_task(self._async_run_plan_requests())
+        await asyncio.shield(future)
+
+    async def _async_run_plan_requests(self) -> None:
+        """Run the current plan request, then the coalesced latest one."""
+
+        while self._plan_running is not None:
+            (request, arm), future = self._plan_running
+            try:
+                async with self._plan_lock:
+                    applied = await self._async_schedule_request(request, arm)
+            except Exception as err:  # noqa: BLE001 - handed to the callers
+                future.set_exception(err)
+            else:
+                if applied or self._plan_queued is None:
+                    future.set_result(None)
+                else:
+                    # Callers of a superseded request wait for its replacement.
+                    _chain_future(self._plan_queued[1], future)
+            self._plan_running, self._plan_queued = self._plan_queued, None
+
+    async def _async_schedule_request(self, request: PriceRequest, arm: bool) -> bool:
+        """Plan and arm for ``request``; False if a newer request superseded it."""
+
+        if self._price_history is not None and self.price_forecast_enabled:
+            await self._price_history.async_load_forecaster(
+                request.price_entity, dt_util.DEFAULT_TIME_ZONE
+            )
+
+        await self._async_cancel_delayed_start()
+        if self.jobs:
+            _LOGGER.info("Replacing %s queued jobs with a single run", len(self.jobs))
+            self.jobs = []
+            self._store.async_delay_save(self._stored_data, 5)
+        keep_current = request == self._price_request
+        self._set_price_request(request)
+        if await self._async_apply_price_plan(request, keep_current) is None:
+            return False
+        if arm:
+            self.state.armed = True
+        self._plan_reason = "price_request"
+        self._notify_listeners()
+        return True
+
+    def _apply_price_plan(
+        self, request: PriceRequest, keep_current: bool = False
+    ) -> bool:
+        """Plan ``request`` against the current prices and update the state.
+
+        With ``keep_current`` an existing plan for the same request is kept
+        unless the new start is cheaper by the configured margin. Returns
+        whether the planned start changed.
+        """
+
+        if self.jobs:
+            search = self._job_search(request)
+            return self._apply_job_choices(
+                search, self._run_search(search) if search else None
+            )
+
+        search = self._request_search(request)
+        choice = (
+            self._log_window_choice(search, self._run_search(search))
+            if search
+            else None
+        )
+        return self._apply_choice(search, request, choice, keep_current)
+
+    async def _async_apply_price_plan(
+        self, request: PriceRequest, keep_current: bool = False
+    ) -> Optional[bool]:
+        """Like ``_apply_price_plan``, running large searches in the executor.
+
+        Inputs are captured on the loop before the search and the state is
+        only updated afterwards. Returns None, leaving the state untouched,
+        when a newer plan request arrived in the meantime.
+        """
+
+        if self.jobs:
+            job_search = self._job_search(request)
+            result = (
+                await self._async_run_search(job_search) if job_search else None
+            )
+            if self._plan_superseded():
+                return None
+            return self._apply_job_choices(job_search, result)
+
+        search = self._request_search(request)
+        choice = None
+        if search is not None:
+            choice = self._log_window_choice(
+                search, await self._async_run_search(search)
+            )
+        if self._plan_superseded():
+            return None
+        return self._apply_choice(search, request, choice, keep_current)
+
+    def _request_search(self, request: PriceRequest) -> Optional[WindowSearch]:
+        spot = self._get_price_series(request.price_entity)
+        request.prices_end = spot.end if spot is not None else math.nan
+        return self._window_search(
+            request.price_entity,
+            request.duration_minutes,
+            request.co2_entity,
+            request.co2_weight,
+            request.pv_entity,
+        )
+
+    def _apply_choice(
+        self,
+        search: Optional[WindowSearch],
+        request: PriceRequest,
+        choice: Optional[WindowChoice],
+        keep_current: bool,
+    ) -> bool:
+        prices = search.prices if search else None
+        if keep_current and choice is not None and self._keep_current_plan(choice):
+            self._trace(
+                "kept",
+                prices,
+                start=self.state.planned_start,
+                cost=self.state.planned_cost,
+                reason="below_replan_threshold",
+            )
+            return False
+
+        previous = self.state.planned_start
+        self._clear_plan_details()
+        if choice is None:
+            self.state.planned_start = None
+            self.state.planned_end = None
+            self._trace(
+                "cleared",
+                prices,
+                reason="no_window" if search is not None else "no_prices",
+            )
+            return previous is not None
+
+        self.state.planned_start = choice.start
+        self.state.planned_duration_minutes = request.duration_minutes
+        self.state.planned_end = choice.start + timedelta(
+            minutes=self.state.planned_duration_minutes
+        )
+        self.state.planned_cost = choice.total_cost
+        self.state.planned_co2 = choice.total_co2
+        self.state.planned_grid_kwh = choice.grid_kwh
+        self.state.plan_costs = choice.costs
+        self.state.planned_from_forecast = choice.forecast
+        self._trace(
+            "planned",
+            prices,
+            start=choice.start,
+            cost=choice.total_cost,
+            reason="forecast_prices" if choice.forecast else None,
+        )
+        return previous != choice.start
+
+    def _job_spec(self, job: Job) -> JobSpec:
+        """Duration, draw and deadline to plan ``job`` with.
+
+        An explicit duration wins over the learned runtime of the program.
+        """
+
+        learned = self.learner.estimate(job.program or self._current_program())
+        if job.duration_minutes:
+            minutes = job.duration_minutes
+        elif learned is not None:
+            minutes = learned.planning_minutes
+        else:
+            minutes = self.default_duration_minutes
+        power_kw = (
+            learned.power_kw
+            if learned is not None and learned.power_kw is not None
+            else self.program_power_kw
+        )
+        return JobSpec(
+            duration_minutes=minutes,
+            power_kw=power_kw,
+            deadline=job.deadline.timestamp() if job.deadline else None,
+        )
+
+    def _queue_request(self) -> PriceRequest:
+        head = self.jobs[0]
+        return PriceRequest(
+            price_entity=head.price_entity,
+            duration_minutes=self._job_spec(head).duration_minutes,
+        )
+
+    def _job_search(self, request: PriceRequest) -> Optional[JobSearch]:
+        """Collect the inputs for planning every queued job jointly.
 
-        if best_start is None:
+        The planner picks the run order. CO2 weighting, PV surplus and
+        replan hysteresis apply to single runs only.
+        """
+
+        specs = tuple(self._job_spec(job) for job in self.jobs)
+        now_ts = dt_util.utcnow().timestamp()
+        horizon = now_ts + 86400 + sum(spec.duration_minutes for spec in specs) * 60
+        series = self._get_cost_series(
+            request.price_entity, math.ceil(horizon / 900) * 900
+        )
+        spot = self._get_price_series(request.price_entity)
+        request.prices_end = spot.end if spot is not None else math.nan
+        if series is None:
+            return None
+        longest = max(spec.duration_minutes for spec in specs)
+        return JobSearch(
+            prices=series,
+            jobs=specs,
+            fits=self._fits_snapshot(now_ts, series.end + longest * 60),
+            now_ts=now_ts,
+            unit=self._price_unit(request.price_entity),
+        )
+
+    def _apply_job_choices(
+        self,
+        search: Optional[JobSearch],
+        result: Optional[tuple[tuple[int, ...], list[WindowChoice]]],
+    ) -> bool:
+        """Put the joint plan of the queued jobs in the state, head job first.
+
+        The queue is reordered into the planned run order, so the head job
+        is always the one that starts next.
+        """
+
+        previous = self.state.planned_start
+        self._clear_plan_details()
+        if search is None or result is None:
             self.state.planned_start = None
             self.state.planned_end = None
+            _LOGGER.warning(
+                "Cannot fit %s queued jobs into the allowed windows and deadlines",
+                len(self.jobs),
+            )
+            self._trace(
+                "cleared",
+                search.prices if search else None,
+                reason="jobs_do_not_fit" if search is not None else "no_prices",
+            )
+            return previous is not None
+
+        order, choices = result
+        if order != tuple(range(len(order))) and len(order) == len(self.jobs):
+            self.jobs = [self.jobs[i] for i in order]
+            self._store.async_delay_save(self._stored_data, 5)
+        head = choices[0]
+        minutes = search.jobs[order[0]].duration_minutes
+        self.state.planned_start = head.start
+        self.state.planned_duration_minutes = minutes
+        self.state.planned_end = head.start + timedelta(minutes=minutes)
+        self.state.planned_cost = head.total_cost
+        self.state.planned_grid_kwh = head.grid_kwh
+        self.state.plan_costs = head.costs
+        self.state.planned_from_forecast = head.forecast
+        self.state.job_plan = list(zip(self.jobs, choices))
+        _LOGGER.debug(
+            "Planned %s queued jobs for a total of %.3f; next starts at %s",
+            len(choices),
+            sum(choice.total_cost for choice in choices),
+            head.start,
+        )
+        self._trace(
+            "planned",
+            search.prices,
+            start=head.start,
+            cost=head.total_cost,
+            reason="job_queue",
+        )
+        return previous != head.start
+
+    async def async_add_job(
+        self,
+        price_entity: str,
+        program: Optional[str] = None,
+        duration_minutes: Optional[int] = None,
+        deadline: Optional[datetime] = None,
+        arm: bool = True,
+    ) -> Job:
+        """Append a job to the queue and replan all queued jobs."""
+
+        job = Job(
+            job_id=uuid.uuid4().hex[:8],
+            price_entity=price_entity,
+            program=program,
+            duration_minutes=duration_minutes,
+            deadline=dt_util.as_utc(deadline) if deadline else None,
+        )
+        async with self._plan_lock:
+            if self._price_history is not None and self.price_forecast_enabled:
+                await self._price_history.async_load_forecaster(
+                    price_entity, dt_util.DEFAULT_TIME_ZONE
+                )
+            self.jobs.append(job)
+            self._store.async_delay_save(self._stored_data, 5)
+            # A running job, or one handed to the appliance's delayed start,
+            # is planned around once it has completed.
+            if self.state.started_at is None and self.state.delayed_start_for is None:
+                await self._async_plan_queue()
+                if arm:
+                    self.state.armed = True
+            self._plan_reason = "job_queue"
+            self._notify_listeners()
+        return job
+
+    async def async_remove_jobs(self, job_id: Optional[str] = None) -> None:
+        """Remove one queued job, or all of them without ``job_id``."""
+
+        async with self._plan_lock:
+            before = len(self.jobs)
+            self.jobs = [
+                job for job in self.jobs if job_id is not None and job.job_id != job_id
+            ]
+            if len(self.jobs) == before:
+                return
+            self._store.async_delay_save(self._stored_data, 5)
+            if self.state.started_at is None and self.state.delayed_start_for is None:
+                if self.jobs:
+                    await self._async_plan_queue()
+                else:
+                    self._set_price_request(None)
+                    self._recompute_planned_start()
+            self._plan_reason = "job_queue"
             self._notify_listeners()
+
+    def _plan_queue(self) -> None:
+        request = self._queue_request()
+        self._set_price_request(request)
+        self._apply_price_plan(request)
+
+    async def _async_plan_queue(self) -> None:
+        request = self._queue_request()
+        self._set_price_request(request)
+        await self._async_apply_price_plan(request)
+
+    def _keep_current_plan(self, choice: WindowChoice) -> bool:
+        """Apply replan hysteresis; refresh the kept plan's costs if kept."""
+
+        state = self.state
+        current = state.planned_start
+        if (
+            current is None
+            or current == choice.start
+            or choice.costs is None
+            or current <= dt_util.utcnow()
+            or not self._within_window_span(current, state.planned_duration_minutes)
+        ):
+            return False
+        current_cost = choice.costs.cost_at(current)
+        current_score = choice.costs.score_at(current)
+        new_score = choice.costs.score_at(choice.start)
+        if current_cost is None or current_score is None or new_score is None:
+            return False
+
+        # Compare on the score the search ranked by, so a greener start that
+        # costs a little more is not held back by a negative saving.
+        threshold = max(
+            self.replan_min_savings,
+            abs(current_cost) * self.replan_min_savings_percent / 100,
+        )
+        savings = current_score - new_score
+        if threshold <= 0 or savings >= threshold:
+            return False
+
+        state.suppressed_replans += 1
+        state.planned_cost = current_cost
+        state.plan_costs = choice.costs
+        state.planned_from_forecast = choice.costs.uses_forecast(
+            current, state.planned_duration_minutes
+        )
+        _LOGGER.debug(
+            "Keeping planned start %s: moving to %s saves only %.4f (threshold %.4f)",
+            current,
+            choice.start,
+            savings,
+            threshold,
+        )
+        return True
+
+    def _set_price_request(self, request: Optional[PriceRequest]) -> None:
+        """Remember the price plan request and follow its price entity."""
+
+        previous = self._price_request
+        self._price_request = request
+        if (
+            previous is not None
+            and request is not None
+            and previous.price_entity == request.price_entity
+        ):
             return
+        if self.unsub_prices:
+            self.unsub_prices()
+            self.unsub_prices = None
+        if request is not None:
+            self.unsub_prices = async_track_state_change_event(
+                self.hass, [request.price_entity], self._handle_price_update
+            )
+            if request.price_entity not in self._archived_prices:
+                self._archive_prices_of(request.price_entity)
+                self._store.async_delay_save(self._stored_data, 5)
 
-        self.state.planned_start = best_start
-        self.state.planned_duration_minutes = resolved_duration * 30
-        self.state.planned_end = best_start + timedelta(
-            minutes=self.state.planned_duration_minutes
+    def _archive_prices_of(self, price_entity: str) -> None:
+        """Archive slots of ``price_entity`` as it publishes them, from now on."""
+
+        self._archived_prices[price_entity] = async_track_state_change_event(
+            self.hass, [price_entity], self._handle_archived_price
         )
-        if arm:
-            self.state.armed = True
-        self._notify_listeners()
+        self._archive_price_state(price_entity)
+
+    @callback
+    def _handle_archived_price(self, event) -> None:
+        if event.data.get("new_state") is not None:
+            self._archive_price_state(event.data["entity_id"])
+
+    def _archive_price_state(self, price_entity: str) -> None:
+        if self._price_history is None or self.hass.states.get(price_entity) is None:
+            return
+        series = self._get_price_series(price_entity)
+        if series is not None:
+            self._price_history.add(price_entity, series)
+
+    async def _handle_price_update(self, event) -> None:
+        async with self._plan_lock:
+            await self._async_price_update()
+
+    async def _async_price_update(self) -> None:
+        request = self._price_request
+        if (
+            request is None
+            or self._run_in_progress()
+            or self.state.delayed_start_for is not None
+        ):
+            return
+
+        spot = self._get_price_series(request.price_entity)
+        if spot is None or spot.end == request.prices_end:
+            # Only the current price changed; the published range is the same.
+            return
+
+        _LOGGER.info(
+            "New prices published on %s; replanning%s",
+            request.price_entity,
+            " (plan used forecast prices)" if self.state.planned_from_forecast else "",
+        )
+        # A kept plan still gets the new prices' cost, so notify either way.
+        if await self._async_apply_price_plan(request, keep_current=True) is not None:
+            self._plan_reason = "prices_published"
+            self._notify_listeners()
 
     async def _handle_door_event(self, event) -> None:
-        if not self.state.started_at:
+        async with self._plan_lock:
+            self._door_event(event)
+
+    def _door_event(self, event) -> None:
+        started_at = self.state.started_at
+        if not started_at or dt_util.utcnow() < started_at:
+            # Opening the door during a delayed start does not end a run.
             return
 
         new_state = event.data.get("new_state")
@@ -562,10 +2315,30 @@ class DishwasherSchedulerCoordinator:
         if new_state.state.lower() != "on":
             return
 
+        self._complete_run("reset_on_door_open")
+
+    def _complete_run(self, result: str) -> None:
+        """Reset after a run and move on to the next queued job, if any."""
+
         self.state.armed = False
         self.state.planned_start = None
         self.state.planned_end = None
+        self._clear_plan_details()
+        self._set_price_request(None)
+        self._finish_run_observation(dt_util.utcnow(), result)
+        self._clear_delayed_start()
+        self._delayed_job = None
         self.state.started_at = None
-        self.state.last_result = "reset_on_door_open"
-        _LOGGER.info("Dishwasher cycle complete; schedule reset after door opened")
+        self.state.finished_at = None
+        self.state.last_result = result
+        _LOGGER.info("Dishwasher cycle complete; schedule reset (%s)", result)
+        self._plan_reason = "run_completed"
+        if self.jobs:
+            self._plan_queue()
+            self.state.armed = self.state.planned_start is not None
+            _LOGGER.info(
+                "Advanced job queue; %s jobs left, next start %s",
+                len(self.jobs),
+                self.state.planned_start,
+            )
         self._notify_listeners()
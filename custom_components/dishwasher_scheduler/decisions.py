@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterator, Optional
+
+
+@dataclass(frozen=True)
+class Decision:
+    """One planning decision, kept raw so recording it costs no formatting.
+
+    ``inputs_version`` changes whenever the options or the price series the
+    plan was made from changed, so repeated decisions on the same inputs can
+    be told apart from replans caused by new data.
+    """
+
+    at: float
+    trigger: str
+    inputs_version: int
+    outcome: str
+    start: Optional[datetime] = None
+    cost: Optional[float] = None
+    reason: Optional[str] = None
+    search_ms: Optional[float] = None
+    offloaded: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "at": datetime.fromtimestamp(self.at, timezone.utc).isoformat(),
+            "trigger": self.trigger,
+            "inputs_version": self.inputs_version,
+            "outcome": self.outcome,
+            "start": self.start.isoformat() if self.start else None,
+            "cost": round(self.cost, 4) if self.cost is not None else None,
+            "reason": self.reason,
+            "search_ms": (
+                round(self.search_ms, 3) if self.search_ms is not None else None
+            ),
+            "offloaded": self.offloaded,
+        }
+
+
+class DecisionTrace:
+    """Fixed-size ring buffer of the most recent planning decisions."""
+
+    def __init__(self, size: int) -> None:
+        self._decisions: deque[Decision] = deque(maxlen=size)
+        self.recorded = 0
+
+    def record(self, decision: Decision) -> None:
+        self._decisions.append(decision)
+        self.recorded += 1
+
+    def __len__(self) -> int:
+        return len(self._decisions)
+
+    def __iter__(self) -> Iterator[Decision]:
+        return iter(self._decisions)
+
+    def as_list(self, limit: Optional[int] = None) -> list[dict[str, Any]]:
+        """Return the newest ``limit`` decisions (all by default), oldest first."""
+
+        decisions = list(self._decisions)
+        if limit is not None:
+            decisions = decisions[-limit:] if limit > 0 else []
+        return [decision.as_dict() for decision in decisions]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import DishwasherSchedulerCoordinator
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat() if value is not None else None
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the plan state, counters and recent planning decisions."""
+
+    coordinator: DishwasherSchedulerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    state = coordinator.state
+    return {
+        "data": dict(entry.data),
+        "options": dict(entry.options),
+        "state": {
+            "armed": state.armed,
+            "planned_start": _isoformat(state.planned_start),
+            "planned_end": _isoformat(state.planned_end),
+            "planned_cost": state.planned_cost,
+            "last_attempt": _isoformat(state.last_attempt),
+            "last_result": state.last_result,
+            "suppressed_replans": state.suppressed_replans,
+            "delayed_start_for": _isoformat(state.delayed_start_for),
+            "jobs": [job.as_dict() for job in coordinator.jobs],
+        },
+        "counters": {
+            "coalesced_requests": coordinator.coalesced_requests,
+            "offloaded_plans": coordinator.offloaded_plans,
+            "superseded_plans": coordinator.superseded_plans,
+            "state_writes": coordinator.state_writes,
+            "decisions_recorded": coordinator.decisions.recorded,
+        },
+        "decisions": coordinator.decisions.as_list(),
+    }
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+from datetime import datetime
+from typing import Awaitable, Callable, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_DISPATCHER, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DueCallback = Callable[[datetime], Awaitable[None]]
+
+
+class SchedulerDispatcher:
+    """Shared timer for all scheduler entries.
+
+    Each entry reports its next due time; the dispatcher keeps them in a heap
+    and arms a single Home Assistant timer for the earliest one, so the timer
+    cost does not grow with the number of configured appliances.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._callbacks: dict[str, DueCallback] = {}
+        self._due: dict[str, tuple[float, int]] = {}
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._unsub_timer: Optional[Callable[[], None]] = None
+        self._armed_for: Optional[float] = None
+
+    def register(self, key: str, due_callback: DueCallback) -> Callable[[], None]:
+        """Register an entry callback and return an unregister callback."""
+
+        self._callbacks[key] = due_callback
+
+        def _remove() -> None:
+            self._callbacks.pop(key, None)
+            self.schedule(key, None)
+
+        return _remove
+
+    @callback
+    def schedule(self, key: str, due: Optional[datetime]) -> None:
+        """Set (or clear with None) the next due time for an entry."""
+
+        if due is None:
+            if self._due.pop(key, None) is not None:
+                self._arm()
+            return
+
+        due_ts = due.timestamp()
+        current = self._due.get(key)
+        if current is not None and current[0] == due_ts:
+            return
+
+        seq = next(self._seq)
+        self._due[key] = (due_ts, seq)
+        heapq.heappush(self._heap, (due_ts, seq, key))
+        self._arm()
+
+    def next_due(self) -> Optional[float]:
+        heap = self._heap
+        # Drop superseded or cleared entries lazily.
+        while heap and self._due.get(heap[0][2]) != (heap[0][0], heap[0][1]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    @callback
+    def _arm(self) -> None:
+        due_ts = self.next_due()
+        if due_ts == self._armed_for:
+            return
+
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_for = due_ts
+        if due_ts is None:
+            return
+
+        self._unsub_timer = async_track_point_in_utc_time(
+            self.hass, self._handle_timer, dt_util.utc_from_timestamp(due_ts)
+        )
+
+    async def _handle_timer(self, now: datetime) -> None:
+        self._unsub_timer = None
+        self._armed_for = None
+        now_ts = now.timestamp()
+
+        due_keys: list[str] = []
+        while (due_ts := self.next_due()) is not None and due_ts <= now_ts:
+            _, _, key = heapq.heappop(self._heap)
+            del self._due[key]
+            due_keys.append(key)
+
+        keys = [key for key in due_keys if key in self._callbacks]
+        if keys:
+            results = await asyncio.gather(
+                *(self._callbacks[key](now) for key in keys), return_exceptions=True
+            )
+            for key, result in zip(keys, results):
+                if isinstance(result, Exception):
+                    _LOGGER.error(
+                        "Scheduler callback for %s failed",
+                        key,
+                        exc_info=result,
+                    )
+        self._arm()
+
+    @callback
+    def async_shutdown(self) -> None:
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_for = None
+        self._callbacks.clear()
+        self._due.clear()
+        self._heap.clear()
+
+
+@callback
+def async_get_dispatcher(hass: HomeAssistant) -> SchedulerDispatcher:
+    """Return the domain-wide dispatcher, creating it on first use."""
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    dispatcher = domain_data.get(DATA_DISPATCHER)
+    if dispatcher is None:
+        dispatcher = domain_data[DATA_DISPATCHER] = SchedulerDispatcher(hass)
+    return dispatcher
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo, Entity
+
+from .const import DOMAIN, INTEGRATION_VERSION
+from .coordinator import DishwasherSchedulerCoordinator
+
+
+class SchedulerEntity(Entity):
+    """Entity that mirrors the scheduler coordinator.
+
+    Coordinator updates are only written when the entity's state or
+    attributes changed since the last write.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: DishwasherSchedulerCoordinator) -> None:
+        self.coordinator = coordinator
+        self._written: Optional[tuple[Any, Any]] = None
+
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
+            name="Dishwasher Scheduler",
+            manufacturer="Custom",
+            model="Scheduler",
+            sw_version=INTEGRATION_VERSION,
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        snapshot = (self.state, self.extra_state_attributes)
+        if snapshot == self._written:
+            return
+        self._written = snapshot
+        self.coordinator.state_writes += 1
+        self.async_write_ha_state()
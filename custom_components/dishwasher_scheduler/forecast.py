@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import replace
+from datetime import datetime, tzinfo
+
+from .price_sources import PriceSeries
+
+HOURS_PER_WEEK = 7 * 24
+
+
+class SeasonalForecaster:
+    """Seasonal price forecast from an EWMA per local hour of the week.
+
+    Each observed slot updates the average for its weekday and hour; hours
+    never seen on that weekday fall back to the average for the hour across
+    all weekdays. ``alpha`` is the weight of one hour of new data, so
+    quarter-hourly slots each use a proportionally smaller weight.
+    """
+
+    def __init__(self, tz: tzinfo, alpha: float = 0.3) -> None:
+        self.tz = tz
+        self.alpha = alpha
+        self.weekly = array("d", [math.nan]) * HOURS_PER_WEEK
+        self.daily = array("d", [math.nan]) * 24
+        self.last_ts = -math.inf
+        self.samples = 0
+
+    def _bucket(self, ts: float) -> tuple[int, int]:
+        local = datetime.fromtimestamp(ts, self.tz)
+        return local.weekday() * 24 + local.hour, local.hour
+
+    def update(self, series: PriceSeries) -> int:
+        """Fold in slots newer than the last one seen; returns slots used."""
+
+        if not len(series) or series.end - series.step <= self.last_ts:
+            return 0
+
+        alpha = 1 - (1 - self.alpha) ** (series.step / 3600)
+        first = (
+            series.first_index_from(self.last_ts + 1)
+            if self.last_ts > -math.inf
+            else 0
+        )
+        used = 0
+        for index in range(first, len(series)):
+            value = series.values[index]
+            if value != value:
+                continue
+            ts = series.slot_start(index)
+            weekly, hour = self._bucket(ts)
+            for levels, bucket in ((self.weekly, weekly), (self.daily, hour)):
+                level = levels[bucket]
+                levels[bucket] = (
+                    value if level != level else level + alpha * (value - level)
+                )
+            self.last_ts = ts
+            used += 1
+        self.samples += used
+        return used
+
+    def predict(self, ts: float) -> float:
+        """Return the forecast for the slot starting at ``ts`` (NaN if unknown)."""
+
+        weekly, hour = self._bucket(ts)
+        level = self.weekly[weekly]
+        return level if level == level else self.daily[hour]
+
+    def extend(self, series: PriceSeries, until: float) -> PriceSeries:
+        """Return ``series`` extended with forecast slots up to ``until``.
+
+        The result's ``forecast_from`` marks where real prices end.
+        """
+
+        missing = math.ceil((until - series.end) / series.step)
+        if missing <= 0 or not self.samples:
+            return series
+        values = array("d", series.values)
+        values.extend(
+            self.predict(series.end + offset * series.step)
+            for offset in range(missing)
+        )
+        return replace(series, values=values, forecast_from=series.end)
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_METRICS_VIEW, DOMAIN, METRICS_URL
+from .coordinator import DishwasherSchedulerCoordinator
+from .metrics import PrometheusText
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@callback
+def async_register_http_views(hass: HomeAssistant) -> None:
+    """Register the metrics view once; views cannot be removed again."""
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if domain_data.get(DATA_METRICS_VIEW):
+        return
+    hass.http.register_view(SchedulerMetricsView(hass))
+    domain_data[DATA_METRICS_VIEW] = True
+
+
+def render_metrics(coordinators: list[DishwasherSchedulerCoordinator]) -> str:
+    out = PrometheusText(DOMAIN)
+    for coordinator in coordinators:
+        entry = coordinator.entry.entry_id
+        metrics = coordinator.metrics
+        out.counter(
+            "plan_computations_total",
+            "Planner searches run.",
+            metrics.plan_computations,
+            entry_id=entry,
+        )
+        out.histogram(
+            "plan_latency_seconds",
+            "Wall time of planner searches, including executor hand-off.",
+            metrics.plan_latency,
+            entry_id=entry,
+        )
+        out.counter(
+            "plans_offloaded_total",
+            "Planner searches run in the executor.",
+            coordinator.offloaded_plans,
+            entry_id=entry,
+        )
+        out.counter(
+            "plans_superseded_total",
+            "Plan results dropped for a newer request.",
+            coordinator.superseded_plans,
+            entry_id=entry,
+        )
+        out.counter(
+            "price_cache_hits_total",
+            "Price series served from the parse cache.",
+            coordinator.price_cache.hits,
+            entry_id=entry,
+        )
+        out.counter(
+            "price_cache_misses_total",
+            "Price sensor states parsed into a series.",
+            coordinator.price_cache.misses,
+            entry_id=entry,
+        )
+        out.histogram(
+            "tick_lag_seconds",
+            "Delay between a tick's due time and its handling.",
+            metrics.tick_lag,
+            entry_id=entry,
+        )
+        out.counter(
+            "state_writes_total",
+            "Entity state writes.",
+            coordinator.state_writes,
+            entry_id=entry,
+        )
+        for result, count in sorted(metrics.start_attempts.items()):
+            out.counter(
+                "start_attempts_total",
+                "Start attempts by result.",
+                count,
+                entry_id=entry,
+                result=result,
+            )
+        out.histogram(
+            "start_press_seconds",
+            "Latency of the start button press service call.",
+            metrics.start_press_latency,
+            entry_id=entry,
+        )
+    return out.render()
+
+
+class SchedulerMetricsView(HomeAssistantView):
+    """Serve the scheduler counters in the Prometheus text format."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+
+    async def get(self, request: web.Request) -> web.Response:
+        coordinators = [
+            value
+            for value in self.hass.data.get(DOMAIN, {}).values()
+            if isinstance(value, DishwasherSchedulerCoordinator)
+        ]
+        return web.Response(
+            body=render_metrics(coordinators).encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
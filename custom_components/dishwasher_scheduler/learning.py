@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any, Mapping, Optional
+
+# Key used when no program selector is configured or its state is unknown.
+DEFAULT_PROGRAM = "default"
+
+# z-score of the planning quantile (~80th percentile of observed runtimes).
+PLANNING_QUANTILE_Z = 0.84
+
+
+@dataclass
+class ProgramEstimate:
+    """Exponentially weighted runtime and energy statistics of one program."""
+
+    runs: int = 0
+    duration_mean: float = 0.0
+    duration_var: float = 0.0
+    energy_mean: Optional[float] = None
+    energy_runs: int = 0
+
+    def observe(
+        self, minutes: float, energy_kwh: Optional[float], alpha: float
+    ) -> None:
+        # The first runs are averaged plainly so early estimates are not
+        # dominated by a single observation.
+        weight = max(alpha, 1 / (self.runs + 1))
+        delta = minutes - self.duration_mean
+        self.duration_mean += weight * delta
+        self.duration_var = (1 - weight) * (self.duration_var + weight * delta * delta)
+        self.runs += 1
+
+        if energy_kwh is not None:
+            weight = max(alpha, 1 / (self.energy_runs + 1))
+            if self.energy_mean is None:
+                self.energy_mean = energy_kwh
+            else:
+                self.energy_mean += weight * (energy_kwh - self.energy_mean)
+            self.energy_runs += 1
+
+    @property
+    def planning_minutes(self) -> int:
+        """Runtime to plan with: the mean plus a margin for run-to-run spread."""
+
+        return math.ceil(
+            self.duration_mean + PLANNING_QUANTILE_Z * math.sqrt(self.duration_var)
+        )
+
+    @property
+    def power_kw(self) -> Optional[float]:
+        """Average draw over a run, from the learned energy and runtime."""
+
+        if self.energy_mean is None or self.duration_mean <= 0:
+            return None
+        return self.energy_mean / (self.duration_mean / 60)
+
+
+@dataclass
+class ProgramLearner:
+    """Per-program runtime and energy estimates learned from observed runs."""
+
+    alpha: float = 0.3
+    min_runs: int = 2
+    programs: dict[str, ProgramEstimate] = field(default_factory=dict)
+
+    def observe(
+        self, program: Optional[str], minutes: float, energy_kwh: Optional[float] = None
+    ) -> ProgramEstimate:
+        estimate = self.programs.setdefault(
+            program or DEFAULT_PROGRAM, ProgramEstimate()
+        )
+        estimate.observe(minutes, energy_kwh, self.alpha)
+        return estimate
+
+    def estimate(self, program: Optional[str]) -> Optional[ProgramEstimate]:
+        """Return the estimate for ``program`` once enough runs were seen."""
+
+        estimate = self.programs.get(program or DEFAULT_PROGRAM)
+        if estimate is None or estimate.runs < self.min_runs:
+            return None
+        return estimate
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: asdict(estimate) for name, estimate in self.programs.items()}
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> "ProgramLearner":
+        return cls(
+            programs={
+                str(name): ProgramEstimate(**values)
+                for name, values in raw.items()
+                if isinstance(values, Mapping)
+            }
+        )
+
+
+class EnergyIntegrator:
+    """Integrate power readings (kW) over time into energy (kWh)."""
+
+    def __init__(self) -> None:
+        self.energy_kwh = 0.0
+        self.samples = 0
+        self._last_ts: Optional[float] = None
+        self._last_kw = 0.0
+
+    def add(self, ts: float, power_kw: float) -> None:
+        # Power sensors report on change, so the previous reading holds until now.
+        if self._last_ts is not None and ts > self._last_ts:
+            self.energy_kwh += self._last_kw * (ts - self._last_ts) / 3600
+        self._last_ts = ts
+        self._last_kw = power_kw
+        self.samples += 1
+
+    def finish(self, ts: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        self.add(ts, self._last_kw)
+        return self.energy_kwh
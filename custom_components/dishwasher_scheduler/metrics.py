@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Iterable, Union
+
+# Upper bounds (seconds) of the latency histogram buckets.
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 5.0)
+# Upper bounds (seconds) of the tick lag histogram buckets.
+LAG_BUCKETS = (0.005, 0.025, 0.1, 0.5, 1.0, 5.0, 30.0, 60.0)
+
+
+class Histogram:
+    """Histogram with fixed bucket bounds, made cumulative when exported."""
+
+    def __init__(self, buckets: Iterable[float]) -> None:
+        self.buckets = tuple(buckets)
+        # One count per bucket plus the +Inf bucket; kept non-cumulative so
+        # an observation is a single increment.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class SchedulerMetrics:
+    """Performance counters of one scheduler entry.
+
+    Updating a counter is a plain increment; nothing is formatted until the
+    metrics endpoint is scraped.
+    """
+
+    def __init__(self) -> None:
+        self.plan_computations = 0
+        self.plan_latency = Histogram(LATENCY_BUCKETS)
+        self.tick_lag = Histogram(LAG_BUCKETS)
+        self.start_press_latency = Histogram(LATENCY_BUCKETS)
+        self.start_attempts: dict[str, int] = {}
+
+    def count_start_attempt(self, result: str) -> None:
+        self.start_attempts[result] = self.start_attempts.get(result, 0) + 1
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + inner + "}"
+
+
+def _number(value: Union[int, float]) -> str:
+    if isinstance(value, float):
+        if value == float("inf"):
+            return "+Inf"
+        return repr(value)
+    return str(value)
+
+
+class PrometheusText:
+    """Collect samples per metric family and render the text exposition format."""
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self._families: dict[str, tuple[str, str, list[str]]] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> tuple[str, list[str]]:
+        name = f"{self.prefix}_{name}"
+        family = self._families.get(name)
+        if family is None:
+            family = self._families[name] = (kind, help_text, [])
+        return name, family[2]
+
+    def counter(
+        self, name: str, help_text: str, value: Union[int, float], **labels: str
+    ) -> None:
+        name, samples = self._family(name, "counter", help_text)
+        samples.append(f"{name}{_labels(labels)} {_number(value)}")
+
+    def histogram(
+        self, name: str, help_text: str, histogram: Histogram, **labels: str
+    ) -> None:
+        name, samples = self._family(name, "histogram", help_text)
+        cumulative = 0
+        bounds = (*histogram.buckets, float("inf"))
+        for bound, count in zip(bounds, histogram.counts):
+            cumulative += count
+            bucket_labels = {**labels, "le": _number(float(bound))}
+            samples.append(f"{name}_bucket{_labels(bucket_labels)} {cumulative}")
+        samples.append(f"{name}_sum{_labels(labels)} {_number(histogram.sum)}")
+        samples.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name, (kind, help_text, samples) in self._families.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        return "\n".join(lines) + "\n"
@@ -4,15 +4,15 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     CONF_DEFAULT_DURATION_MINUTES,
     DOMAIN,
-    INTEGRATION_VERSION,
 )
 from .coordinator import DishwasherSchedulerCoordinator
+from .entity import SchedulerEntity
 
 
 async def async_setup_entry(
@@ -27,9 +27,7 @@ async def async_setup_entry(
     )
 
 
-class DurationMinutesHelper(NumberEntity):
-    _attr_has_entity_name = True
-    _attr_should_poll = False
+class DurationMinutesHelper(SchedulerEntity, NumberEntity):
     _attr_entity_category = EntityCategory.CONFIG
     _attr_name = "Default runtime"
     _attr_native_min_value = 1
@@ -38,26 +36,11 @@ class DurationMinutesHelper(NumberEntity):
     _attr_mode = NumberMode.BOX
 
     def __init__(self, coordinator: DishwasherSchedulerCoordinator) -> None:
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_unique_id = (
             f"{coordinator.entry.entry_id}_{CONF_DEFAULT_DURATION_MINUTES}"
         )
 
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
-            name="Dishwasher Scheduler",
-            manufacturer="Custom",
-            model="Scheduler",
-            sw_version=INTEGRATION_VERSION,
-        )
-
     @property
     def native_value(self) -> int:
         return self.coordinator.default_duration_minutes
@@ -66,3 +49,4 @@ class DurationMinutesHelper(NumberEntity):
         await self.coordinator.async_update_option(
             CONF_DEFAULT_DURATION_MINUTES, int(value)
         )
+        self._handle_coordinator_update()
@@ -0,0 +1,494 @@
+from __future__ import annotations
+
+import itertools
+import math
+import operator
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+from .price_sources import PriceSeries, parse_price_series
+from .tariffs import TariffOverlay, TariffSchedule
+from .windows import WindowIndex, WindowSchedule
+
+SpanCheck = Callable[[float, float], bool]
+
+# Job queues up to this long are planned in every run order.
+JOB_ORDER_SEARCH_LIMIT = 4
+
+
+@dataclass(frozen=True)
+class CostCurve:
+    """Run cost for every candidate start, captured when a plan is made."""
+
+    start: float
+    step: int
+    costs: array
+    unit: Optional[str] = None
+    forecast_from: Optional[float] = None
+    # Cost plus weighted CO2 per start, when the search weighed emissions.
+    scores: Optional[array] = None
+
+    def cost_at(self, when: datetime) -> Optional[float]:
+        return self._at(self.costs, when)
+
+    def score_at(self, when: datetime) -> Optional[float]:
+        """The value the search ranked ``when`` by: the cost, plus CO2 if weighed."""
+
+        return self._at(self.costs if self.scores is None else self.scores, when)
+
+    def _at(self, values: array, when: datetime) -> Optional[float]:
+        index = round((when.timestamp() - self.start) / self.step)
+        if 0 <= index < len(values):
+            value = values[index]
+            if value == value:
+                return value
+        return None
+
+    def uses_forecast(self, start: datetime, duration_minutes: int) -> bool:
+        """Whether a run from ``start`` reaches into forecast prices."""
+
+        return (
+            self.forecast_from is not None
+            and start.timestamp() + duration_minutes * 60 > self.forecast_from
+        )
+
+    def first_cost(self) -> Optional[float]:
+        return next((cost for cost in self.costs if cost == cost), None)
+
+    def worst_cost(self) -> Optional[float]:
+        return max((cost for cost in self.costs if cost == cost), default=None)
+
+
+@dataclass
+class WindowChoice:
+    """Best window found by the price search."""
+
+    start: datetime
+    total_cost: float
+    total_co2: Optional[float] = None
+    grid_kwh: float = 0.0
+    costs: Optional[CostCurve] = field(default=None, repr=False)
+    forecast: bool = False
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """One run of a job queue: its duration, draw and optional deadline."""
+
+    duration_minutes: int
+    power_kw: float
+    deadline: Optional[float] = None
+
+
+def fill_gaps_with_mean(values: array) -> Optional[array]:
+    """Replace NaN slots with the mean of the known ones (None if all unknown)."""
+
+    known = [value for value in values if value == value]
+    if not known:
+        return None
+    mean = sum(known) / len(known)
+    return array("d", (value if value == value else mean for value in values))
+
+
+def grid_import_profile(pv_kw: array, power_kw: float, base_kw: float) -> array:
+    """Extra grid import (kW) per slot caused by running the program.
+
+    PV first covers the household base load; only the part of the program
+    draw not covered by the remaining PV surplus is imported. Unknown PV
+    slots assume no production.
+    """
+
+    return array(
+        "d",
+        (
+            power_kw
+            if produced != produced
+            else max(0.0, base_kw + power_kw - produced)
+            - max(0.0, base_kw - produced)
+            for produced in pv_kw
+        ),
+    )
+
+
+def slots_needed(series: PriceSeries, duration_minutes: int) -> int:
+    return math.ceil(duration_minutes * 60 / series.step)
+
+
+def find_cheapest_window(
+    prices: PriceSeries,
+    duration_minutes: int,
+    fits: SpanCheck,
+    now_ts: float,
+    power_kw: float,
+    emissions: Optional[array] = None,
+    co2_weight: float = 0.0,
+    grid_import: Optional[array] = None,
+    unit: Optional[str] = None,
+) -> Optional[WindowChoice]:
+    """Return the cheapest allowed start at or after ``now_ts``.
+
+    ``prices`` are per kWh; ``emissions`` (g/kWh) and ``grid_import`` (kW)
+    must be aligned with it. Candidates are scored as price plus
+    ``co2_weight`` (per kg) times emissions, weighted by the grid import
+    when given; the earliest of equally scored allowed starts wins. The
+    choice is flagged ``forecast`` when it uses slots past
+    ``prices.forecast_from``.
+    """
+
+    first = prices.first_index_from(now_ts)
+    needed = slots_needed(prices, duration_minutes)
+    if duration_minutes <= 0 or len(prices) - first < needed:
+        return None
+
+    values = prices.values
+    if grid_import is not None:
+        # Weigh prices and emissions by the imported power instead of the
+        # constant program draw.
+        values = array("d", map(operator.mul, values, grid_import))
+        if emissions is not None:
+            emissions = array("d", map(operator.mul, emissions, grid_import))
+    # Score in currency per kWh of runtime: CO2 weight is currency per kg.
+    co2_factor = co2_weight / 1000 if emissions is not None else 0.0
+    duration_seconds = duration_minutes * 60
+    best_score = None
+    best_index = None
+    best_cost = best_co2 = 0.0
+    window_totals = array("d")
+    window_scores = array("d") if co2_factor else None
+
+    for idx in range(first, len(prices) - needed + 1):
+        total_price = sum(values[idx : idx + needed])
+        window_totals.append(total_price)
+        if total_price != total_price:
+            # Window touches a gap in the price data
+            if window_scores is not None:
+                window_scores.append(math.nan)
+            continue
+        total_co2 = (
+            sum(emissions[idx : idx + needed]) if emissions is not None else 0.0
+        )
+        score = total_price + co2_factor * total_co2 if co2_factor else total_price
+        if window_scores is not None:
+            window_scores.append(score)
+        if best_score is not None and score >= best_score:
+            continue
+        start_ts = prices.slot_start(idx)
+        if not fits(start_ts, start_ts + duration_seconds):
+            continue
+        best_score = score
+        best_index = idx
+        best_cost = total_price
+        best_co2 = total_co2
+
+    if best_index is None:
+        return None
+
+    slot_hours = prices.step / 3600
+    end_ts = prices.slot_start(best_index + needed)
+    if grid_import is None:
+        energy_factor = power_kw * slot_hours
+        grid_kwh = power_kw * slot_hours * needed
+    else:
+        energy_factor = slot_hours
+        grid_kwh = sum(grid_import[best_index : best_index + needed]) * slot_hours
+    return WindowChoice(
+        start=datetime.fromtimestamp(prices.slot_start(best_index), timezone.utc),
+        total_cost=best_cost * energy_factor,
+        total_co2=best_co2 * energy_factor if emissions is not None else None,
+        grid_kwh=grid_kwh,
+        costs=CostCurve(
+            start=prices.slot_start(first),
+            step=prices.step,
+            costs=array("d", (total * energy_factor for total in window_totals)),
+            unit=unit,
+            forecast_from=prices.forecast_from,
+            scores=(
+                array("d", (score * energy_factor for score in window_scores))
+                if window_scores is not None
+                else None
+            ),
+        ),
+        forecast=prices.forecast_from is not None and end_ts > prices.forecast_from,
+    )
+
+
+def ranked_starts(
+    curve: CostCurve, duration_minutes: int, fits: SpanCheck, count: int
+) -> list[tuple[float, float]]:
+    """Return up to ``count`` cheapest allowed starts as ``(start_ts, cost)``.
+
+    Starts are picked cheapest first and skip runs overlapping one already
+    picked, so they are real alternatives rather than neighbouring slots.
+    """
+
+    duration_seconds = duration_minutes * 60
+    candidates = sorted(
+        (cost, curve.start + index * curve.step)
+        for index, cost in enumerate(curve.costs)
+        if cost == cost
+    )
+    picked: list[tuple[float, float]] = []
+    for cost, start_ts in candidates:
+        if len(picked) >= count:
+            break
+        if any(abs(start_ts - other) < duration_seconds for other, _ in picked):
+            continue
+        if fits(start_ts, start_ts + duration_seconds):
+            picked.append((start_ts, cost))
+    return picked
+
+
+def _window_costs(
+    prices: PriceSeries, job: JobSpec, first: int, fits: SpanCheck
+) -> tuple[array, array]:
+    """Run cost of ``job`` per start index, raw and as allowed.
+
+    The raw costs are NaN where prices are missing; the allowed costs are
+    also infinite where the run breaks the window or the deadline.
+    """
+
+    needed = slots_needed(prices, job.duration_minutes)
+    duration_seconds = job.duration_minutes * 60
+    energy_factor = job.power_kw * prices.step / 3600
+    raw = array("d", [math.nan]) * len(prices)
+    allowed = array("d", [math.inf]) * len(prices)
+    values = prices.values
+    for idx in range(first, len(prices) - needed + 1):
+        total = sum(values[idx : idx + needed]) * energy_factor
+        raw[idx] = total
+        start_ts = prices.slot_start(idx)
+        end_ts = start_ts + duration_seconds
+        if (
+            total == total
+            and (job.deadline is None or end_ts <= job.deadline)
+            and fits(start_ts, end_ts)
+        ):
+            allowed[idx] = total
+    return raw, allowed
+
+
+def job_orders(jobs: Sequence[JobSpec]) -> list[tuple[int, ...]]:
+    """Run orders ``plan_jobs`` tries, the queue order first.
+
+    Queues of up to ``JOB_ORDER_SEARCH_LIMIT`` jobs try every order; longer
+    ones also try earliest deadline first, jobs without a deadline last.
+    """
+
+    queue = tuple(range(len(jobs)))
+    if len(jobs) <= JOB_ORDER_SEARCH_LIMIT:
+        return list(itertools.permutations(queue))
+    by_deadline = tuple(
+        sorted(
+            queue,
+            key=lambda j: (jobs[j].deadline is None, jobs[j].deadline or 0.0),
+        )
+    )
+    return [queue] if by_deadline == queue else [queue, by_deadline]
+
+
+def _plan_order(
+    order: tuple[int, ...],
+    needed: Sequence[int],
+    job_costs: Sequence[array],
+    first: int,
+    size: int,
+) -> Optional[tuple[float, list[int]]]:
+    """Cheapest non-overlapping starts for the jobs run in ``order``.
+
+    Dynamic programme over the slot grid: ``best[k][t]`` is the cheapest
+    cost of the first ``k + 1`` runs with run ``k`` starting at slot ``t``.
+    A running prefix minimum over the previous run's row makes every row
+    O(slots). Ties go to the earliest starts.
+    """
+
+    best = job_costs[order[0]]
+    # back[k][t]: start of run k - 1 in the best plan with run k at t.
+    back: list[array] = []
+    for k in range(1, len(order)):
+        gap = needed[order[k - 1]]
+        costs = job_costs[order[k]]
+        row = array("d", [math.inf]) * size
+        links = array("l", [-1]) * size
+        prefix_cost = math.inf
+        prefix_index = -1
+        for t in range(first + gap, size):
+            previous = best[t - gap]
+            if previous < prefix_cost:
+                prefix_cost = previous
+                prefix_index = t - gap
+            cost = costs[t]
+            if cost != math.inf and prefix_cost != math.inf:
+                row[t] = prefix_cost + cost
+                links[t] = prefix_index
+        best = row
+        back.append(links)
+
+    last = min(range(size), key=best.__getitem__, default=None)
+    if last is None or best[last] == math.inf:
+        return None
+
+    starts = [last]
+    for links in reversed(back):
+        starts.append(links[starts[-1]])
+    starts.reverse()
+    return best[last], starts
+
+
+def plan_jobs(
+    prices: PriceSeries,
+    jobs: Sequence[JobSpec],
+    fits: SpanCheck,
+    now_ts: float,
+    unit: Optional[str] = None,
+) -> Optional[tuple[tuple[int, ...], list[WindowChoice]]]:
+    """Place ``jobs`` without overlap at minimum total cost.
+
+    Every order from ``job_orders`` is planned with an O(jobs * slots)
+    dynamic programme (plus computing each job's window costs once) and the
+    cheapest wins; the queue order wins ties. Returns the run order, as
+    indices into ``jobs``, and one choice per run in that order, or None
+    when the jobs cannot all be placed.
+    """
+
+    if not jobs or any(job.duration_minutes <= 0 for job in jobs):
+        return None
+    first = prices.first_index_from(now_ts)
+    size = len(prices)
+    needed = [slots_needed(prices, job.duration_minutes) for job in jobs]
+    raw_costs, job_costs = zip(
+        *(_window_costs(prices, job, first, fits) for job in jobs)
+    )
+
+    best: Optional[tuple[float, list[int]]] = None
+    best_order: tuple[int, ...] = ()
+    for order in job_orders(jobs):
+        planned = _plan_order(order, needed, job_costs, first, size)
+        if planned is not None and (best is None or planned[0] < best[0]):
+            best, best_order = planned, order
+    if best is None:
+        return None
+
+    slot_hours = prices.step / 3600
+    choices = []
+    for k, (j, start) in enumerate(zip(best_order, best[1])):
+        job = jobs[j]
+        end_ts = prices.slot_start(start + needed[j])
+        choices.append(
+            WindowChoice(
+                start=datetime.fromtimestamp(prices.slot_start(start), timezone.utc),
+                total_cost=job_costs[j][start],
+                grid_kwh=job.power_kw * slot_hours * needed[j],
+                costs=(
+                    CostCurve(
+                        start=prices.slot_start(first),
+                        step=prices.step,
+                        costs=raw_costs[j][first:],
+                        unit=unit,
+                        forecast_from=prices.forecast_from,
+                    )
+                    if k == 0
+                    else None
+                ),
+                forecast=(
+                    prices.forecast_from is not None
+                    and end_ts > prices.forecast_from
+                ),
+            )
+        )
+    return best_order, choices
+
+
+@dataclass(frozen=True)
+class WindowSearch:
+    """Inputs of one cheapest-window search, captured on the event loop.
+
+    The arrays are never mutated once built, so a search can run in an
+    executor thread while the loop keeps going.
+    """
+
+    prices: PriceSeries
+    duration_minutes: int
+    fits: SpanCheck
+    now_ts: float
+    power_kw: float
+    emissions: Optional[array] = None
+    co2_weight: float = 0.0
+    grid_import: Optional[array] = None
+    unit: Optional[str] = None
+
+    @property
+    def work(self) -> int:
+        """Rough cost of the search in slot additions."""
+
+        starts = len(self.prices) - self.prices.first_index_from(self.now_ts)
+        return max(0, starts) * slots_needed(self.prices, self.duration_minutes)
+
+    def run(self) -> Optional[WindowChoice]:
+        return find_cheapest_window(
+            self.prices,
+            self.duration_minutes,
+            self.fits,
+            self.now_ts,
+            self.power_kw,
+            emissions=self.emissions,
+            co2_weight=self.co2_weight,
+            grid_import=self.grid_import,
+            unit=self.unit,
+        )
+
+
+@dataclass(frozen=True)
+class JobSearch:
+    """Inputs of one job queue plan, captured on the event loop."""
+
+    prices: PriceSeries
+    jobs: tuple[JobSpec, ...]
+    fits: SpanCheck
+    now_ts: float
+    unit: Optional[str] = None
+
+    @property
+    def work(self) -> int:
+        starts = max(0, len(self.prices) - self.prices.first_index_from(self.now_ts))
+        window_costs = sum(
+            starts * slots_needed(self.prices, job.duration_minutes)
+            for job in self.jobs
+        )
+        return window_costs + len(job_orders(self.jobs)) * len(self.jobs) * starts
+
+    def run(self) -> Optional[tuple[tuple[int, ...], list[WindowChoice]]]:
+        return plan_jobs(self.prices, self.jobs, self.fits, self.now_ts, self.unit)
+
+
+def plan_from_attributes(
+    attributes: Mapping[str, Any],
+    tz: tzinfo,
+    duration_minutes: int,
+    schedule: WindowSchedule,
+    now_ts: Optional[float] = None,
+    power_kw: float = 1.0,
+    tariffs: Optional[TariffSchedule] = None,
+) -> Optional[WindowChoice]:
+    """Plan directly from price sensor attributes (no Home Assistant needed).
+
+    Without ``now_ts`` the whole series is considered.
+    """
+
+    series = parse_price_series(attributes, tz)
+    if series is None or not len(series):
+        return None
+    if tariffs:
+        series = TariffOverlay(tariffs, tz).apply(series)
+
+    first_day = datetime.fromtimestamp(series.start, tz).date()
+    days = math.ceil((series.end - series.start) / 86400) + 2
+    index = WindowIndex.build(schedule, tz, first_day, days)
+    return find_cheapest_window(
+        series,
+        duration_minutes,
+        index.fits,
+        series.start if now_ts is None else now_ts,
+        power_kw,
+    )
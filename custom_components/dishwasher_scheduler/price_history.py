@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import logging
+import math
+from datetime import datetime, tzinfo
+from typing import Callable, Optional
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .archive import PriceArchive
+from .const import DATA_PRICE_HISTORY, DOMAIN, PRICE_ARCHIVE_FILENAME
+from .forecast import SeasonalForecaster
+from .price_sources import PriceSeries
+
+_LOGGER = logging.getLogger(__name__)
+
+# Flush queued slots after this delay, or immediately once this many are queued.
+FLUSH_DELAY_SECONDS = 60
+FLUSH_BATCH_SIZE = 1000
+# Archived history used to seed a price forecaster.
+FORECAST_HISTORY_DAYS = 28
+
+
+class PriceHistory:
+    """Queue newly seen price slots and write them to the archive in batches.
+
+    Only slots after the newest one already queued for a source are added, so
+    re-reading an unchanged price sensor costs a single comparison. Writes run
+    in the executor. Newly seen slots also update the source's price
+    forecaster once it has been seeded from the archive.
+    """
+
+    def __init__(self, hass: HomeAssistant, archive: PriceArchive) -> None:
+        self.hass = hass
+        self.archive = archive
+        self._pending: dict[str, list[tuple[int, float]]] = {}
+        self._pending_count = 0
+        self._high_water: dict[str, float] = {}
+        self._unsub_flush: Optional[Callable[[], None]] = None
+        self._forecasters: dict[str, SeasonalForecaster] = {}
+        self._forecasters_loading: set[str] = set()
+        self._extended: dict[str, tuple[PriceSeries, float, PriceSeries]] = {}
+        self.rows_written = 0
+        # Config entries are not unloaded on shutdown, so flush on stop.
+        self._unsub_stop: Optional[Callable[[], None]] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_handle_stop
+        )
+
+    async def _async_handle_stop(self, _event: Event) -> None:
+        self._unsub_stop = None
+        await self.async_flush()
+
+    @callback
+    def add(self, source: str, series: PriceSeries) -> None:
+        """Queue the slots of ``series`` not seen before for ``source``."""
+
+        if not len(series):
+            return
+        seen = self._high_water.get(source, -math.inf)
+        if series.end - series.step <= seen:
+            return
+        if (forecaster := self._forecasters.get(source)) is not None:
+            forecaster.update(series)
+
+        queue = self._pending.setdefault(source, [])
+        added = 0
+        first = series.first_index_from(seen + 1) if source in self._high_water else 0
+        for index in range(first, len(series)):
+            value = series.values[index]
+            if value == value:
+                seen = series.slot_start(index)
+                queue.append((int(seen), value))
+                added += 1
+        # Trailing gaps stay eligible until the source publishes them.
+        self._high_water[source] = seen
+        self._pending_count += added
+
+        if self._pending_count >= FLUSH_BATCH_SIZE:
+            self.hass.async_create_task(self.async_flush())
+        elif added and self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, FLUSH_DELAY_SECONDS, self._scheduled_flush
+            )
+
+    async def _scheduled_flush(self, _now: datetime) -> None:
+        self._unsub_flush = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+        pending, self._pending = self._pending, {}
+        self._pending_count = 0
+        for source, slots in pending.items():
+            try:
+                added = await self.hass.async_add_executor_job(
+                    self.archive.insert, source, slots
+                )
+            except Exception as err:  # noqa: BLE001 - sqlite raises many types
+                _LOGGER.error("Could not archive prices for %s: %s", source, err)
+                continue
+            self.rows_written += added
+            _LOGGER.debug("Archived %s new price slots for %s", added, source)
+
+    async def async_read_range(
+        self, source: str, start: datetime, end: datetime
+    ) -> PriceSeries:
+        """Return archived prices for ``source`` between ``start`` and ``end``."""
+
+        await self.async_flush()
+        return await self.hass.async_add_executor_job(
+            self.archive.read_range, source, start.timestamp(), end.timestamp()
+        )
+
+    async def async_load_forecaster(self, source: str, tz: tzinfo) -> None:
+        """Seed the forecaster for ``source`` from the archive (once)."""
+
+        if source in self._forecasters or source in self._forecasters_loading:
+            return
+        self._forecasters_loading.add(source)
+        try:
+            await self.async_flush()
+            now_ts = dt_util.utcnow().timestamp()
+            archived = await self.hass.async_add_executor_job(
+                self.archive.read_range,
+                source,
+                now_ts - FORECAST_HISTORY_DAYS * 86400,
+                now_ts + 2 * 86400,
+            )
+        except Exception as err:  # noqa: BLE001 - sqlite raises many types
+            _LOGGER.error("Could not read price history for %s: %s", source, err)
+            return
+        finally:
+            self._forecasters_loading.discard(source)
+
+        forecaster = SeasonalForecaster(tz)
+        used = forecaster.update(archived)
+        self._forecasters[source] = forecaster
+        _LOGGER.debug("Price forecaster for %s seeded with %s slots", source, used)
+
+    @callback
+    def extend(self, source: str, series: PriceSeries, until: float) -> PriceSeries:
+        """Return ``series`` with forecast slots up to ``until`` when possible.
+
+        The result is cached so repeated calls return the same object and
+        downstream identity caches (tariffs, grid import) keep working.
+        """
+
+        forecaster = self._forecasters.get(source)
+        if forecaster is None:
+            return series
+        cached = self._extended.get(source)
+        if cached is not None and cached[0] is series and cached[1] == until:
+            return cached[2]
+        extended = forecaster.extend(series, until)
+        self._extended[source] = (series, until, extended)
+        return extended
+
+    async def async_shutdown(self) -> None:
+        if self._unsub_stop:
+            self._unsub_stop()
+            self._unsub_stop = None
+        await self.async_flush()
+        await self.hass.async_add_executor_job(self.archive.close)
+
+
+@callback
+def async_get_price_history(hass: HomeAssistant) -> PriceHistory:
+    """Return the domain-wide price history, creating it on first use."""
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    history = domain_data.get(DATA_PRICE_HISTORY)
+    if history is None:
+        archive = PriceArchive(hass.config.path(PRICE_ARCHIVE_FILENAME))
+        history = domain_data[DATA_PRICE_HISTORY] = PriceHistory(hass, archive)
+    return history
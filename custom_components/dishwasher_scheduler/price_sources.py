@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone, tzinfo
+from typing import Any, Hashable, Iterator, Mapping, Optional, Sequence
+
+SLOT_SECONDS = 15 * 60
+# Points without an explicit end cover the gap to the next point, capped here.
+MAX_IMPLICIT_SLOT_SECONDS = 60 * 60
+
+PricePoint = tuple[float, Optional[float], float]
+
+
+def to_timestamp(value: Any, tz: tzinfo) -> Optional[float]:
+    """Return a POSIX timestamp for an ISO string or datetime (naive = ``tz``)."""
+
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value.strip())
+        except ValueError:
+            return None
+    else:
+        return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=tz)
+    return parsed.timestamp()
+
+
+@dataclass(frozen=True)
+class PriceSeries:
+    """Prices (or CO2/PV forecasts) on a fixed UTC grid; gaps are NaN.
+
+    ``forecast_from`` is set when slots from that time on are forecasts
+    rather than published prices.
+    """
+
+    start: float
+    values: array = field(default_factory=lambda: array("d"))
+    step: int = SLOT_SECONDS
+    source: str = ""
+    forecast_from: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @property
+    def end(self) -> float:
+        return self.start + len(self.values) * self.step
+
+    def slot_start(self, index: int) -> float:
+        return self.start + index * self.step
+
+    def first_index_from(self, ts: float) -> int:
+        """Index of the first slot starting at or after ``ts``."""
+
+        return max(0, math.ceil((ts - self.start) / self.step))
+
+    def aligned_to(self, reference: "PriceSeries") -> array:
+        """Return values resampled onto ``reference``'s grid (NaN outside)."""
+
+        aligned = array("d", [math.nan]) * len(reference)
+        if self.step == reference.step:
+            offset = round((reference.start - self.start) / self.step)
+            lo = max(0, -offset)
+            hi = min(len(reference), len(self.values) - offset)
+            if lo < hi:
+                aligned[lo:hi] = self.values[lo + offset : hi + offset]
+            return aligned
+
+        for index in range(len(reference)):
+            source = int((reference.slot_start(index) - self.start) // self.step)
+            if 0 <= source < len(self.values):
+                aligned[index] = self.values[source]
+        return aligned
+
+    def slots(
+        self, from_ts: Optional[float] = None
+    ) -> Iterator[tuple[datetime, float]]:
+        """Yield ``(utc_start, value)`` for known slots starting at/after ``from_ts``."""
+
+        first = 0 if from_ts is None else self.first_index_from(from_ts)
+        for index in range(first, len(self.values)):
+            value = self.values[index]
+            if value == value:
+                yield (
+                    datetime.fromtimestamp(self.slot_start(index), timezone.utc),
+                    value,
+                )
+
+
+def normalize_points(
+    points: Sequence[PricePoint], source: str = "", step: int = SLOT_SECONDS
+) -> Optional[PriceSeries]:
+    """Resample ``(start, end, value)`` points onto a fixed grid."""
+
+    if not points:
+        return None
+
+    ordered = sorted(points, key=lambda point: point[0])
+    base = ordered[0][0] // step * step
+    values = array("d")
+
+    for idx, (start, end, value) in enumerate(ordered):
+        if end is None:
+            if idx + 1 < len(ordered):
+                end = ordered[idx + 1][0]
+            elif idx > 0:
+                end = start + (start - ordered[idx - 1][0])
+            else:
+                end = start + step
+            end = min(end, start + MAX_IMPLICIT_SLOT_SECONDS)
+        first = int((start - base) // step)
+        last = max(first + 1, math.ceil((end - base) / step))
+        if last > len(values):
+            values.extend([math.nan] * (last - len(values)))
+        for slot in range(first, last):
+            values[slot] = value
+
+    return PriceSeries(start=base, values=values, step=step, source=source)
+
+
+def _first_of(item: Mapping[str, Any], key: str, alternatives: tuple[str, ...]) -> Any:
+    """Return ``item[key]``, else the first alternative key that is set."""
+
+    value = item.get(key)
+    if value is not None or not alternatives:
+        return item[key]
+    for alternative in alternatives:
+        value = item.get(alternative)
+        if value is not None:
+            return value
+    raise KeyError(key)
+
+
+@dataclass(frozen=True)
+class ListAttributeAdapter:
+    """Adapter for sensors exposing lists of ``{start, value}`` dicts.
+
+    ``alt_start_keys`` and ``alt_value_keys`` are tried, in order, for items
+    that lack the main key.
+    """
+
+    name: str
+    attributes: tuple[str, ...]
+    start_key: str
+    value_key: str
+    end_key: Optional[str] = None
+    scale: float = 1.0
+    alt_start_keys: tuple[str, ...] = ()
+    alt_value_keys: tuple[str, ...] = ()
+
+    def detect(self, attributes: Mapping[str, Any]) -> bool:
+        """Match when every item of the non-empty lists has our keys.
+
+        Checking all items, not just the first, leaves lists mixing the keys
+        of several sources to an adapter that reads them all.
+        """
+
+        start_keys = (self.start_key, *self.alt_start_keys)
+        value_keys = (self.value_key, *self.alt_value_keys)
+        found = False
+        for key in self.attributes:
+            raw = attributes.get(key)
+            if not isinstance(raw, list) or not raw:
+                continue
+            if not all(
+                isinstance(item, Mapping)
+                and any(k in item for k in start_keys)
+                and any(k in item for k in value_keys)
+                for item in raw
+            ):
+                return False
+            found = True
+        return found
+
+    def iter_points(
+        self, attributes: Mapping[str, Any], tz: tzinfo
+    ) -> Iterator[PricePoint]:
+        start_key, value_key, end_key = self.start_key, self.value_key, self.end_key
+        alt_start, alt_value = self.alt_start_keys, self.alt_value_keys
+        scale = self.scale
+        for key in self.attributes:
+            raw = attributes.get(key)
+            if not isinstance(raw, list):
+                continue
+            for item in raw:
+                try:
+                    start = to_timestamp(_first_of(item, start_key, alt_start), tz)
+                    value = float(_first_of(item, value_key, alt_value)) * scale
+                except (KeyError, TypeError, ValueError):
+                    continue
+                if start is None or value != value:
+                    continue
+                end = to_timestamp(item.get(end_key), tz) if end_key else None
+                yield start, end, value
+
+
+@dataclass(frozen=True)
+class MappingAttributeAdapter:
+    """Adapter for sensors exposing a ``{timestamp: value}`` mapping."""
+
+    name: str
+    attribute: str
+    scale: float = 1.0
+
+    def detect(self, attributes: Mapping[str, Any]) -> bool:
+        raw = attributes.get(self.attribute)
+        return isinstance(raw, Mapping) and bool(raw)
+
+    def iter_points(
+        self, attributes: Mapping[str, Any], tz: tzinfo
+    ) -> Iterator[PricePoint]:
+        scale = self.scale
+        for key, raw_value in attributes[self.attribute].items():
+            start = to_timestamp(key, tz)
+            try:
+                value = float(raw_value) * scale
+            except (TypeError, ValueError):
+                continue
+            if start is None or value != value:
+                continue
+            yield start, None, value
+
+
+SeriesAdapter = ListAttributeAdapter | MappingAttributeAdapter
+
+_ADAPTERS: list[SeriesAdapter] = []
+
+
+def register_adapter(adapter: SeriesAdapter) -> None:
+    """Register a price source adapter; later registrations are tried first."""
+
+    _ADAPTERS.insert(0, adapter)
+
+
+def detect_adapter(attributes: Mapping[str, Any]) -> Optional[SeriesAdapter]:
+    for adapter in _ADAPTERS:
+        if adapter.detect(attributes):
+            return adapter
+    return None
+
+
+def adapter_by_name(name: str) -> Optional[SeriesAdapter]:
+    for adapter in _ADAPTERS:
+        if adapter.name == name:
+            return adapter
+    return None
+
+
+for _adapter in (
+    # Other raw_today lists, mixing the Nordpool and Energi Data Service keys;
+    # registered first so the exact formats below win.
+    ListAttributeAdapter(
+        "raw_lists",
+        ("raw_today", "raw_tomorrow"),
+        "start",
+        "value",
+        end_key="end",
+        alt_start_keys=("hour",),
+        alt_value_keys=("price",),
+    ),
+    # Tibber API shape (e.g. tibber price template/custom sensors)
+    ListAttributeAdapter("tibber", ("today", "tomorrow"), "startsAt", "total"),
+    # hass-entso-e
+    ListAttributeAdapter(
+        "entsoe", ("prices_today", "prices_tomorrow", "prices"), "time", "price"
+    ),
+    # Energi Data Service
+    ListAttributeAdapter(
+        "energidataservice", ("raw_today", "raw_tomorrow"), "hour", "price"
+    ),
+    # Forecast.Solar (W -> kW)
+    MappingAttributeAdapter("forecast_solar", "watts", scale=0.001),
+    # Solcast (kW)
+    ListAttributeAdapter(
+        "solcast",
+        ("detailedForecast", "detailedHourly"),
+        "period_start",
+        "pv_estimate",
+    ),
+    # Generic forecast lists (e.g. CO2 intensity sensors)
+    ListAttributeAdapter("forecast", ("forecast",), "start", "value", end_key="end"),
+    # Nordpool
+    ListAttributeAdapter(
+        "nordpool", ("raw_today", "raw_tomorrow"), "start", "value", end_key="end"
+    ),
+):
+    register_adapter(_adapter)
+
+
+def parse_price_series(
+    attributes: Mapping[str, Any],
+    tz: tzinfo,
+    adapter: Optional[SeriesAdapter] = None,
+) -> Optional[PriceSeries]:
+    """Detect the source format (unless given) and return a normalized series."""
+
+    adapter = adapter or detect_adapter(attributes)
+    if adapter is None:
+        return None
+    return normalize_points(list(adapter.iter_points(attributes, tz)), adapter.name)
+
+
+class PriceSeriesCache:
+    """Per-entity cache of parsed series keyed by a state token."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[Hashable, Optional[PriceSeries]]] = {}
+        self._adapters: dict[str, SeriesAdapter] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        entity_id: str,
+        token: Hashable,
+        attributes: Mapping[str, Any],
+        tz: tzinfo,
+    ) -> Optional[PriceSeries]:
+        cached = self._entries.get(entity_id)
+        if cached is not None and cached[0] == token:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        adapter = self._adapters.get(entity_id)
+        if adapter is None or not adapter.detect(attributes):
+            adapter = detect_adapter(attributes)
+        if adapter is not None:
+            self._adapters[entity_id] = adapter
+        series = parse_price_series(attributes, tz, adapter) if adapter else None
+        self._entries[entity_id] = (token, series)
+        return series
+
+    def invalidate(self, entity_id: Optional[str] = None) -> None:
+        if entity_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(entity_id, None)
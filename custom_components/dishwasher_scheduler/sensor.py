@@ -1,21 +1,31 @@
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    ATTR_GRID_ENERGY,
+    ATTR_JOBS,
+    ATTR_PRICE_FORECAST,
+    ATTR_SUPPRESSED_REPLANS,
+    ATTR_RUNS,
+    ATTR_SAVINGS_VS_WORST,
+    ATTR_TOTAL_CO2,
+    ATTR_TOTAL_COST,
     DOMAIN,
-    INTEGRATION_VERSION,
     SENSOR_LAST_ATTEMPT,
     SENSOR_LAST_RESULT,
+    SENSOR_NAIVE_COST,
     SENSOR_PLANNED_END,
     SENSOR_PLANNED_START,
+    SENSOR_REALIZED_COST,
+    SENSOR_SAVINGS,
 )
 from .coordinator import DishwasherSchedulerCoordinator
+from .entity import SchedulerEntity
 
 
 async def async_setup_entry(
@@ -29,37 +39,42 @@ async def async_setup_entry(
             PlannedEndSensor(coordinator),
             LastAttemptSensor(coordinator),
             LastResultSensor(coordinator),
+            RunStatisticsSensor(
+                coordinator,
+                "Realized cost",
+                SENSOR_REALIZED_COST,
+                SensorStateClass.TOTAL_INCREASING,
+            ),
+            RunStatisticsSensor(
+                coordinator,
+                "Cost if started immediately",
+                SENSOR_NAIVE_COST,
+                SensorStateClass.TOTAL_INCREASING,
+            ),
+            # Savings can shrink when a run ends up dearer than starting
+            # immediately, which total_increasing would treat as a reset.
+            RunStatisticsSensor(
+                coordinator,
+                "Savings",
+                SENSOR_SAVINGS,
+                SensorStateClass.TOTAL,
+            ),
         ],
         update_before_add=True,
     )
 
 
-class BaseDishwasherSensor(SensorEntity):
-    _attr_has_entity_name = True
-    _attr_should_poll = False
-
+class BaseDishwasherSensor(SchedulerEntity, SensorEntity):
     def __init__(self, coordinator: DishwasherSchedulerCoordinator, name: str, unique: str):
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_name = name
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{unique}"
 
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
-            name="Dishwasher Scheduler",
-            manufacturer="Custom",
-            model="Scheduler",
-            sw_version=INTEGRATION_VERSION,
-        )
-
 
 class PlannedStartSensor(BaseDishwasherSensor):
+    # The job list and replan counter change often and are only useful live.
+    _unrecorded_attributes = frozenset({ATTR_JOBS, ATTR_SUPPRESSED_REPLANS})
+
     def __init__(self, coordinator: DishwasherSchedulerCoordinator) -> None:
         super().__init__(
             coordinator,
@@ -74,6 +89,38 @@ class PlannedStartSensor(BaseDishwasherSensor):
             return None
         return dt_util.as_local(dt_value).isoformat(timespec="minutes")
 
+    @property
+    def extra_state_attributes(self):
+        state = self.coordinator.state
+        attributes = {}
+        if state.planned_cost is not None:
+            attributes[ATTR_TOTAL_COST] = round(state.planned_cost, 4)
+            attributes[ATTR_PRICE_FORECAST] = state.planned_from_forecast
+        if state.suppressed_replans:
+            attributes[ATTR_SUPPRESSED_REPLANS] = state.suppressed_replans
+        if state.planned_co2 is not None:
+            attributes[ATTR_TOTAL_CO2] = round(state.planned_co2, 1)
+        if state.planned_grid_kwh is not None:
+            attributes[ATTR_GRID_ENERGY] = round(state.planned_grid_kwh, 3)
+        if state.job_plan:
+            attributes[ATTR_JOBS] = [
+                {
+                    "job_id": job.job_id,
+                    "program": job.program,
+                    "start": dt_util.as_local(choice.start).isoformat(
+                        timespec="minutes"
+                    ),
+                    "deadline": (
+                        dt_util.as_local(job.deadline).isoformat(timespec="minutes")
+                        if job.deadline
+                        else None
+                    ),
+                    ATTR_TOTAL_COST: round(choice.total_cost, 4),
+                }
+                for job, choice in state.job_plan
+            ]
+        return attributes
+
 
 class PlannedEndSensor(BaseDishwasherSensor):
     def __init__(self, coordinator: DishwasherSchedulerCoordinator) -> None:
@@ -118,3 +165,36 @@ class LastResultSensor(BaseDishwasherSensor):
     @property
     def native_value(self):
         return self.coordinator.state.last_result
+
+
+class RunStatisticsSensor(BaseDishwasherSensor):
+    """Accumulated cost statistics, updated when a planned run completes."""
+
+    _attr_suggested_display_precision = 2
+
+    def __init__(
+        self,
+        coordinator: DishwasherSchedulerCoordinator,
+        name: str,
+        unique: str,
+        state_class: SensorStateClass,
+    ) -> None:
+        super().__init__(coordinator, name, unique)
+        self._statistic = unique
+        self._attr_state_class = state_class
+
+    @property
+    def native_unit_of_measurement(self):
+        return self.coordinator.statistics.unit
+
+    @property
+    def native_value(self):
+        return round(getattr(self.coordinator.statistics, self._statistic), 4)
+
+    @property
+    def extra_state_attributes(self):
+        stats = self.coordinator.statistics
+        attributes = {ATTR_RUNS: stats.runs}
+        if self._statistic == SENSOR_SAVINGS:
+            attributes[ATTR_SAVINGS_VS_WORST] = round(stats.savings_vs_worst, 4)
+        return attributes
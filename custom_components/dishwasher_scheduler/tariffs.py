@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import operator
+from array import array
+from dataclasses import dataclass, replace
+from datetime import datetime, tzinfo
+from typing import Any, Iterable, Mapping, Optional
+
+from .price_sources import PriceSeries
+from .windows import parse_weekday
+
+ALL_WEEKDAYS = frozenset(range(7))
+ALL_MONTHS = frozenset(range(1, 13))
+
+
+def _parse_rates(raw: Any) -> tuple[float, ...]:
+    """Return 24 hourly rates from a list or ``{"H-H": rate}`` mapping."""
+
+    if isinstance(raw, Mapping):
+        rates = [0.0] * 24
+        for span, rate in raw.items():
+            start_str, _, end_str = str(span).partition("-")
+            start = int(start_str)
+            end = int(end_str) if end_str else start + 1
+            if not (0 <= start < end <= 24):
+                raise ValueError(f"Invalid tariff hour range {span!r}")
+            for hour in range(start, end):
+                rates[hour] = float(rate)
+        return tuple(rates)
+
+    if isinstance(raw, (list, tuple)) and len(raw) == 24:
+        return tuple(float(rate) for rate in raw)
+
+    raise ValueError("Tariff rates must be 24 values or a mapping of hour ranges")
+
+
+@dataclass(frozen=True)
+class TariffPeriod:
+    """Hourly tariff rates valid on some weekdays and months."""
+
+    rates: tuple[float, ...]
+    weekdays: frozenset[int] = ALL_WEEKDAYS
+    months: frozenset[int] = ALL_MONTHS
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> "TariffPeriod":
+        weekdays = raw.get("weekdays")
+        months = raw.get("months")
+        month_set = (
+            frozenset(int(month) for month in months) if months else ALL_MONTHS
+        )
+        if not month_set <= ALL_MONTHS:
+            raise ValueError(f"Invalid tariff months {months!r}")
+        return cls(
+            rates=_parse_rates(raw.get("rates")),
+            weekdays=(
+                frozenset(parse_weekday(day) for day in weekdays)
+                if weekdays
+                else ALL_WEEKDAYS
+            ),
+            months=month_set,
+        )
+
+
+@dataclass(frozen=True)
+class TariffSchedule:
+    """Time-of-use tariff periods plus a fixed per-kWh fee.
+
+    The first period matching a slot's local month and weekday supplies the
+    hourly rate; slots without a matching period only pay the fixed fee.
+    """
+
+    periods: tuple[TariffPeriod, ...] = ()
+    fixed_fee: float = 0.0
+
+    @classmethod
+    def from_options(
+        cls, periods: Optional[Iterable[Mapping[str, Any]]], fixed_fee: Any = 0.0
+    ) -> "TariffSchedule":
+        return cls(
+            periods=tuple(TariffPeriod.from_dict(raw) for raw in periods or ()),
+            fixed_fee=float(fixed_fee or 0.0),
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.periods) or self.fixed_fee != 0.0
+
+    def rate_at(self, local_dt: datetime) -> float:
+        weekday, month = local_dt.weekday(), local_dt.month
+        for period in self.periods:
+            if weekday in period.weekdays and month in period.months:
+                return period.rates[local_dt.hour] + self.fixed_fee
+        return self.fixed_fee
+
+    def compile(self, series: PriceSeries, tz: tzinfo) -> array:
+        """Return per-slot tariffs aligned with ``series``."""
+
+        rate_at = self.rate_at
+        return array(
+            "d",
+            (
+                rate_at(datetime.fromtimestamp(series.slot_start(index), tz))
+                for index in range(len(series))
+            ),
+        )
+
+
+class TariffOverlay:
+    """Add a compiled tariff schedule to spot prices, caching the last result."""
+
+    def __init__(self, schedule: TariffSchedule, tz: tzinfo) -> None:
+        self.schedule = schedule
+        self.tz = tz
+        self._spot: Optional[PriceSeries] = None
+        self._combined: Optional[PriceSeries] = None
+
+    def apply(self, spot: PriceSeries) -> PriceSeries:
+        if not self.schedule:
+            return spot
+        if spot is self._spot and self._combined is not None:
+            return self._combined
+
+        tariffs = self.schedule.compile(spot, self.tz)
+        combined = replace(
+            spot, values=array("d", map(operator.add, spot.values, tariffs))
+        )
+        self._spot = spot
+        self._combined = combined
+        return combined
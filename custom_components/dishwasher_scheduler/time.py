@@ -5,11 +5,19 @@ from datetime import time
 from homeassistant.components.time import TimeEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, INTEGRATION_VERSION, CONF_WINDOW_START, CONF_WINDOW_END
+from .const import (
+    DOMAIN,
+    CONF_WINDOW_START,
+    CONF_WINDOW_END,
+    TIME_WEEKEND_WINDOW_END,
+    TIME_WEEKEND_WINDOW_START,
+)
 from .coordinator import DishwasherSchedulerCoordinator
+from .entity import SchedulerEntity
+from .windows import WEEKDAYS, WEEKEND, parse_hhmm
 
 
 async def async_setup_entry(
@@ -22,39 +30,28 @@ async def async_setup_entry(
         [
             WindowTimeHelper(coordinator, "Window start", CONF_WINDOW_START),
             WindowTimeHelper(coordinator, "Window end", CONF_WINDOW_END),
+            WeekendWindowTimeHelper(
+                coordinator, "Weekend window start", TIME_WEEKEND_WINDOW_START
+            ),
+            WeekendWindowTimeHelper(
+                coordinator, "Weekend window end", TIME_WEEKEND_WINDOW_END
+            ),
         ],
         update_before_add=True,
     )
 
 
-class WindowTimeHelper(TimeEntity):
-    _attr_has_entity_name = True
-    _attr_should_poll = False
+class WindowTimeHelper(SchedulerEntity, TimeEntity):
     _attr_entity_category = EntityCategory.CONFIG
 
     def __init__(
         self, coordinator: DishwasherSchedulerCoordinator, name: str, option_key: str
     ) -> None:
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._attr_name = name
         self._option_key = option_key
         self._attr_unique_id = f"{coordinator.entry.entry_id}_{option_key}"
 
-    async def async_added_to_hass(self) -> None:
-        self.async_on_remove(
-            self.coordinator.async_add_listener(self.async_write_ha_state)
-        )
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
-            name="Dishwasher Scheduler",
-            manufacturer="Custom",
-            model="Scheduler",
-            sw_version=INTEGRATION_VERSION,
-        )
-
     @property
     def native_value(self) -> time:
         if self._option_key == CONF_WINDOW_START:
@@ -65,3 +62,39 @@ class WindowTimeHelper(TimeEntity):
         await self.coordinator.async_update_option(
             self._option_key, value.strftime("%H:%M")
         )
+        self._handle_coordinator_update()
+
+
+class WeekendWindowTimeHelper(WindowTimeHelper):
+    """Edit the first Saturday/Sunday interval of the window schedule."""
+
+    @property
+    def native_value(self) -> time | None:
+        interval = self.coordinator.weekend_window
+        if interval is None:
+            return None
+        if self._option_key == TIME_WEEKEND_WINDOW_START:
+            minutes = interval[0]
+        else:
+            minutes = interval[1]
+        return time(minutes // 60, minutes % 60)
+
+    async def async_set_value(self, value: time) -> None:
+        start, end = self.coordinator.weekend_window or (
+            parse_hhmm(self.coordinator.window_start),
+            parse_hhmm(self.coordinator.window_end),
+        )
+        if self._option_key == TIME_WEEKEND_WINDOW_START:
+            start = parse_hhmm(value)
+        else:
+            end = parse_hhmm(value)
+
+        schedule = self.coordinator.window_schedule
+        await self.coordinator.async_update_window_schedule(
+            {
+                day: ((start, end),)
+                + schedule.intervals_for(WEEKDAYS.index(day))[1:]
+                for day in WEEKEND
+            }
+        )
+        self._handle_coordinator_update()
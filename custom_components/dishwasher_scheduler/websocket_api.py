@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, WS_TYPE_COST_CURVE, WS_TYPE_SUBSCRIBE_COST_CURVE
+from .coordinator import DishwasherSchedulerCoordinator
+
+_ENTRY_SCHEMA = {vol.Optional("entry_id"): str}
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    websocket_api.async_register_command(hass, websocket_cost_curve)
+    websocket_api.async_register_command(hass, websocket_subscribe_cost_curve)
+
+
+def _get_coordinator(
+    hass: HomeAssistant, entry_id: Optional[str]
+) -> Optional[DishwasherSchedulerCoordinator]:
+    domain_data = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        coordinator = domain_data.get(entry_id)
+        if isinstance(coordinator, DishwasherSchedulerCoordinator):
+            return coordinator
+        return None
+    return next(
+        (
+            value
+            for value in domain_data.values()
+            if isinstance(value, DishwasherSchedulerCoordinator)
+        ),
+        None,
+    )
+
+
+def _cost_curve_payload(coordinator: DishwasherSchedulerCoordinator) -> dict[str, Any]:
+    """Columnar cost curve: start times are ``start + i * step`` (epoch seconds)."""
+
+    curve = coordinator.state.plan_costs
+    payload: dict[str, Any] = {"entry_id": coordinator.entry.entry_id}
+    if curve is None:
+        payload.update(start=None, step=None, unit=None, costs=[], allowed=[])
+        return payload
+
+    duration_seconds = coordinator.state.planned_duration_minutes * 60
+    starts = [curve.start + index * curve.step for index in range(len(curve.costs))]
+    index = coordinator._window_index_for(
+        starts[0] if starts else curve.start,
+        (starts[-1] if starts else curve.start) + duration_seconds,
+    )
+    planned = coordinator.state.planned_start
+    payload.update(
+        start=int(curve.start),
+        step=curve.step,
+        unit=curve.unit,
+        duration=duration_seconds,
+        planned_start=int(planned.timestamp()) if planned else None,
+        costs=[round(cost, 4) if cost == cost else None for cost in curve.costs],
+        allowed=[
+            int(index.fits(start, start + duration_seconds)) for start in starts
+        ],
+    )
+    return payload
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): WS_TYPE_COST_CURVE, **_ENTRY_SCHEMA}
+)
+@callback
+def websocket_cost_curve(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the per-start cost curve of the current plan."""
+
+    coordinator = _get_coordinator(hass, msg.get("entry_id"))
+    if coordinator is None:
+        connection.send_error(msg["id"], "not_found", "Scheduler entry not found")
+        return
+    connection.send_result(msg["id"], _cost_curve_payload(coordinator))
+
+
+@websocket_api.websocket_command(
+    {vol.Required("type"): WS_TYPE_SUBSCRIBE_COST_CURVE, **_ENTRY_SCHEMA}
+)
+@callback
+def websocket_subscribe_cost_curve(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Push the cost curve whenever a new plan replaces it."""
+
+    coordinator = _get_coordinator(hass, msg.get("entry_id"))
+    if coordinator is None:
+        connection.send_error(msg["id"], "not_found", "Scheduler entry not found")
+        return
+
+    last_sent: dict[str, Any] = {}
+
+    @callback
+    def _forward() -> None:
+        # Listeners fire on every state write; only push when the curve or
+        # the options (allowed window) changed.
+        curve = coordinator.state.plan_costs
+        options = coordinator.entry.options
+        if (
+            last_sent
+            and last_sent["curve"] is curve
+            and last_sent["options"] is options
+        ):
+            return
+        last_sent.update(curve=curve, options=options)
+        connection.send_message(
+            websocket_api.event_message(msg["id"], _cost_curve_payload(coordinator))
+        )
+
+    connection.subscriptions[msg["id"]] = coordinator.async_add_listener(_forward)
+    connection.send_result(msg["id"])
+    _forward()
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any, Iterable, Mapping, Optional
+
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+WEEKEND = ("sat", "sun")
+MINUTES_PER_DAY = 24 * 60
+
+Interval = tuple[int, int]
+
+
+def parse_hhmm(value: Any) -> int:
+    """Return minutes after midnight for an HH:MM(:SS) string or time."""
+
+    if isinstance(value, time):
+        return value.hour * 60 + value.minute
+
+    parts = str(value).strip().split(":")
+    if len(parts) not in (2, 3):
+        raise ValueError(f"Invalid time {value!r}; expected HH:MM")
+    try:
+        hour, minute = int(parts[0]), int(parts[1])
+    except ValueError as err:
+        raise ValueError(f"Invalid time {value!r}; expected HH:MM") from err
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"Time out of range: {value!r}")
+    return hour * 60 + minute
+
+
+def format_hhmm(minutes: int) -> str:
+    return f"{(minutes // 60) % 24:02d}:{minutes % 60:02d}"
+
+
+def parse_interval(value: Any) -> Interval:
+    """Parse ``"HH:MM-HH:MM"`` or a ``[start, end]`` pair into minutes."""
+
+    if isinstance(value, str):
+        parts = value.split("-")
+        if len(parts) != 2:
+            raise ValueError(f"Invalid interval {value!r}; expected HH:MM-HH:MM")
+    elif isinstance(value, (list, tuple)) and len(value) == 2:
+        parts = value
+    else:
+        raise ValueError(f"Invalid interval {value!r}; expected HH:MM-HH:MM")
+    return parse_hhmm(parts[0]), parse_hhmm(parts[1])
+
+
+def format_interval(interval: Interval) -> str:
+    return f"{format_hhmm(interval[0])}-{format_hhmm(interval[1])}"
+
+
+def parse_weekday(value: Any) -> int:
+    key = str(value).strip().lower()[:3]
+    if key not in WEEKDAYS:
+        raise ValueError(f"Invalid weekday {value!r}")
+    return WEEKDAYS.index(key)
+
+
+@dataclass(frozen=True)
+class WindowSchedule:
+    """Allowed start/run intervals per weekday (minutes after local midnight).
+
+    An interval whose end is before its start wraps past midnight and closes
+    on the following day; equal start and end means a full 24 hours. Weekdays
+    without an override use ``default``; an empty override closes the day.
+    """
+
+    default: tuple[Interval, ...]
+    overrides: tuple[tuple[Interval, ...] | None, ...] = (None,) * 7
+
+    @classmethod
+    def from_options(
+        cls,
+        window_start: time,
+        window_end: time,
+        schedule: Optional[Mapping[str, Iterable[Any]]] = None,
+    ) -> "WindowSchedule":
+        default = ((parse_hhmm(window_start), parse_hhmm(window_end)),)
+        overrides: list[tuple[Interval, ...] | None] = [None] * 7
+        for day, intervals in (schedule or {}).items():
+            overrides[parse_weekday(day)] = tuple(
+                parse_interval(item) for item in intervals or ()
+            )
+        return cls(default, tuple(overrides))
+
+    def intervals_for(self, weekday: int) -> tuple[Interval, ...]:
+        override = self.overrides[weekday]
+        return self.default if override is None else override
+
+    def as_options(self) -> dict[str, list[str]]:
+        """Serialise the weekday overrides for storage in entry options."""
+
+        return {
+            WEEKDAYS[day]: [format_interval(interval) for interval in intervals]
+            for day, intervals in enumerate(self.overrides)
+            if intervals is not None
+        }
+
+
+@dataclass
+class WindowIndex:
+    """Merged, sorted UTC intervals compiled from a schedule.
+
+    Spans are only answered for ``valid_from <= start < end <= valid_until``;
+    callers rebuild the index when a query falls outside that coverage.
+    """
+
+    valid_from: float
+    valid_until: float
+    opens: list[float] = field(default_factory=list)
+    closes: list[float] = field(default_factory=list)
+
+    @classmethod
+    def build(
+        cls, schedule: WindowSchedule, tz: tzinfo, first_day: date, days: int
+    ) -> "WindowIndex":
+        raw: list[tuple[float, float]] = []
+        # Start one day early so overnight intervals opened yesterday count.
+        for offset in range(-1, days):
+            day = first_day + timedelta(days=offset)
+            midnight = datetime.combine(day, time(0, 0), tzinfo=tz)
+            for start, end in schedule.intervals_for(day.weekday()):
+                length = end - start if end > start else end - start + MINUTES_PER_DAY
+                opens_at = midnight + timedelta(minutes=start)
+                closes_at = midnight + timedelta(minutes=start + length)
+                raw.append((opens_at.timestamp(), closes_at.timestamp()))
+
+        raw.sort()
+        index = cls(
+            valid_from=datetime.combine(first_day, time(0, 0), tzinfo=tz).timestamp(),
+            valid_until=datetime.combine(
+                first_day + timedelta(days=days), time(0, 0), tzinfo=tz
+            ).timestamp(),
+        )
+        for opens_at, closes_at in raw:
+            if index.closes and opens_at <= index.closes[-1]:
+                index.closes[-1] = max(index.closes[-1], closes_at)
+                continue
+            index.opens.append(opens_at)
+            index.closes.append(closes_at)
+        return index
+
+    def covers(self, start_ts: float, end_ts: float) -> bool:
+        return self.valid_from <= start_ts and end_ts <= self.valid_until
+
+    def fits(self, start_ts: float, end_ts: float) -> bool:
+        """Return True when ``[start_ts, end_ts)`` lies inside one interval."""
+
+        idx = bisect_right(self.opens, start_ts) - 1
+        return idx >= 0 and end_ts <= self.closes[idx]
+
+    def contains(self, ts: float) -> bool:
+        idx = bisect_right(self.opens, ts) - 1
+        return idx >= 0 and ts < self.closes[idx]
@@ -0,0 +1,417 @@
+"""Differential fuzzing of the window checks and planners against brute force.
+
+Random weekday schedules (wrapping, full-day and closed days), time zones,
+DST transition days, durations and price series are checked against a
+minute-by-minute reference model:
+
+* ``WindowIndex.fits``/``contains`` against per-minute interval membership,
+  with the index built the way the coordinator builds it;
+* ``find_cheapest_window`` against scoring every slot start minute by minute
+  (prices, gaps, CO2 weighting and PV grid import);
+* ``plan_jobs`` against enumerating every non-overlapping start combination.
+
+Interval boundaries are local wall times; ambiguous or nonexistent wall
+times resolve like ``datetime.timestamp()`` (``fold=0``), which is the
+behaviour the planner must keep.
+
+    python scripts/fuzz_planner.py --iterations 2000 --seed 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import math
+import random
+import sys
+import types
+from array import array
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+PACKAGE = "custom_components.dishwasher_scheduler"
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "dishwasher_scheduler"
+
+# Register the integration as a bare package so its pure modules import
+# without running ``__init__`` (which needs Home Assistant).
+if PACKAGE not in sys.modules:
+    for name, path in (
+        ("custom_components", PACKAGE_DIR.parent),
+        (PACKAGE, PACKAGE_DIR),
+    ):
+        module = types.ModuleType(name)
+        module.__path__ = [str(path)]
+        sys.modules.setdefault(name, module)
+
+from custom_components.dishwasher_scheduler.const import WINDOW_INDEX_DAYS  # noqa: E402
+from custom_components.dishwasher_scheduler.planner import (  # noqa: E402
+    JobSpec,
+    find_cheapest_window,
+    plan_jobs,
+    slots_needed,
+)
+from custom_components.dishwasher_scheduler.price_sources import PriceSeries  # noqa: E402
+from custom_components.dishwasher_scheduler.windows import (  # noqa: E402
+    MINUTES_PER_DAY,
+    WindowIndex,
+    WindowSchedule,
+)
+
+TIME_ZONES = (
+    "UTC",
+    "Europe/Copenhagen",
+    "Europe/London",
+    "America/New_York",
+    "America/St_Johns",
+    "Australia/Lord_Howe",
+    "Pacific/Chatham",
+    "Asia/Kolkata",
+)
+STEP = 900
+# Relative tolerance when comparing costs summed in a different order.
+COST_TOLERANCE = 1e-9
+
+
+class Mismatch(AssertionError):
+    pass
+
+
+# Reference model -----------------------------------------------------------
+
+
+def _wall_ts(day: date, minutes: int, tz) -> float:
+    """Epoch seconds of ``minutes`` after local midnight of ``day`` (may exceed a day)."""
+
+    day = day + timedelta(days=minutes // MINUTES_PER_DAY)
+    minutes %= MINUTES_PER_DAY
+    return datetime.combine(day, time(minutes // 60, minutes % 60), tzinfo=tz).timestamp()
+
+
+def reference_intervals(schedule: WindowSchedule, tz, first_day: date, days: int):
+    """Open/close epoch pairs per day and interval, unmerged."""
+
+    spans = []
+    for offset in range(-1, days + 1):
+        day = first_day + timedelta(days=offset)
+        for start, end in schedule.intervals_for(day.weekday()):
+            close = end if end > start else end + MINUTES_PER_DAY
+            spans.append((_wall_ts(day, start, tz), _wall_ts(day, close, tz)))
+    return spans
+
+
+def reference_allowed(spans, ts: float) -> bool:
+    return any(opens <= ts < closes for opens, closes in spans)
+
+
+def reference_fits(spans, start_ts: float, end_ts: float) -> bool:
+    """Every minute of ``[start_ts, end_ts)`` lies in some allowed interval.
+
+    Touching or overlapping intervals count as one window, like the index.
+    Boundaries and spans fall on whole minutes, so checking the start of
+    every minute is exact.
+    """
+
+    if end_ts <= start_ts:
+        return False
+    return all(
+        reference_allowed(spans, ts) for ts in range(int(start_ts), int(end_ts), 60)
+    )
+
+
+def reference_scores(series, duration_minutes, fits, now_ts, emissions, weight, grid):
+    """Score every allowed slot start by integrating per minute.
+
+    Returns ``{start_ts: score}``; starts touching price gaps are left out.
+    """
+
+    first = series.first_index_from(now_ts)
+    needed = slots_needed(series, duration_minutes)
+    slot_minutes = series.step // 60
+    scores = {}
+    for idx in range(first, len(series) - needed + 1):
+        price = co2 = 0.0
+        for minute in range(needed * slot_minutes):
+            slot = idx + minute // slot_minutes
+            draw = grid[slot] if grid is not None else 1.0
+            price += series.values[slot] * draw / slot_minutes
+            if emissions is not None:
+                co2 += emissions[slot] * draw / slot_minutes
+        if price != price:
+            continue
+        start_ts = series.slot_start(idx)
+        if not fits(start_ts, start_ts + duration_minutes * 60):
+            continue
+        scores[start_ts] = price + (weight / 1000 * co2 if emissions is not None else 0.0)
+    return scores
+
+
+def reference_jobs(series, jobs, fits, now_ts):
+    first = series.first_index_from(now_ts)
+    best = None
+    for order in itertools.permutations(jobs):
+        needed = [slots_needed(series, job.duration_minutes) for job in order]
+        for starts in itertools.product(range(first, len(series)), repeat=len(order)):
+            if any(
+                starts[j] < starts[j - 1] + needed[j - 1] for j in range(1, len(order))
+            ):
+                continue
+            total = 0.0
+            for job, start, count in zip(order, starts, needed):
+                end = start + count
+                start_ts = series.slot_start(start)
+                if (
+                    end > len(series)
+                    or not fits(start_ts, start_ts + job.duration_minutes * 60)
+                    or (job.deadline is not None
+                        and start_ts + job.duration_minutes * 60 > job.deadline)
+                ):
+                    break
+                total += (
+                    sum(series.values[start:end]) * job.power_kw * series.step / 3600
+                )
+            else:
+                if total == total and (
+                    best is None or total < best[0] - _tolerance(best[0])
+                ):
+                    best = (total, starts)
+    return best
+
+
+def _tolerance(value: float) -> float:
+    return COST_TOLERANCE * max(1.0, abs(value))
+
+
+# Random inputs ---------------------------------------------------------------
+
+
+def random_interval(rng: random.Random) -> tuple[int, int]:
+    kind = rng.random()
+    if kind < 0.1:
+        start = rng.randrange(0, MINUTES_PER_DAY, 15)
+        return start, start  # full day
+    start = rng.randrange(0, MINUTES_PER_DAY, rng.choice((1, 15, 60)))
+    end = rng.randrange(0, MINUTES_PER_DAY, rng.choice((1, 15, 60)))
+    return start, end
+
+
+def random_schedule(rng: random.Random) -> WindowSchedule:
+    default = tuple(random_interval(rng) for _ in range(rng.randint(1, 2)))
+    overrides = []
+    for _ in range(7):
+        roll = rng.random()
+        if roll < 0.6:
+            overrides.append(None)
+        elif roll < 0.7:
+            overrides.append(())  # closed day
+        else:
+            overrides.append(
+                tuple(random_interval(rng) for _ in range(rng.randint(1, 3)))
+            )
+    return WindowSchedule(default, tuple(overrides))
+
+
+def transition_days(tz, year: int) -> list[date]:
+    days = []
+    day = date(year, 1, 1)
+    previous = datetime.combine(day, time(12), tzinfo=tz).utcoffset()
+    while day.year == year:
+        day += timedelta(days=1)
+        offset = datetime.combine(day, time(12), tzinfo=tz).utcoffset()
+        if offset != previous:
+            days.append(day - timedelta(days=1))
+            days.append(day)
+        previous = offset
+    return days
+
+
+def random_day(rng: random.Random, tz) -> date:
+    year = rng.choice((2025, 2026, 2027))
+    if rng.random() < 0.6 and (days := transition_days(tz, year)):
+        return rng.choice(days) + timedelta(days=rng.randint(-1, 0))
+    return date(year, 1, 1) + timedelta(days=rng.randrange(365))
+
+
+def build_index(schedule, tz, start_ts: float, end_ts: float) -> WindowIndex:
+    """Build the index like ``DishwasherSchedulerCoordinator._window_index_for``."""
+
+    first_day = datetime.fromtimestamp(start_ts, tz).date()
+    days = max(WINDOW_INDEX_DAYS, int((end_ts - start_ts) // 86400) + 2)
+    return WindowIndex.build(schedule, tz, first_day, days)
+
+
+def random_series(rng: random.Random, start_ts: float, slots: int) -> PriceSeries:
+    # Few distinct prices make exact ties (earliest start wins) common.
+    levels = [round(rng.uniform(-0.2, 3.0), 2) for _ in range(rng.randint(1, 6))]
+    values = array("d", (rng.choice(levels) for _ in range(slots)))
+    for _ in range(rng.randint(0, 3)):
+        gap = rng.randrange(slots)
+        for idx in range(gap, min(slots, gap + rng.randint(1, 8))):
+            values[idx] = math.nan
+    return PriceSeries(start=start_ts, values=values, step=STEP, source="fuzz")
+
+
+# Checks ----------------------------------------------------------------------
+
+
+def check_windows(rng: random.Random) -> int:
+    tz = ZoneInfo(rng.choice(TIME_ZONES))
+    schedule = random_schedule(rng)
+    day = random_day(rng, tz)
+    base = datetime.combine(day, time(0), tzinfo=tz).timestamp()
+    spans = reference_intervals(schedule, tz, day - timedelta(days=1), 6)
+    checks = 0
+    for _ in range(40):
+        start_ts = base + rng.randrange(0, 2 * 86400, rng.choice((60, 900)))
+        duration = rng.choice((1, 15, 30, 45, 60, 90, 120, 150, 180, 240, 600, 1440))
+        end_ts = start_ts + duration * 60
+        index = build_index(schedule, tz, start_ts, end_ts)
+        if not index.covers(start_ts, end_ts):
+            raise Mismatch(f"index built for {start_ts} does not cover {end_ts}")
+        expected = reference_fits(spans, start_ts, end_ts)
+        actual = index.fits(start_ts, end_ts)
+        if expected != actual:
+            raise Mismatch(
+                f"fits({_fmt(start_ts, tz)}, {duration} min) in {tz.key} with "
+                f"{schedule}: index {actual}, reference {expected}"
+            )
+        if index.contains(start_ts) != reference_allowed(spans, start_ts):
+            raise Mismatch(f"contains({_fmt(start_ts, tz)}) in {tz.key} with {schedule}")
+        checks += 2
+    return checks
+
+
+def check_cheapest(rng: random.Random) -> int:
+    tz = ZoneInfo(rng.choice(TIME_ZONES))
+    schedule = random_schedule(rng)
+    day = random_day(rng, tz)
+    start_ts = datetime.combine(day, time(0), tzinfo=tz).timestamp()
+    start_ts -= start_ts % STEP
+    series = random_series(rng, start_ts, rng.randint(8, 192))
+    duration = rng.choice((15, 20, 45, 60, 90, 120, 135, 180, 240))
+    now_ts = start_ts + rng.randrange(0, 6 * 3600, 60)
+    index = build_index(schedule, tz, now_ts, series.end + duration * 60)
+    spans = reference_intervals(schedule, tz, day - timedelta(days=1), 6)
+    power_kw = rng.choice((0.5, 1.0, 1.8))
+
+    emissions = grid = None
+    weight = 0.0
+    if rng.random() < 0.3:
+        emissions = array("d", (rng.randrange(50, 400) for _ in range(len(series))))
+        weight = rng.choice((0.0, 0.5, 2.0))
+    if rng.random() < 0.3:
+        grid = array("d", (rng.choice((0.0, 0.3, power_kw)) for _ in range(len(series))))
+
+    choice = find_cheapest_window(
+        series, duration, index.fits, now_ts, power_kw,
+        emissions=emissions, co2_weight=weight, grid_import=grid,
+    )
+    scores = reference_scores(
+        series,
+        duration,
+        lambda a, b: reference_fits(spans, a, b),
+        now_ts,
+        emissions,
+        weight,
+        grid,
+    )
+    if (choice is None) != (not scores):
+        raise Mismatch(
+            f"cheapest {duration} min in {tz.key}: planner {choice and choice.start}, "
+            f"reference has {len(scores)} allowed starts"
+        )
+    if choice is None:
+        return 1
+    # Windows with the same prices may differ in the last bit of their sum,
+    # so any start scoring within the tolerance of the best one is a tie.
+    best = min(scores.values())
+    start_ts = choice.start.timestamp()
+    if start_ts not in scores or scores[start_ts] > best + _tolerance(best):
+        cheapest = min(scores, key=lambda ts: (scores[ts], ts))
+        raise Mismatch(
+            f"cheapest {duration} min in {tz.key} from {_fmt(now_ts, tz)}: planner "
+            f"{_fmt(start_ts, tz)} ({scores.get(start_ts)}), reference "
+            f"{_fmt(cheapest, tz)} ({best})"
+        )
+    return 1
+
+
+def check_jobs(rng: random.Random) -> int:
+    tz = ZoneInfo(rng.choice(TIME_ZONES))
+    schedule = random_schedule(rng)
+    day = random_day(rng, tz)
+    start_ts = datetime.combine(day, time(0), tzinfo=tz).timestamp()
+    start_ts -= start_ts % STEP
+    series = random_series(rng, start_ts, rng.randint(6, 28))
+    jobs = [
+        JobSpec(
+            duration_minutes=rng.choice((15, 30, 45, 60, 75)),
+            power_kw=rng.choice((0.5, 1.0, 1.8)),
+            deadline=(
+                start_ts + rng.randrange(2, 28) * STEP if rng.random() < 0.3 else None
+            ),
+        )
+        for _ in range(rng.randint(1, 3))
+    ]
+    now_ts = start_ts + rng.randrange(0, 3600, 60)
+    longest = max(job.duration_minutes for job in jobs)
+    index = build_index(schedule, tz, now_ts, series.end + longest * 60)
+
+    result = plan_jobs(series, jobs, index.fits, now_ts)
+    expected = reference_jobs(series, jobs, index.fits, now_ts)
+    if (result is None) != (expected is None):
+        raise Mismatch(f"plan_jobs feasibility differs for {jobs}: {result}, {expected}")
+    if result is not None:
+        order, choices = result
+        if sorted(order) != list(range(len(jobs))):
+            raise Mismatch(f"plan_jobs order {order} is not a permutation")
+        total = sum(choice.total_cost for choice in choices)
+        if abs(total - expected[0]) > _tolerance(expected[0]):
+            raise Mismatch(f"plan_jobs cost {total} != reference {expected[0]} for {jobs}")
+        starts = [choice.start.timestamp() for choice in choices]
+        run = [jobs[j] for j in order]
+        if any(b < a + slots_needed(series, job.duration_minutes) * STEP
+               for a, b, job in zip(starts, starts[1:], run)):
+            raise Mismatch(f"plan_jobs overlaps: {starts}")
+    return 1
+
+
+def _fmt(ts: float, tz) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).astimezone(tz).isoformat()
+
+
+CHECKS = {"windows": check_windows, "cheapest": check_cheapest, "jobs": check_jobs}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--seed", type=int, help="seed of the first iteration")
+    parser.add_argument(
+        "--only", choices=sorted(CHECKS), action="append", help="run only these checks"
+    )
+    args = parser.parse_args(argv)
+
+    seed = random.randrange(2**32) if args.seed is None else args.seed
+    checks = [CHECKS[name] for name in args.only or sorted(CHECKS)]
+    counts = dict.fromkeys((check.__name__ for check in checks), 0)
+    failures = 0
+    for iteration in range(args.iterations):
+        for check in checks:
+            # Each iteration gets its own seed so failures replay in isolation.
+            rng = random.Random(f"{seed}:{iteration}:{check.__name__}")
+            try:
+                counts[check.__name__] += check(rng)
+            except Mismatch as err:
+                failures += 1
+                print(
+                    f"MISMATCH {check.__name__} (--seed {seed}, iteration {iteration}): {err}",
+                    file=sys.stderr,
+                )
+    summary = ", ".join(f"{name} {count}" for name, count in counts.items())
+    print(f"seed {seed}: {args.iterations} iterations ({summary}), {failures} mismatches")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
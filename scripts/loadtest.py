@@ -0,0 +1,456 @@
+"""Simulate many Dishwasher Scheduler entries on one event loop.
+
+Runs N coordinators against a lightweight fake ``hass`` (state machine,
+services, config entries and time tracking) and drives simulated days of
+timer dispatches, price updates and service calls. Reports the event-loop time
+spent per simulated minute so changes to the tick and listener fan-out can
+be measured.
+
+Requires the ``homeassistant`` package (for ``dt_util`` and the entity base
+classes); Home Assistant itself is not started.
+
+    python scripts/loadtest.py --entries 200 --days 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time as time_mod
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from homeassistant.core import CoreState  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.dishwasher_scheduler import coordinator as coordinator_mod  # noqa: E402
+from custom_components.dishwasher_scheduler import dispatcher as dispatcher_mod  # noqa: E402
+from custom_components.dishwasher_scheduler import price_history as price_history_mod  # noqa: E402
+from custom_components.dishwasher_scheduler.const import (  # noqa: E402
+    DOMAIN,
+    CONF_CHEAPEST_HOUR_ENTITY,
+    CONF_DOOR_SENSOR,
+    CONF_START_BUTTON_ENTITY,
+    CONF_STATUS_ENTITY,
+    CONF_WINDOW_END,
+    CONF_WINDOW_START,
+)
+from custom_components.dishwasher_scheduler.coordinator import (  # noqa: E402
+    DishwasherSchedulerCoordinator,
+)
+from custom_components.dishwasher_scheduler.number import DurationMinutesHelper  # noqa: E402
+from custom_components.dishwasher_scheduler.select import PlanningModeSelect  # noqa: E402
+from custom_components.dishwasher_scheduler.sensor import (  # noqa: E402
+    LastAttemptSensor,
+    LastResultSensor,
+    PlannedEndSensor,
+    PlannedStartSensor,
+)
+from custom_components.dishwasher_scheduler.switch import DishwasherArmedSwitch  # noqa: E402
+from custom_components.dishwasher_scheduler.time import WindowTimeHelper  # noqa: E402
+
+PRICE_ENTITY = "sensor.nordpool_kwh_dk2"
+CHEAPEST_HOUR_ENTITY = "sensor.cheapest_hour"
+
+
+@dataclass
+class FakeState:
+    entity_id: str
+    state: str
+    attributes: MappingProxyType
+    last_updated: datetime
+
+
+@dataclass
+class FakeEvent:
+    data: dict[str, Any]
+
+
+class FakeStates:
+    """Minimal state machine with state-change listeners."""
+
+    def __init__(self, hass: "FakeHass") -> None:
+        self._hass = hass
+        self._states: dict[str, FakeState] = {}
+        self.listeners: dict[str, list[Callable]] = defaultdict(list)
+        self.lookups = 0
+
+    def get(self, entity_id: str) -> FakeState | None:
+        self.lookups += 1
+        return self._states.get(entity_id)
+
+    def async_set(
+        self, entity_id: str, state: str, attributes: dict | None = None
+    ) -> None:
+        old = self._states.get(entity_id)
+        new = FakeState(
+            entity_id, state, MappingProxyType(attributes or {}), dt_util.utcnow()
+        )
+        self._states[entity_id] = new
+        event = FakeEvent({"entity_id": entity_id, "old_state": old, "new_state": new})
+        for listener in list(self.listeners[entity_id]):
+            self._hass.pending.append(listener(event))
+
+
+class FakeServices:
+    """Records service calls and lets the simulation react to button presses."""
+
+    def __init__(self, on_call: Callable[[str, str, dict], None]) -> None:
+        self._on_call = on_call
+        self.calls = 0
+
+    def has_service(self, domain: str, service: str) -> bool:
+        return False
+
+    async def async_call(
+        self, domain: str, service: str, data: dict, blocking: bool = False
+    ) -> None:
+        self.calls += 1
+        self._on_call(domain, service, data)
+
+
+class FakeBus:
+    """Counts fired events by type and calls one-shot listeners."""
+
+    def __init__(self) -> None:
+        self.fired: dict[str, int] = defaultdict(int)
+        self._once: dict[str, list[Callable]] = defaultdict(list)
+
+    def async_fire(self, event_type: str, event_data: dict | None = None) -> None:
+        self.fired[event_type] += 1
+        listeners, self._once[event_type] = self._once[event_type], []
+        for listener in listeners:
+            listener(FakeEvent(event_data or {}))
+
+    def async_listen_once(self, event_type: str, listener: Callable) -> Callable:
+        self._once[event_type].append(listener)
+
+        def _remove() -> None:
+            if listener in self._once[event_type]:
+                self._once[event_type].remove(listener)
+
+        return _remove
+
+
+class FakeConfigEntries:
+    def __init__(self) -> None:
+        self.writes = 0
+
+    def async_update_entry(self, entry: "FakeEntry", options=None) -> bool:
+        self.writes += 1
+        if options is not None:
+            entry.options = MappingProxyType(dict(options))
+        return True
+
+
+@dataclass
+class FakeEntry:
+    entry_id: str
+    data: MappingProxyType
+    options: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+
+
+class FakeConfig:
+    def __init__(self) -> None:
+        self.config_dir = tempfile.mkdtemp(prefix="dishwasher_loadtest_")
+
+    def path(self, *parts: str) -> str:
+        return str(Path(self.config_dir, *parts))
+
+
+class FakeHass:
+    def __init__(self, on_service_call: Callable[[str, str, dict], None]) -> None:
+        self.states = FakeStates(self)
+        self.services = FakeServices(on_service_call)
+        self.bus = FakeBus()
+        self.state = CoreState.running
+        self.config_entries = FakeConfigEntries()
+        self.config = FakeConfig()
+        self.data: dict[str, Any] = {}
+        self.timers: list[tuple[datetime, Callable]] = []
+        self.timers_armed = 0
+        self.pending: list[Any] = []
+        self.executor_jobs = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    def async_create_task(self, coro: Any, *args: Any, **kwargs: Any) -> asyncio.Task:
+        task = asyncio.ensure_future(coro)
+        self.pending.append(task)
+        return task
+
+    async def async_add_executor_job(self, target: Callable, *args: Any) -> Any:
+        self.executor_jobs += 1
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+    async def drain(self) -> None:
+        while self.pending:
+            pending, self.pending = self.pending, []
+            await asyncio.gather(*(job for job in pending if job is not None))
+
+
+def _fake_track_point_in_utc_time(hass: FakeHass, action, point_in_time: datetime):
+    timer = (point_in_time, action)
+    hass.timers.append(timer)
+    hass.timers_armed += 1
+
+    def _remove() -> None:
+        if timer in hass.timers:
+            hass.timers.remove(timer)
+
+    return _remove
+
+
+def _fake_call_later(hass: FakeHass, delay: float, action):
+    return _fake_track_point_in_utc_time(
+        hass, action, dt_util.utcnow() + timedelta(seconds=delay)
+    )
+
+
+def _fake_track_state_change_event(hass: FakeHass, entity_ids, action):
+    for entity_id in entity_ids:
+        hass.states.listeners[entity_id].append(action)
+
+    def _remove() -> None:
+        for entity_id in entity_ids:
+            hass.states.listeners[entity_id].remove(action)
+
+    return _remove
+
+
+def _price_attributes(day: datetime, rng: random.Random) -> dict[str, Any]:
+    def _day(offset: int) -> list[dict[str, Any]]:
+        midnight = (day + timedelta(days=offset)).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return [
+            {
+                "start": (midnight + timedelta(minutes=15 * slot)).isoformat(),
+                "end": (midnight + timedelta(minutes=15 * (slot + 1))).isoformat(),
+                "value": round(
+                    1.0 + 0.8 * rng.random() + (slot // 4 in (17, 18, 19)), 3
+                ),
+            }
+            for slot in range(96)
+        ]
+
+    return {"raw_today": _day(0), "raw_tomorrow": _day(1)}
+
+
+class Simulation:
+    """Drive N coordinators through simulated days."""
+
+    def __init__(self, entries: int, seed: int, budgeted: bool = True) -> None:
+        self.rng = random.Random(seed)
+        self.hass = FakeHass(self._on_service_call)
+        self.coordinators: list[DishwasherSchedulerCoordinator] = []
+        self.entities: list[Any] = []
+        self.budgeted = budgeted
+        self.state_writes = 0
+        # Last (state, attributes) written per entity.
+        self.recorded: dict[int, tuple[Any, Any]] = {}
+        self.recorder_rows = 0
+        self.running: dict[str, datetime] = {}
+        self.entries = entries
+
+    def _on_service_call(self, domain: str, service: str, data: dict) -> None:
+        if domain == "button" and service == "press":
+            index = data["entity_id"].split("_")[0].removeprefix("button.dw")
+            self.hass.states.async_set(f"sensor.dw{index}_status", "Running")
+            self.running[index] = dt_util.utcnow()
+
+    def _write_state(self, entity: Any) -> Callable[[], None]:
+        def _write() -> None:
+            # The state machine drops writes that change nothing; every other
+            # write is a state_changed event and a recorder row.
+            self.state_writes += 1
+            written = (entity.state, entity.extra_state_attributes)
+            if self.recorded.get(id(entity)) != written:
+                self.recorded[id(entity)] = written
+                self.recorder_rows += 1
+
+        return _write
+
+    async def setup(self) -> None:
+        hass = self.hass
+        hass.states.async_set(CHEAPEST_HOUR_ENTITY, "3")
+        for index in range(self.entries):
+            hass.states.async_set(f"sensor.dw{index}_status", "Ready")
+            hass.states.async_set(f"binary_sensor.dw{index}_door", "off")
+            entry = FakeEntry(
+                entry_id=f"entry{index}",
+                data=MappingProxyType(
+                    {
+                        CONF_CHEAPEST_HOUR_ENTITY: CHEAPEST_HOUR_ENTITY,
+                        CONF_STATUS_ENTITY: f"sensor.dw{index}_status",
+                        CONF_START_BUTTON_ENTITY: f"button.dw{index}_start",
+                        CONF_DOOR_SENSOR: f"binary_sensor.dw{index}_door",
+                        CONF_WINDOW_START: "20:00",
+                        CONF_WINDOW_END: "07:00",
+                    }
+                ),
+            )
+            coordinator = DishwasherSchedulerCoordinator(hass, entry)
+            await coordinator.async_start()
+            hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+            self.coordinators.append(coordinator)
+            for entity in (
+                PlannedStartSensor(coordinator),
+                PlannedEndSensor(coordinator),
+                LastAttemptSensor(coordinator),
+                LastResultSensor(coordinator),
+                DishwasherArmedSwitch(coordinator),
+                WindowTimeHelper(coordinator, "Window start", CONF_WINDOW_START),
+                WindowTimeHelper(coordinator, "Window end", CONF_WINDOW_END),
+                PlanningModeSelect(coordinator),
+                DurationMinutesHelper(coordinator),
+            ):
+                entity.hass = hass
+                entity.async_write_ha_state = self._write_state(entity)
+                coordinator.async_add_listener(
+                    entity._handle_coordinator_update
+                    if self.budgeted
+                    else entity.async_write_ha_state
+                )
+                self.entities.append(entity)
+        await hass.drain()
+
+    async def _minute(self, now: datetime) -> None:
+        hass = self.hass
+        local = dt_util.as_local(now)
+
+        if local.hour == 13 and local.minute == 0:
+            hass.states.async_set(
+                PRICE_ENTITY, "1.0", _price_attributes(local, self.rng)
+            )
+            hass.states.async_set(
+                CHEAPEST_HOUR_ENTITY, str(self.rng.choice((1, 2, 3, 4)))
+            )
+            for coordinator in self.coordinators:
+                hass.pending.append(
+                    coordinator.async_schedule_from_prices(
+                        PRICE_ENTITY, self.rng.choice((4, 6, 8)), arm=True
+                    )
+                )
+
+        for index, started in list(self.running.items()):
+            if now - started >= timedelta(hours=2):
+                del self.running[index]
+                hass.states.async_set(f"sensor.dw{index}_status", "Ready")
+                hass.states.async_set(f"binary_sensor.dw{index}_door", "on")
+                hass.states.async_set(f"binary_sensor.dw{index}_door", "off")
+
+        await hass.drain()
+        while due := [timer for timer in hass.timers if timer[0] <= now]:
+            for timer in due:
+                hass.timers.remove(timer)
+                hass.pending.append(timer[1](timer[0]))
+            await hass.drain()
+
+    async def run(self, days: int) -> list[float]:
+        start = dt_util.start_of_local_day(dt_util.now()) + timedelta(days=1)
+        clock = {"now": dt_util.as_utc(start)}
+        timings: list[float] = []
+
+        with patch.object(dt_util, "utcnow", lambda: clock["now"]), patch.object(
+            dt_util,
+            "now",
+            lambda time_zone=None: clock["now"].astimezone(
+                time_zone or dt_util.DEFAULT_TIME_ZONE
+            ),
+        ):
+            await self.setup()
+            for _ in range(days * 24 * 60):
+                clock["now"] += timedelta(minutes=1)
+                began = time_mod.perf_counter()
+                await self._minute(clock["now"])
+                timings.append((time_mod.perf_counter() - began) * 1000)
+        return timings
+
+
+def _report(sim: Simulation, timings: list[float], days: int) -> None:
+    ordered = sorted(timings)
+    minutes = len(timings)
+
+    def _pct(value: float) -> float:
+        return ordered[min(len(ordered) - 1, int(value * len(ordered)))]
+
+    print(f"entries:                  {sim.entries}")
+    print(f"simulated minutes:        {minutes} ({days} days)")
+    print(
+        f"loop time per minute ms:  mean {statistics.fmean(timings):.3f}  "
+        f"p50 {_pct(0.5):.3f}  p95 {_pct(0.95):.3f}  p99 {_pct(0.99):.3f}  "
+        f"max {ordered[-1]:.3f}"
+    )
+    print(f"total loop time s:        {sum(timings) / 1000:.3f}")
+    print(f"state writes per minute:  {sim.state_writes / minutes:.1f}")
+    print(f"recorder rows per day:    {sim.recorder_rows / days:.0f}")
+    print(f"state lookups per minute: {sim.hass.states.lookups / minutes:.1f}")
+    print(f"service calls:            {sim.hass.services.calls}")
+    print(f"timers armed:             {sim.hass.timers_armed}")
+    print(f"executor jobs:            {sim.hass.executor_jobs}")
+    print(f"config entry writes:      {sim.hass.config_entries.writes}")
+    print(f"events fired:             {dict(sim.hass.bus.fired)}")
+    coalesced = sum(coordinator.coalesced_requests for coordinator in sim.coordinators)
+    print(f"coalesced plan requests:  {coalesced}")
+    offloaded = sum(coordinator.offloaded_plans for coordinator in sim.coordinators)
+    superseded = sum(coordinator.superseded_plans for coordinator in sim.coordinators)
+    print(f"offloaded plans:          {offloaded} ({superseded} superseded)")
+    searches = sum(c.metrics.plan_computations for c in sim.coordinators)
+    search_time = sum(c.metrics.plan_latency.sum for c in sim.coordinators)
+    print(
+        f"plan searches:            {searches} "
+        f"(mean {search_time * 1000 / max(searches, 1):.3f} ms)"
+    )
+    results = defaultdict(int)
+    for coordinator in sim.coordinators:
+        results[coordinator.state.last_result] += 1
+    print(f"last results:             {dict(results)}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100)
+    parser.add_argument("--days", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--time-zone", default="Europe/Copenhagen")
+    parser.add_argument(
+        "--unbudgeted",
+        action="store_true",
+        help="write every entity on every coordinator update (the old behaviour)",
+    )
+    args = parser.parse_args(argv)
+
+    dt_util.set_default_time_zone(dt_util.get_time_zone(args.time_zone))
+    sim = Simulation(args.entries, args.seed, budgeted=not args.unbudgeted)
+    with patch.object(
+        dispatcher_mod, "async_track_point_in_utc_time", _fake_track_point_in_utc_time
+    ), patch.object(
+        price_history_mod, "async_call_later", _fake_call_later
+    ), patch.object(
+        coordinator_mod, "async_call_later", _fake_call_later
+    ), patch.object(
+        coordinator_mod,
+        "async_track_state_change_event",
+        _fake_track_state_change_event,
+    ):
+        timings = asyncio.run(sim.run(args.days))
+    _report(sim, timings, args.days)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
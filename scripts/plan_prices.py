@@ -0,0 +1,35 @@
+"""Batch-plan dishwasher starts over archived price files without Home Assistant.
+
+Each file holds the attributes of a price sensor (Nordpool, Tibber, ENTSO-e,
+Energi Data Service or any supported forecast format), or a full state dump
+from the REST API. One JSON result line is printed per file.
+
+    python scripts/plan_prices.py prices/*.json --duration 150 \
+        --window-start 22:00 --window-end 07:00 --tz Europe/Copenhagen --jobs 8
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+
+PACKAGE = "custom_components.dishwasher_scheduler"
+PACKAGE_DIR = Path(__file__).resolve().parents[1] / "custom_components" / "dishwasher_scheduler"
+
+# Register the integration as a bare package so its pure modules import
+# without running ``__init__`` (which needs Home Assistant). Done at module
+# level so spawned worker processes get the same setup.
+if PACKAGE not in sys.modules:
+    for name, path in (
+        ("custom_components", PACKAGE_DIR.parent),
+        (PACKAGE, PACKAGE_DIR),
+    ):
+        module = types.ModuleType(name)
+        module.__path__ = [str(path)]
+        sys.modules.setdefault(name, module)
+
+from custom_components.dishwasher_scheduler.cli import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())